@@ -0,0 +1,47 @@
+"""
+Compares `Morph.copy` with `copy.deepcopy` for a representative unit of each game.
+
+Usage: python benchmarks/bench_copy.py [--number N]
+"""
+
+import argparse
+import copy
+import timeit
+
+from aenir.morph import get_morph
+
+UNITS = (
+    (4, "Lakche", {"father": "Lex"}),
+    (5, "Leaf", {}),
+    (6, "Roy", {}),
+    (7, "Lyn", {"lyn_mode": True}),
+    (8, "Ross", {}),
+    (9, "Lethe", {}),
+)
+
+def time_copies(morph, number: int) -> tuple[float, float]:
+    """
+    Returns mean seconds per call of `copy.deepcopy(morph)` and `morph.copy()`.
+    """
+    deepcopy_time = timeit.timeit(lambda: copy.deepcopy(morph), number=number) / number
+    copy_time = timeit.timeit(morph.copy, number=number) / number
+    return deepcopy_time, copy_time
+
+def main(argv=None) -> None:
+    """
+    Prints one row of timings per game.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="copies per measurement")
+    args = parser.parse_args(argv)
+    print("%-5s %-8s %14s %14s %8s" % ("game", "unit", "deepcopy (us)", "copy (us)", "speedup"))
+    for game_no, name, kwargs in UNITS:
+        morph = get_morph(game_no, name, **kwargs)
+        deepcopy_time, copy_time = time_copies(morph, args.number)
+        print(
+            "%-5d %-8s %14.2f %14.2f %7.1fx"
+            % (game_no, name, deepcopy_time * 1e6, copy_time * 1e6, deepcopy_time / copy_time)
+        )
+
+if __name__ == "__main__":
+    main()
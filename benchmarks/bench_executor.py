@@ -0,0 +1,56 @@
+"""
+Compares `evaluate_plan` with `PlanExecutor.evaluate` on plans that share prefixes:
+each promotable FE6 unit is levelled to 20, promoted, then levelled some more.
+
+Usage: python benchmarks/bench_executor.py [--num-plans N]
+"""
+
+import argparse
+import time
+
+from aenir.executor import PlanExecutor
+from aenir.morph import (
+    get_morph_class,
+    get_roster,
+)
+from aenir.plans import evaluate_plan
+
+def get_plans(num_plans: int) -> list[dict]:
+    """
+    Returns up to `num_plans` plans, nineteen per unit.
+    """
+    plans = []
+    roster = get_roster(6, get_morph_class(6).CHARACTERS())
+    for morph in roster.morphs:
+        if morph.current_lv >= 20 or not morph.get_promotion_list():
+            continue
+        prefix = [{"op": "level_up", "num_levels": 20 - morph.current_lv}, "promote"]
+        for num_levels in range(1, 20):
+            operations = prefix + [{"op": "level_up", "num_levels": num_levels}]
+            plans.append({"game_no": 6, "unit": morph.name, "operations": operations})
+    return plans[:num_plans]
+
+def main(argv=None) -> None:
+    """
+    Prints seconds taken to evaluate the plans with and without memoization.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-plans", type=int, default=500, help="number of plans to evaluate")
+    args = parser.parse_args(argv)
+    plans = get_plans(args.num_plans)
+    start = time.perf_counter()
+    for plan in plans:
+        evaluate_plan(plan)
+    replay_time = time.perf_counter() - start
+    executor = PlanExecutor()
+    start = time.perf_counter()
+    for plan in plans:
+        executor.evaluate(plan)
+    memoized_time = time.perf_counter() - start
+    print("%d plans" % len(plans))
+    print("%-10s %10.4f s" % ("replayed", replay_time))
+    print("%-10s %10.4f s (%.1fx)" % ("memoized", memoized_time, replay_time / memoized_time))
+    print(executor.cache_info())
+
+if __name__ == "__main__":
+    main()
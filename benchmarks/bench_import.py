@@ -0,0 +1,73 @@
+"""
+Measures the cold-start cost of the package: each statement is timed in fresh interpreters, as `-X importtime` reports.
+
+Usage: python benchmarks/bench_import.py [--repeat N] [--budget-ms MS]
+
+Exits with status 1 if the median time of `import aenir` exceeds the budget, so that it may be tracked by CI.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# (label, statement); each is run on its own in a fresh interpreter.
+STATEMENTS = (
+    ("import aenir", "import aenir"),
+    ("aenir.__version__", "import aenir; aenir.__version__"),
+    ("import aenir.cli", "import aenir.cli"),
+    ("from aenir import get_morph", "from aenir import get_morph"),
+    ("get_morph(6, 'Roy')", "from aenir import get_morph; get_morph(6, 'Roy')"),
+)
+
+def time_statement(statement: str, env: dict) -> tuple:
+    """
+    Returns the cumulative import time of `aenir` (in ms) that `-X importtime` reports, and the wall time of the process.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    wall_time = (time.perf_counter() - start) * 1000
+    import_time = 0.0
+    for line in completed.stderr.splitlines():
+        # top-level imports of this package only (indented by one space); nested ones are counted by their importers.
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| aenir", line)
+        if match:
+            import_time += int(match.group(1)) / 1000
+    return import_time, wall_time
+
+def main(argv=None) -> None:
+    """
+    Prints the median import time and wall time of each statement.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="fresh interpreters per statement")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="budget for the import time of `import aenir`")
+    args = parser.parse_args(argv)
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (src, env.get("PYTHONPATH"))))
+    baseline = statistics.median(time_statement("pass", env)[1] for _ in range(args.repeat))
+    print("interpreter start-up: %.1f ms" % baseline)
+    print("%-30s %12s %12s" % ("statement", "import (ms)", "wall (ms)"))
+    medians = {}
+    for label, statement in STATEMENTS:
+        timings = [time_statement(statement, env) for _ in range(args.repeat)]
+        import_time = statistics.median(timing[0] for timing in timings)
+        wall_time = statistics.median(timing[1] for timing in timings)
+        medians[label] = import_time
+        print("%-30s %12.1f %12.1f" % (label, import_time, wall_time))
+    if medians["import aenir"] > args.budget_ms:
+        print("`import aenir` took %.1f ms; the budget is %.1f ms." % (medians["import aenir"], args.budget_ms))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Times `evaluate_plans` on a report that levels every unit to 20, promotes them every way possible,
+and levels them to 20 again, for every game; once per number of workers.
+
+Usage: python benchmarks/bench_parallel.py [--repeat N] [--max-workers N]
+"""
+
+import argparse
+import os
+import time
+
+from aenir.morph import (
+    get_morph_class,
+    get_roster,
+)
+from aenir.parallel import evaluate_plans
+
+def get_report_plans() -> list[dict]:
+    """
+    Returns the plans of the report; units that need initialization parameters are skipped.
+    """
+    plans = []
+    for game_no in range(4, 10):
+        roster = get_roster(game_no, get_morph_class(game_no).CHARACTERS())
+        for morph in roster.morphs:
+            level_up = [{"op": "level_up", "num_levels": 20 - morph.current_lv}] if morph.current_lv < 20 else []
+            for promo_cls in morph.get_promotion_list() or [None]:
+                operations = list(level_up)
+                if promo_cls is not None:
+                    operations += [{"op": "promote", "promo_cls": promo_cls}, {"op": "level_up", "num_levels": 19}]
+                plans.append({"game_no": game_no, "unit": morph.name, "operations": operations})
+    return plans
+
+def main(argv=None) -> None:
+    """
+    Prints the time taken for each number of workers, and the speedup over one worker.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="copies of the report to evaluate")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="largest pool to time")
+    args = parser.parse_args(argv)
+    plans = get_report_plans() * args.repeat
+    print("%d plans" % len(plans))
+    print("%-8s %10s %8s" % ("workers", "time (s)", "speedup"))
+    baseline = None
+    max_workers = 1
+    while True:
+        start = time.perf_counter()
+        evaluate_plans(plans, max_workers=max_workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print("%-8d %10.3f %7.2fx" % (max_workers, elapsed, baseline / elapsed))
+        if max_workers >= args.max_workers:
+            break
+        max_workers = min(max_workers * 2, args.max_workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Times `search_promotion_paths` for every unit of each game that needs no initialization parameters.
+
+Usage: python benchmarks/bench_promotions.py [--game N]
+"""
+
+import argparse
+import time
+
+from aenir.morph import (
+    get_morph_class,
+    get_roster,
+)
+from aenir.promotions import search_promotion_paths
+
+def main(argv=None) -> None:
+    """
+    Prints seconds taken per game, and the number of Pareto-optimal routes found.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--game", type=int, choices=range(4, 10), help="only time this game")
+    args = parser.parse_args(argv)
+    game_nos = [args.game] if args.game else range(4, 10)
+    print("%-5s %6s %7s %10s" % ("game", "units", "routes", "time (s)"))
+    for game_no in game_nos:
+        roster = get_roster(game_no, get_morph_class(game_no).CHARACTERS())
+        start = time.perf_counter()
+        num_paths = sum(len(search_promotion_paths(morph)) for morph in roster.morphs)
+        elapsed = time.perf_counter() - start
+        print("%-5d %6d %7d %10.3f" % (game_no, len(roster.morphs), num_paths, elapsed))
+
+if __name__ == "__main__":
+    main()
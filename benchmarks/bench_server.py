@@ -0,0 +1,98 @@
+"""
+Load-tests the HTTP server locally: concurrent clients each create a unit, level it up, promote it and compare it.
+
+Usage: python benchmarks/bench_server.py [--clients N] [--rounds N] [--workers N] [--port PORT]
+
+If `--port` is given, a server already listening there (e.g. `python -m aenir.server`) is tested instead.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from aenir.server import AenirServer
+
+async def request(reader, writer, method, path, body=None):
+    """
+    Sends one request over a kept-alive connection; returns status and payload.
+    """
+    data = b"" if body is None else json.dumps(body).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+    status_line = await reader.readline()
+    content_length = 0
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            content_length = int(value)
+    return int(status_line.split()[1]), json.loads(await reader.readexactly(content_length))
+
+async def client(host, port, rounds, statuses):
+    """
+    Performs `rounds` rounds of requests, counting the status of each response.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(rounds):
+            _, payload = await request(reader, writer, "POST", "/sessions", {"game_no": 6, "unit": "Roy"})
+            roy_id = payload.get("session_id")
+            _, payload = await request(reader, writer, "POST", "/sessions", {"game_no": 6, "unit": "Marcus"})
+            marcus_id = payload.get("session_id")
+            for method, path, body in (
+                ("POST", f"/sessions/{roy_id}/level_up", {"num_levels": 19}),
+                ("POST", f"/sessions/{roy_id}/promote", None),
+                ("POST", f"/sessions/{roy_id}/boost", {"item_name": "Energy Ring"}),
+                ("POST", "/compare", {"sessions": [roy_id, marcus_id]}),
+                ("GET", f"/sessions/{roy_id}", None),
+                ("DELETE", f"/sessions/{roy_id}", None),
+                ("DELETE", f"/sessions/{marcus_id}", None),
+            ):
+                status, _ = await request(reader, writer, method, path, body)
+                statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+async def run(args):
+    """
+    Runs the clients against a server (started here unless `--port` is given) and prints a report.
+    """
+    server = None
+    host, port = "127.0.0.1", args.port
+    if port is None:
+        server = AenirServer(max_workers=args.workers, max_pending=args.clients * 2)
+        host, port = await server.start(host, 0)
+    statuses = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, args.rounds, statuses) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    num_requests = args.clients * args.rounds * 9
+    print("%d requests from %d clients in %.2fs: %.0f requests/s" % (num_requests, args.clients, elapsed, num_requests / elapsed))
+    print("statuses (excluding creation): %s" % dict(sorted(statuses.items())))
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    await writer.wait_closed()
+    print("%-10s %8s %10s %10s %10s %10s" % ("endpoint", "count", "mean (ms)", "p50 (ms)", "p99 (ms)", "max (ms)"))
+    for endpoint, histogram in metrics["latency"].items():
+        print("%-10s %8d %10.2f %10.2f %10.2f %10.2f" % (
+            endpoint, histogram["count"], histogram["mean_ms"], histogram["p50_ms"], histogram["p99_ms"], histogram["max_ms"],
+        ))
+    if server is not None:
+        await server.close()
+
+def main(argv=None) -> None:
+    """
+    Parses arguments and runs the load test.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16, help="concurrent connections")
+    parser.add_argument("--rounds", type=int, default=20, help="rounds of requests per client")
+    parser.add_argument("--workers", type=int, default=4, help="threads of the server started here")
+    parser.add_argument("--port", type=int, default=None, help="port of a server that is already running")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Times `simulate` for a representative unit of each game, with a plan of two level-ups around a promotion.
+
+Usage: python benchmarks/bench_simulation.py [--trials N]
+"""
+
+import argparse
+import time
+
+from aenir.morph import get_morph
+from aenir.simulation import simulate
+
+# game, unit, kwargs, level at which to promote
+UNITS = (
+    (4, "Lex", {}, 20),
+    (5, "Lara", {}, 10),
+    (6, "Allen", {}, 10),
+    (7, "Lyn", {"lyn_mode": True}, 10),
+    (8, "Franz", {}, 10),
+    (9, "Ike", {}, 10),
+)
+
+def main(argv=None) -> None:
+    """
+    Prints one row of timings per game.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--trials", type=int, default=1000000, help="trials per unit")
+    args = parser.parse_args(argv)
+    print("%-5s %-8s %12s %12s" % ("game", "unit", "simulate (s)", "summary (s)"))
+    for game_no, name, kwargs, promotion_level in UNITS:
+        morph = get_morph(game_no, name, **kwargs)
+        plan = [
+            {"op": "level_up", "num_levels": promotion_level - morph.current_lv},
+            {"op": "promote", "promo_cls": morph.get_promotion_list()[0]},
+            {"op": "level_up", "num_levels": 5},
+        ]
+        start = time.perf_counter()
+        result = simulate(morph, plan, args.trials, seed=0)
+        middle = time.perf_counter()
+        result.percentile(50)
+        result.probability_capped()
+        end = time.perf_counter()
+        print("%-5d %-8s %12.3f %12.3f" % (game_no, name, middle - start, end - middle))
+
+if __name__ == "__main__":
+    main()
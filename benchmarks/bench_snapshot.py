@@ -0,0 +1,46 @@
+"""
+Compares snapshots with pickles of a session's worth of Morphs: size, and time to save and restore.
+
+Usage: python benchmarks/bench_snapshot.py [--number N]
+"""
+
+import argparse
+import pickle
+import timeit
+
+from aenir.morph import (
+    get_morph_class,
+    get_roster,
+)
+from aenir.snapshot import (
+    dumps,
+    loads,
+)
+
+def main(argv=None) -> None:
+    """
+    Prints total bytes, and mean microseconds per Morph, for each format.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=10, help="passes over the session per run")
+    args = parser.parse_args(argv)
+    morphs = []
+    for game_no in range(4, 10):
+        morphs.extend(get_roster(game_no, get_morph_class(game_no).CHARACTERS()).morphs)
+    formats = (
+        ("pickle", pickle.dumps, pickle.loads),
+        ("snapshot", dumps, loads),
+    )
+    print("%d Morphs" % len(morphs))
+    print("%-10s %10s %12s %12s" % ("format", "bytes", "save (us)", "restore (us)"))
+    for format_name, save, restore in formats:
+        saved = [save(morph) for morph in morphs]
+        num_bytes = sum(map(len, saved))
+        # best of several runs, as the least disturbed by other processes.
+        save_time = min(timeit.repeat(lambda: [save(morph) for morph in morphs], number=args.number, repeat=5))
+        restore_time = min(timeit.repeat(lambda: [restore(data) for data in saved], number=args.number, repeat=5))
+        per_morph = 1e6 / (args.number * len(morphs))
+        print("%-10s %10d %12.1f %12.1f" % (format_name, num_bytes, save_time * per_morph, restore_time * per_morph))
+
+if __name__ == "__main__":
+    main()
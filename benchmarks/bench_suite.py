@@ -0,0 +1,266 @@
+"""
+Times the hot paths of Morphs for every unit of every game, and compares the results with those of an earlier run.
+
+Usage: python benchmarks/bench_suite.py [--number N] [--repeat N] [--games 4 5 ...] [--ops OP ...]
+                                        [--save FILE] [--compare FILE] [--threshold FRACTION]
+
+Each operation is performed on every unit of a game to which it applies, `number` times per unit;
+the best of `repeat` runs is reported as mean microseconds per call. With `--save`, results are written as JSON;
+with `--compare`, operations slower than in the given results by more than `threshold` are flagged,
+and the exit status is 1 if any are.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    List,
+    Tuple,
+)
+
+from aenir.morph import (
+    Morph,
+    Morph5,
+    Morph9,
+    UnitSpec,
+    get_morph_class,
+)
+from aenir._exceptions import (
+    AenirError,
+    InitError,
+    LevelUpError,
+    PromotionError,
+)
+
+GAME_NOS = (4, 5, 6, 7, 8, 9)
+
+def resolve_spec(game_no: int, name: str) -> UnitSpec | None:
+    """
+    Returns a spec by which `name` may be created, choosing the first valid value of each parameter it requires.
+    """
+    morph_cls = get_morph_class(game_no)
+    kwargs: dict[str, Any] = {}
+    for _ in range(4):
+        try:
+            morph_cls(name, **kwargs)
+        except InitError as err:
+            missing = {param: values[0] for param, values in err.init_params.items() if param not in kwargs}
+            if not missing:
+                return None
+            kwargs.update(missing)
+        else:
+            return UnitSpec(name, tuple(sorted(kwargs.items())))
+    return None
+
+def create(game_no: int, spec: UnitSpec) -> Morph:
+    """
+    Returns a new Morph for `spec`.
+    """
+    return get_morph_class(game_no)(spec.name, **dict(spec.kwargs))
+
+def applies(morph: Morph, operation: Callable[[Morph], Any]) -> bool:
+    """
+    Returns whether `operation` succeeds on a copy of `morph`.
+    """
+    try:
+        operation(morph.copy())
+    except (AenirError, NotImplementedError, KeyError, TypeError):
+        return False
+    return True
+
+def level_up_to_max(morph: Morph) -> None:
+    """
+    Levels `morph` up until it can level up no further.
+    """
+    while True:
+        try:
+            morph.level_up(1)
+        except LevelUpError:
+            return
+
+def get_promotion(morph: Morph) -> Tuple[Morph, str | None] | None:
+    """
+    Returns a copy of `morph` levelled up as far as it must be to promote, and the class it may promote to
+    if it must be chosen; None if it cannot promote.
+    """
+    promotable = morph.copy()
+    promo_cls = None
+    for _ in range(3):
+        try:
+            promotable.copy().promote(promo_cls=promo_cls)
+        except PromotionError as err:
+            if err.reason == PromotionError.Reason.LEVEL_TOO_LOW:
+                level_up_to_max(promotable)
+            elif err.reason == PromotionError.Reason.INVALID_PROMOTION:
+                promo_cls = err.promotion_list[0]
+            else:
+                return None
+        except NotImplementedError:
+            return None
+        else:
+            return promotable, promo_cls
+    return None
+
+def use_any_stat_booster(morph: Morph) -> str:
+    """
+    Returns the first stat booster that `morph` may use.
+    """
+    for item_name in morph.stat_boosters or ():
+        if applies(morph, lambda probe: probe.use_stat_booster(item_name)):
+            return item_name
+    raise KeyError("No stat booster applies.")
+
+def stats_arithmetic(morph: Morph) -> None:
+    """
+    Performs the arithmetic that levelling up and comparing units consists of.
+    """
+    stats = morph.current_stats + morph.growth_rates
+    stats.imin(morph.max_stats)
+    stats > morph.current_stats
+    morph.growth_rates * 3
+
+def get_operations(game_no: int, spec: UnitSpec) -> dict[str, Tuple[Callable[[], Any], Callable[[Any], Any]] | None]:
+    """
+    Returns, for each operation, a function that prepares an argument and a function that performs it on that argument;
+    None for operations that do not apply to the unit of `spec`. Only the latter is timed.
+    """
+    operations: dict[str, Tuple[Callable[[], Any], Callable[[Any], Any]] | None] = dict.fromkeys(OPERATIONS)
+    morph = create(game_no, spec)
+    operations["get_morph"] = (lambda: None, lambda _: create(game_no, spec))
+    operations["copy"] = (lambda: morph, lambda probe: probe.copy())
+    operations["stats_arithmetic"] = (lambda: morph, stats_arithmetic)
+    if applies(morph, lambda probe: probe.level_up(1)):
+        operations["level_up"] = (morph.copy, lambda probe: probe.level_up(1))
+    promotion = get_promotion(morph)
+    if promotion is not None:
+        # levelled up beforehand if need be, so that only the promotion is timed.
+        promotable, promo_cls = promotion
+        operations["promote"] = (promotable.copy, lambda probe: probe.promote(promo_cls=promo_cls))
+    try:
+        item_name = use_any_stat_booster(morph)
+    except (KeyError, NotImplementedError, AttributeError):
+        pass
+    else:
+        operations["use_stat_booster"] = (morph.copy, lambda probe: probe.use_stat_booster(item_name))
+    if isinstance(morph, Morph5) and morph.scroll_dict:
+        scroll_name = next(iter(morph.scroll_dict))
+        if applies(morph, lambda probe: probe.equip_scroll(scroll_name)):
+            operations["equip"] = (morph.copy, lambda probe: probe.equip_scroll(scroll_name))
+    if isinstance(morph, Morph9) and morph.band_dict:
+        band_name = next(iter(morph.band_dict))
+        if applies(morph, lambda probe: probe.equip_band(band_name)):
+            operations["equip"] = (morph.copy, lambda probe: probe.equip_band(band_name))
+    if isinstance(morph, Morph9) and applies(morph, lambda probe: probe.transform()):
+        operations["transform"] = (morph.copy, lambda probe: probe.transform())
+        transformed = morph.copy()
+        transformed.transform()
+        operations["revert"] = (transformed.copy, lambda probe: probe.revert())
+    return operations
+
+OPERATIONS = (
+    "get_morph",
+    "copy",
+    "level_up",
+    "promote",
+    "use_stat_booster",
+    "equip",
+    "transform",
+    "revert",
+    "stats_arithmetic",
+)
+
+def time_game(game_no: int, ops: Tuple[str, ...], number: int, repeat: int) -> dict[str, dict[str, Any]]:
+    """
+    Returns, for each of `ops`, the best mean microseconds per call over every unit of `game_no` it applies to.
+    """
+    morph_cls = get_morph_class(game_no)
+    specs = [spec for spec in (resolve_spec(game_no, name) for name in morph_cls.CHARACTERS()) if spec is not None]
+    unit_operations = [get_operations(game_no, spec) for spec in specs]
+    results = {}
+    for op in ops:
+        applicable = [operations[op] for operations in unit_operations if operations[op] is not None]
+        if not applicable:
+            continue
+        best = float("inf")
+        for _ in range(repeat):
+            # arguments are prepared outside of the timed loop, e.g. a fresh copy for each call.
+            calls = [(perform, prepare()) for prepare, perform in applicable for _ in range(number)]
+            start = time.perf_counter()
+            for perform, argument in calls:
+                perform(argument)
+            best = min(best, time.perf_counter() - start)
+        results[f"{op}/FE{game_no}"] = {
+            "mean_us": best / len(calls) * 1e6,
+            "units": len(applicable),
+            "calls": len(calls),
+        }
+    return results
+
+def compare(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float) -> List[str]:
+    """
+    Returns the keys of `results` that are slower than in `baseline` by more than `threshold` (a fraction).
+    """
+    return [
+        key
+        for key, result in results.items()
+        if key in baseline and result["mean_us"] > baseline[key]["mean_us"] * (1 + threshold)
+    ]
+
+def main(argv=None) -> None:
+    """
+    Prints one row per operation and game, and saves or compares results as asked.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20, help="calls per unit per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, of which the best is reported")
+    parser.add_argument("--games", type=int, nargs="+", default=GAME_NOS, choices=GAME_NOS, help="games to time")
+    parser.add_argument("--ops", nargs="+", default=OPERATIONS, choices=OPERATIONS, help="operations to time")
+    parser.add_argument("--save", help="file to which results are written as JSON")
+    parser.add_argument("--compare", help="file of results (from --save) to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown (a fraction) that is flagged")
+    args = parser.parse_args(argv)
+    results = {}
+    for game_no in args.games:
+        results.update(time_game(game_no, tuple(args.ops), args.number, args.repeat))
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as stream:
+            baseline = json.load(stream)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    print("%-24s %6s %8s %12s %12s %9s" % ("operation", "units", "calls", "mean (us)", "baseline", "change"))
+    for key in sorted(results, key=lambda key: (OPERATIONS.index(key.split("/")[0]), key)):
+        result = results[key]
+        row = "%-24s %6d %8d %12.2f" % (key, result["units"], result["calls"], result["mean_us"])
+        if key in baseline:
+            change = result["mean_us"] / baseline[key]["mean_us"] - 1
+            row += " %12.2f %+8.0f%%" % (baseline[key]["mean_us"], change * 100)
+            if key in regressions:
+                row += "  REGRESSION"
+        print(row)
+    if args.save:
+        with open(args.save, "w") as stream:
+            json.dump(
+                {
+                    "meta": {
+                        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "number": args.number,
+                        "repeat": args.repeat,
+                    },
+                    "results": results,
+                },
+                stream,
+                indent=2,
+                sort_keys=True,
+            )
+    if regressions:
+        print("%d operation(s) slower than the baseline by more than %.0f%%." % (len(regressions), args.threshold * 100))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,100 @@
 """
 A project for calculating Fire Emblem stats.
+
+Public names are imported upon first access (PEP 562), so that `import aenir` is cheap:
+`aenir.morph` and its data are only read once `get_morph` or `get_roster` is used,
+and the version is only looked up once `__version__` is.
 """
 
-import sys
-
-if sys.version_info[:2] >= (3, 8):
-    # TODO: Import directly (no need for conditional) when `python_requires = >= 3.8`
-    from importlib.metadata import PackageNotFoundError, version  # pragma: no cover
-else:
-    from importlib_metadata import PackageNotFoundError, version  # pragma: no cover
-
-try:
-    # Change here if project is renamed and does not equal the package name
-    dist_name = __name__
-    __version__ = version(dist_name)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
-finally:
-    del version, PackageNotFoundError
-
-from aenir.morph import get_morph
-from aenir._exceptions import (
-    AenirError,
-    UnitNotFoundError,
-    InitError,
-    LevelUpError,
-    PromotionError,
-    StatBoosterError,
-    ScrollError,
-    GrowthsItemError,
-    BandError,
-    TransformationError,
-    DemiBandError,
-    KnightWardError,
-)
+# as `typing.TYPE_CHECKING`, which type checkers recognize by name; importing `typing` is not free.
+# deleted once used, so that the namespace of the package holds only its public names.
+TYPE_CHECKING = False
+
+# public name -> module in which it is declared.
+_LAZY_ATTRIBUTES = {
+    "get_morph": "aenir.morph",
+    "get_roster": "aenir.morph",
+    **dict.fromkeys(
+        (
+            "AenirError",
+            "UnitNotFoundError",
+            "InitError",
+            "LevelUpError",
+            "PromotionError",
+            "StatBoosterError",
+            "ScrollError",
+            "GrowthsItemError",
+            "BandError",
+            "TransformationError",
+            "DemiBandError",
+            "KnightWardError",
+            "PlanError",
+            "SnapshotError",
+            "ArtifactError",
+        ),
+        "aenir._exceptions",
+    ),
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aenir.morph import (
+        get_morph,
+        get_roster,
+    )
+    from aenir._exceptions import (
+        AenirError,
+        UnitNotFoundError,
+        InitError,
+        LevelUpError,
+        PromotionError,
+        StatBoosterError,
+        ScrollError,
+        GrowthsItemError,
+        BandError,
+        TransformationError,
+        DemiBandError,
+        KnightWardError,
+        PlanError,
+        SnapshotError,
+        ArtifactError,
+    )
+
+    __version__: str
+
+del TYPE_CHECKING
+
+def _get_version() -> str:
+    """
+    Returns the version of the installed distribution, or "unknown" if it is not installed.
+    """
+    # reading the metadata of installed distributions is by far the slowest part of importing this package.
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        # Change here if project is renamed and does not equal the package name
+        return version(__name__)
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
+
+def __getattr__(name: str):
+    """
+    Imports `name` upon first access, and keeps it as an attribute so that this is not called again for it.
+    """
+    if name == "__version__":
+        value = _get_version()
+    elif name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """
+    Lists public names alongside those already set.
+    """
+    return sorted(set(globals()) | set(__all__))
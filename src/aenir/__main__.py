@@ -0,0 +1,8 @@
+"""
+Allows the `aenir` console script to be run as `python -m aenir`.
+"""
+
+from aenir.cli import run
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,62 @@
+"""
+Declares the checks made on arguments that come from outside the package (plans, rosters), before a Morph is called with them.
+"""
+
+import collections.abc
+import inspect
+import types
+import typing
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+)
+
+# (Morph subclass, method name or "__init__") -> signature of the method; inspecting a signature is slow.
+_SIGNATURES: dict[Tuple[type, str], inspect.Signature] = {}
+
+def get_signature(owner: type, name: str, function: Callable) -> inspect.Signature:
+    """
+    Returns the signature of `function`, the method `name` of `owner` (or `owner` itself, if `name` is "__init__").
+    """
+    signature_key = (owner, name)
+    signature = _SIGNATURES.get(signature_key)
+    if signature is None:
+        signature = _SIGNATURES[signature_key] = inspect.signature(function)
+    return signature
+
+def is_of_type(value: Any, annotation: Any) -> bool:
+    """
+    Returns whether `value` is of the type `annotation` declares: a class, a union, or an iterable of a type.
+    Unannotated parameters accept anything; booleans are not integers, and strings are not iterables of strings.
+    """
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return True
+    if annotation is None:
+        return value is None
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return any(is_of_type(value, arg) for arg in typing.get_args(annotation))
+    if origin is collections.abc.Iterable:
+        (item_annotation,) = typing.get_args(annotation)
+        return (
+            isinstance(value, (tuple, list, set, frozenset))
+            and all(is_of_type(item, item_annotation) for item in value)
+        )
+    if not isinstance(annotation, type):
+        return True
+    if annotation is int and isinstance(value, bool):
+        return False
+    return isinstance(value, annotation)
+
+def check_arguments(signature: inspect.Signature, *args, **kwargs) -> None:
+    """
+    Throws TypeError unless `args` and `kwargs` bind to `signature`, each of the type it declares.
+    """
+    bound_arguments = signature.bind(*args, **kwargs)
+    for name, value in bound_arguments.arguments.items():
+        annotation = signature.parameters[name].annotation
+        if not is_of_type(value, annotation):
+            raise TypeError(
+                f"'{name}' must be {inspect.formatannotation(annotation)}, not {type(value).__name__}"
+            )
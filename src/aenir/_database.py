@@ -0,0 +1,365 @@
+"""
+Declares objects that manage access to the static databases.
+"""
+
+import enum
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import urllib.parse
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+)
+
+from aenir import instrumentation
+from aenir._exceptions import ArtifactError
+from aenir._logging import logger
+
+
+class ConnectionPool:
+    """
+    Hands out long-lived, read-only connections to static databases; one per database per thread.
+    """
+    # each connection serves one game, whose queries take fewer than a hundred distinct shapes.
+    CACHED_STATEMENTS = 256
+
+    def __init__(self) -> None:
+        """
+        Declares registry of open connections, and the process in which they were opened.
+        """
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._generation = 0
+        self._pid = os.getpid()
+
+    @staticmethod
+    def get_uri(path_to_db: str) -> str:
+        """
+        Returns a URI that opens `path_to_db` in read-only, immutable mode.
+        """
+        path = urllib.parse.quote(os.path.abspath(path_to_db))
+        return "file:%s?mode=ro&immutable=1" % path
+
+    def _get_local_connections(self) -> Dict[str, sqlite3.Connection]:
+        """
+        Returns the connections owned by the current thread, discarding those that predate a reset.
+        """
+        if self._pid != os.getpid():
+            # connections must not be carried over to a forked process.
+            self.reset()
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.generation = self._generation
+            local.connections = {}
+        return local.connections
+
+    def get_connection(self, path_to_db: str) -> sqlite3.Connection:
+        """
+        Returns the current thread's connection to `path_to_db`, opening one if necessary.
+        """
+        connections = self._get_local_connections()
+        key = os.path.abspath(path_to_db)
+        try:
+            return connections[key]
+        except KeyError:
+            pass
+        cnxn = sqlite3.connect(
+            self.get_uri(key),
+            uri=True,
+            cached_statements=self.CACHED_STATEMENTS,
+            # connections are never shared for queries; this only permits `close` from any thread.
+            check_same_thread=False,
+        )
+        cnxn.row_factory = sqlite3.Row
+        with self._lock:
+            self._connections.append(cnxn)
+        connections[key] = cnxn
+        if instrumentation.enabled:
+            instrumentation.count("connections")
+        logger.debug("Opened connection to '%s'.", key)
+        return cnxn
+
+    @property
+    def num_connections(self) -> int:
+        """
+        The number of connections opened since the pool was last closed or reset.
+        """
+        return len(self._connections)
+
+    def close(self) -> None:
+        """
+        Closes every connection in the pool; subsequent requests open new ones.
+        """
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+            self._generation += 1
+        for cnxn in connections:
+            cnxn.close()
+
+    def reset(self) -> None:
+        """
+        Forgets every connection in the pool without closing it; for use in freshly forked processes.
+        """
+        with self._lock:
+            self._connections = []
+            self._generation += 1
+            self._pid = os.getpid()
+
+connection_pool = ConnectionPool()
+
+class DataBackend(enum.Enum):
+    """
+    Declares the means by which static data may be read.
+    """
+    SQLITE = enum.auto()
+    PRELOADED = enum.auto()
+    ARTIFACT = enum.auto()
+
+class ResultSet:
+    """
+    Imitates the parts of the `sqlite3.Cursor` interface used to read query results.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Stores the records to be fetched.
+        """
+        self._records = iter(records)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Returns iterator over records not yet fetched.
+        """
+        return self._records
+
+    def fetchone(self) -> Dict[str, Any] | None:
+        """
+        Returns the next record, or None if all have been fetched.
+        """
+        return next(self._records, None)
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        """
+        Returns the records not yet fetched.
+        """
+        return list(self._records)
+
+class PreloadedDatabase:
+    """
+    Holds every table of a static database in memory, indexed by whichever columns it is filtered on.
+    """
+
+    def __init__(self, path_to_db: str) -> None:
+        """
+        Reads every table in the db referenced by `path_to_db`.
+        """
+        self.tables: Dict[str, Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]] = {}
+        self._indexes: Dict[Tuple[str, Tuple[str, ...]], Dict[Tuple[Any, ...], List[Tuple[Any, ...]]]] = {}
+        cnxn = sqlite3.connect(ConnectionPool.get_uri(path_to_db), uri=True)
+        if instrumentation.enabled:
+            instrumentation.count("connections")
+        try:
+            table_names = [
+                name for (name,) in cnxn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
+            ]
+            for table in table_names:
+                cursor = cnxn.execute("SELECT * FROM \"%s\" ORDER BY rowid;" % table)
+                columns = tuple(description[0] for description in cursor.description)
+                self.tables[table] = (columns, cursor.fetchall())
+        finally:
+            cnxn.close()
+        logger.debug("Preloaded %d tables from '%s'.", len(self.tables), path_to_db)
+
+    def _get_index(self, table: str, columns: Tuple[str, ...], keys: Tuple[str, ...]) -> Dict[Tuple[Any, ...], List[Tuple[Any, ...]]]:
+        """
+        Returns rows of `table` grouped by their values for `keys`, building the index if necessary.
+        """
+        try:
+            return self._indexes[(table, keys)]
+        except KeyError:
+            pass
+        positions = [self._get_position(table, columns, key) for key in keys]
+        index: Dict[Tuple[Any, ...], List[Tuple[Any, ...]]] = {}
+        for row in self.tables[table][1]:
+            index.setdefault(tuple(row[position] for position in positions), []).append(row)
+        self._indexes[(table, keys)] = index
+        return index
+
+    @staticmethod
+    def _get_position(table: str, columns: Tuple[str, ...], field: str) -> int:
+        """
+        Returns position of `field` in `columns`; mimics SQLite if there is no such column.
+        """
+        try:
+            return columns.index(field)
+        except ValueError:
+            raise sqlite3.OperationalError("no such column: %s" % field) from None
+
+    def select(self, table: str, fields: Iterable[str], filters: Mapping[str, Any] | None) -> ResultSet:
+        """
+        Returns `fields` of the records in `table` for which `filters` hold.
+        """
+        fields = tuple(fields)
+        try:
+            columns, rows = self.tables[table]
+        except KeyError:
+            raise sqlite3.OperationalError("no such table: %s" % table) from None
+        positions = [self._get_position(table, columns, field) for field in fields]
+        if filters:
+            keys = tuple(filters.keys())
+            index = self._get_index(table, columns, keys)
+            rows = index.get(tuple(filters[key] for key in keys), [])
+        return ResultSet(
+            {field: row[position] for field, position in zip(fields, positions)} for row in rows
+        )
+
+preloaded_databases: Dict[str, PreloadedDatabase] = {}
+
+def get_preloaded_database(path_to_db: str) -> PreloadedDatabase:
+    """
+    Returns the in-memory copy of the db referenced by `path_to_db`, loading it on first use.
+    """
+    key = os.path.abspath(path_to_db)
+    try:
+        return preloaded_databases[key]
+    except KeyError:
+        pass
+    database = PreloadedDatabase(key)
+    return preloaded_databases.setdefault(key, database)
+
+# version of the layout of consolidated data artifacts; see `DataArtifact`.
+ARTIFACT_FORMAT = 1
+
+def get_artifact_checksum(cnxn: sqlite3.Connection, columns: Mapping[Tuple[int, str], Tuple[str, ...]]) -> str:
+    """
+    Returns a digest of the rows of every (game, table) in `columns` that `cnxn` holds, in the order they were inserted;
+    independent of how the artifact is laid out on disk.
+    """
+    digest = hashlib.sha256()
+    for (game_no, table), table_columns in sorted(columns.items()):
+        digest.update(json.dumps([game_no, table, table_columns]).encode())
+        query = 'SELECT %s FROM "%s" WHERE Game=? ORDER BY rowid;' % (
+            ", ".join('"%s"' % column for column in table_columns),
+            table,
+        )
+        for row in cnxn.execute(query, (game_no,)):
+            digest.update(b"\n")
+            digest.update(json.dumps(row).encode())
+    return digest.hexdigest()
+
+class DataArtifact:
+    """
+    Holds one connection to a consolidated data artifact: the static data of every game in a single file.
+    Each table holds the records of every game that has it, told apart by a `Game` column;
+    `artifact_columns` lists the columns each game's table has, and `artifact_header` the format of the artifact,
+    its version, and a checksum of its contents.
+    """
+
+    def __init__(self, path: str, *, verify: bool = True) -> None:
+        """
+        Opens the artifact at `path`, and reads its header; unless told otherwise, verifies its checksum.
+        """
+        self.path = os.path.abspath(path)
+        self._lock = threading.Lock()
+        if not os.path.isfile(self.path):
+            raise ArtifactError("No such artifact: '%s'." % path, ArtifactError.Reason.NOT_AN_ARTIFACT, path=path)
+        # one connection serves every thread, one query at a time.
+        cnxn = sqlite3.connect(ConnectionPool.get_uri(self.path), uri=True, check_same_thread=False)
+        try:
+            try:
+                header = dict(cnxn.execute("SELECT key, value FROM artifact_header;"))
+                self.columns: Dict[Tuple[int, str], Tuple[str, ...]] = {
+                    (game_no, table): tuple(json.loads(columns))
+                    for game_no, table, columns in cnxn.execute("SELECT Game, \"Table\", Columns FROM artifact_columns ORDER BY rowid;")
+                }
+                if header.get("format") != str(ARTIFACT_FORMAT):
+                    raise ArtifactError(
+                        "'%s' has format %s; only format %d is supported." % (path, header.get("format"), ARTIFACT_FORMAT),
+                        ArtifactError.Reason.UNSUPPORTED_FORMAT,
+                        path=path,
+                    )
+                self.version: str = header["version"]
+                self.checksum: str = header["checksum"]
+                self.game_nos: Tuple[int, ...] = tuple(sorted({game_no for game_no, _ in self.columns}))
+                if verify and get_artifact_checksum(cnxn, self.columns) != self.checksum:
+                    raise ArtifactError(
+                        "The contents of '%s' do not match its checksum." % path,
+                        ArtifactError.Reason.CHECKSUM_MISMATCH,
+                        path=path,
+                    )
+            # DatabaseError: not SQLite, or truncated; the others: a header or columns that are not those of an artifact.
+            except (sqlite3.DatabaseError, KeyError, ValueError, TypeError):
+                raise ArtifactError("'%s' is not a data artifact." % path, ArtifactError.Reason.NOT_AN_ARTIFACT, path=path) from None
+        except BaseException:
+            cnxn.close()
+            raise
+        self._cnxn = cnxn
+        logger.debug("Opened artifact '%s' (version %s) of %d games.", path, self.version, len(self.game_nos))
+
+    def get_columns(self, game_no: int, table: str) -> Tuple[str, ...] | None:
+        """
+        Returns the columns of `table` for `game_no`, or None if the game has no such table.
+        """
+        return self.columns.get((game_no, table))
+
+    def select(self, game_no: int, table: str, fields: Iterable[str], filters: Mapping[str, Any] | None) -> ResultSet:
+        """
+        Returns `fields` of the records of `game_no` in `table` for which `filters` hold, in the order they were inserted.
+        """
+        fields = tuple(fields)
+        columns = self.get_columns(game_no, table)
+        if columns is None:
+            raise sqlite3.OperationalError("no such table: %s" % table)
+        filters = filters or {}
+        for field in fields + tuple(filters):
+            if field not in columns:
+                raise sqlite3.OperationalError("no such column: %s" % field)
+        conditions = " AND ".join(["Game=?"] + ['"%s"=?' % field for field in filters])
+        query = 'SELECT %s FROM "%s" WHERE %s ORDER BY rowid;' % (
+            ", ".join('"%s"' % field for field in fields),
+            table,
+            conditions,
+        )
+        with self._lock:
+            rows = self._cnxn.execute(query, (game_no, *filters.values())).fetchall()
+        return ResultSet(dict(zip(fields, row)) for row in rows)
+
+    def close(self) -> None:
+        """
+        Closes the connection to the artifact.
+        """
+        with self._lock:
+            self._cnxn.close()
+
+_artifact: DataArtifact | None = None
+
+def get_artifact() -> DataArtifact:
+    """
+    Returns the artifact from which static data is read by the artifact data backend.
+    """
+    artifact = _artifact
+    if artifact is None:
+        raise RuntimeError("No data artifact has been loaded; see `BaseMorph.use_artifact`.")
+    return artifact
+
+def swap_artifact(path: str) -> DataArtifact:
+    """
+    Opens and verifies the artifact at `path`, then serves static data from it in place of any other.
+    The swap is a single assignment: queries in progress finish against the artifact they began with,
+    which is closed once nothing refers to it.
+    """
+    global _artifact
+    artifact = DataArtifact(path)
+    _artifact = artifact
+    logger.info("Serving static data from '%s' (version %s).", path, artifact.version)
+    return artifact
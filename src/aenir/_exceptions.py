@@ -247,3 +247,68 @@ class KnightWardError(AenirError):
         self.knights = knights
         self.valid_bands = valid_bands
 
+
+class PlanError(AenirError):
+    """
+    To be raised if an operation in a plan cannot be interpreted.
+    """
+
+    class Reason(enum.Enum):
+        """
+        Declares all reasons why an operation could not be interpreted.
+        """
+        UNKNOWN_OPERATION = enum.auto()
+        INVALID_ARGUMENTS = enum.auto()
+        MALFORMED = enum.auto()
+
+    def __init__(self, msg: str, reason: Reason, *, operation: Any = None, valid_operations: Iterable[str] | None = None):
+        """
+        Declares the offending `operation` and the list of `valid_operations`.
+        """
+        super().__init__(msg)
+        self.reason = reason
+        self.operation = operation
+        self.valid_operations = valid_operations
+
+class SnapshotError(AenirError):
+    """
+    To be raised if a Morph cannot be saved to, or restored from, a snapshot.
+    """
+
+    class Reason(enum.Enum):
+        """
+        Declares all reasons why a snapshot could not be made or read.
+        """
+        NOT_A_SNAPSHOT = enum.auto()
+        UNSUPPORTED_VERSION = enum.auto()
+        UNSUPPORTED_VALUE = enum.auto()
+        CORRUPT = enum.auto()
+
+    def __init__(self, msg: str, reason: Reason, *, version: int | None = None):
+        """
+        Declares the `version` of the offending snapshot, if known.
+        """
+        super().__init__(msg)
+        self.reason = reason
+        self.version = version
+
+class ArtifactError(AenirError):
+    """
+    To be raised if a consolidated data artifact cannot be read.
+    """
+
+    class Reason(enum.Enum):
+        """
+        Declares all reasons why an artifact could not be read.
+        """
+        NOT_AN_ARTIFACT = enum.auto()
+        UNSUPPORTED_FORMAT = enum.auto()
+        CHECKSUM_MISMATCH = enum.auto()
+
+    def __init__(self, msg: str, reason: Reason, *, path: str | None = None):
+        """
+        Declares the `path` of the offending artifact, if known.
+        """
+        super().__init__(msg)
+        self.reason = reason
+        self.path = path
@@ -1,17 +1,25 @@
 """
 Declares loggers and logging configurations.
+
+`configure_logging` writes every record to `.aenir.log` in the thread that logs it; for development and testing.
+`configure_production_logging` hands records to a bounded queue instead, and writes them in a thread of its own.
 """
 
 import logging
-import logging.config
 
 logger = logging.getLogger("aenir")
 time_logger = logging.getLogger("timer")
 
+# the listener of the production profile, while it is configured.
+_listener = None
+
 def configure_logging() -> None:
     """
     Instructs interpreter to log in accordance with configuration below.
     """
+    # imported here, as importing it takes longer than all else this module needs.
+    import logging.config
+
     main_logging_file = ".aenir.log"
     html_logging_file = ".html_aenir.log"
     main_datefmt = "%B %d, %Y @ %I:%M:%S %p"
@@ -63,3 +71,65 @@ def configure_logging() -> None:
             },
         }
     )
+
+def configure_production_logging(
+        level: int | str = logging.WARNING,
+        *,
+        filename: str = ".aenir.log",
+        maxsize: int = 10000,
+        drop: str = "newest",
+    ):
+    """
+    Instructs interpreter to log records of `level` and above without blocking the threads that log them.
+    Records are put in a queue of `maxsize`, dropped as `drop` ("newest" or "oldest") says once it is full,
+    and written to `filename` by a thread of their own. Records below `level` are discarded before their
+    message is formatted. Replaces any handlers of the `aenir` logger; returns the handler that queues records,
+    whose `dropped` attribute counts the records dropped.
+    """
+    # imported here, as importing `logging.handlers` takes longer than all else this module needs.
+    import atexit
+    import queue
+
+    from aenir._queue_logging import (
+        BoundedQueueHandler,
+        BoundedQueueListener,
+    )
+
+    global _listener
+    stop_production_logging()
+    # registered once, however many times the profile is configured.
+    atexit.unregister(stop_production_logging)
+    atexit.register(stop_production_logging)
+    handler = BoundedQueueHandler(queue.Queue(maxsize), drop)
+    file_handler = logging.FileHandler(filename, delay=True)
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s:%(name)s.%(module)s.%(funcName)s: %(message)s")
+    )
+    for old_handler in list(logger.handlers):
+        logger.removeHandler(old_handler)
+        old_handler.close()
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    # records must not reach handlers of the root logger, which would write them in the thread that logs them.
+    logger.propagate = False
+    _listener = BoundedQueueListener(handler.queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    return handler
+
+def stop_production_logging() -> None:
+    """
+    Writes the records still queued, then stops the thread that writes them and detaches the production profile.
+    Does nothing unless it is configured.
+    """
+    global _listener
+    listener = _listener
+    if listener is None:
+        return
+    _listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    for handler in list(logger.handlers):
+        if getattr(handler, "queue", None) is listener.queue:
+            logger.removeHandler(handler)
+    logger.propagate = True
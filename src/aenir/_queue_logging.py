@@ -0,0 +1,60 @@
+"""
+Declares the handler and listener of the production logging profile; see `aenir._logging.configure_production_logging`.
+
+Imported only by that function, since `logging.handlers` takes longer to import than the rest of the package.
+"""
+
+import logging
+import logging.handlers
+import queue
+
+# what to do with a record once the queue is full.
+DROP_POLICIES = ("newest", "oldest")
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to a bounded queue without ever blocking; once it is full, records are dropped as `drop` says:
+    "newest" drops the record being logged, "oldest" makes room for it by dropping the record logged first.
+    """
+
+    def __init__(self, record_queue: queue.Queue, drop: str = "newest") -> None:
+        """
+        Declares the queue, the drop policy, and a count of the records dropped.
+        """
+        if drop not in DROP_POLICIES:
+            raise ValueError("Invalid drop policy: %r. Valid policies: %s" % (drop, DROP_POLICIES))
+        super().__init__(record_queue)
+        self.drop = drop
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Puts `record` in the queue if there is room, applying the drop policy if there is not.
+        Called with the lock of this handler held, so the count of records dropped is exact.
+        """
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        self.dropped += 1
+        if self.drop == "oldest":
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+
+class BoundedQueueListener(logging.handlers.QueueListener):
+    """
+    Writes records from a bounded queue to its handlers, in a thread of its own.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """
+        Waits for room in the queue for the sentinel that stops the thread, rather than failing if it is full.
+        """
+        self.queue.put(self._sentinel)
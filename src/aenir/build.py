@@ -0,0 +1,280 @@
+"""
+Compiles the static data of a game from CSV files into `cleaned_stats.db`, and dumps it back to them.
+
+Each CSV file in a directory becomes a table named after the file, its rows inserted in the order they are listed.
+Columns are typed: INTEGER if every value is an integer, TEXT otherwise; empty values are NULL.
+Columns by which units and classes are looked up (`INDEXED_COLUMNS`) are indexed.
+Every table is written in one transaction to a temporary file, which is analyzed, vacuumed,
+then moved into place; so a reader never sees a partial build, and the same CSV files always build the same bytes.
+
+The databases of every game may also be consolidated into one artifact (see `aenir._database.DataArtifact`),
+built the same way, and headed by a version and a checksum of its contents.
+
+Usage: python -m aenir.build dump DATABASE DIRECTORY
+       python -m aenir.build build DIRECTORY DATABASE
+       python -m aenir.build artifact PATH [--version VERSION]
+where DATABASE is a path, or the number of a game for the database packaged for that game.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sqlite3
+import sys
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from aenir._database import (
+    ARTIFACT_FORMAT,
+    ConnectionPool,
+    get_artifact_checksum,
+)
+from aenir._logging import logger
+
+# columns on which runtime lookups filter, wherever they appear.
+INDEXED_COLUMNS = ("Name", "Class", "Father", "Alias")
+
+# games whose databases are consolidated into an artifact by default.
+GAME_NOS = (4, 5, 6, 7, 8, 9)
+
+_INTEGER = re.compile(r"-?[0-9]+")
+
+def get_column_type(values: Iterable[str]) -> str:
+    """
+    Returns INTEGER if every value of a column (bar empty ones) is an integer, and there is one; TEXT otherwise.
+    """
+    has_values = False
+    for value in values:
+        if value == "":
+            continue
+        if _INTEGER.fullmatch(value) is None:
+            return "TEXT"
+        has_values = True
+    return "INTEGER" if has_values else "TEXT"
+
+def read_csv(path_to_csv: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """
+    Returns the columns of a CSV file, their types, and its rows converted to them.
+    Raises ValueError if a row has more or fewer values than there are columns.
+    """
+    with open(path_to_csv, newline="") as stream:
+        reader = csv.reader(stream)
+        columns = tuple(next(reader))
+        raw_rows = list(reader)
+    for line_no, row in enumerate(raw_rows, start=2):
+        if len(row) != len(columns):
+            raise ValueError("Line %d of '%s' has %d values; expected %d." % (line_no, path_to_csv, len(row), len(columns)))
+    types = tuple(get_column_type(row[index] for row in raw_rows) for index in range(len(columns)))
+    converters = [(int if column_type == "INTEGER" else str) for column_type in types]
+    rows = [
+        tuple((None if value == "" else converter(value)) for converter, value in zip(converters, row))
+        for row in raw_rows
+    ]
+    return columns, types, rows
+
+def build_database(source_dir: str, path_to_db: str) -> dict[str, int]:
+    """
+    Builds the db referenced by `path_to_db` from every CSV file in `source_dir`, replacing it atomically;
+    returns the number of rows written to each table.
+    """
+    filenames = sorted(filename for filename in os.listdir(source_dir) if filename.endswith(".csv"))
+    if not filenames:
+        raise FileNotFoundError("No CSV files in '%s'." % source_dir)
+    path_to_tmp = path_to_db + ".tmp"
+    if os.path.exists(path_to_tmp):
+        os.remove(path_to_tmp)
+    num_rows = {}
+    # autocommit mode, so that the transaction is delimited here rather than by the driver.
+    cnxn = sqlite3.connect(path_to_tmp, isolation_level=None)
+    try:
+        cnxn.execute("BEGIN;")
+        for filename in filenames:
+            table = filename[:-len(".csv")]
+            columns, types, rows = read_csv(os.path.join(source_dir, filename))
+            definitions = ", ".join('"%s" %s' % column_type for column_type in zip(columns, types))
+            cnxn.execute('CREATE TABLE "%s" (%s);' % (table, definitions))
+            placeholders = ", ".join("?" for _ in columns)
+            cnxn.executemany('INSERT INTO "%s" VALUES (%s);' % (table, placeholders), rows)
+            for column in columns:
+                if column in INDEXED_COLUMNS:
+                    cnxn.execute('CREATE INDEX "%s__%s" ON "%s" ("%s");' % (table, column, table, column))
+            num_rows[table] = len(rows)
+        cnxn.execute("COMMIT;")
+        cnxn.execute("ANALYZE;")
+        cnxn.execute("VACUUM;")
+    except BaseException:
+        cnxn.close()
+        os.remove(path_to_tmp)
+        raise
+    cnxn.close()
+    os.replace(path_to_tmp, path_to_db)
+    logger.debug("Built %d tables from '%s' into '%s'.", len(num_rows), source_dir, path_to_db)
+    return num_rows
+
+def dump_database(path_to_db: str, directory: str) -> dict[str, int]:
+    """
+    Writes every table of the db referenced by `path_to_db` to a CSV file in `directory`;
+    returns the number of rows written for each table.
+    """
+    os.makedirs(directory, exist_ok=True)
+    num_rows = {}
+    cnxn = sqlite3.connect(ConnectionPool.get_uri(path_to_db), uri=True)
+    try:
+        tables = [
+            name for (name,) in cnxn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name;"
+            )
+        ]
+        for table in tables:
+            cursor = cnxn.execute('SELECT * FROM "%s" ORDER BY rowid;' % table)
+            with open(os.path.join(directory, table + ".csv"), "w", newline="") as stream:
+                writer = csv.writer(stream, lineterminator="\n")
+                writer.writerow(description[0] for description in cursor.description)
+                count = 0
+                for row in cursor:
+                    writer.writerow(("" if value is None else value) for value in row)
+                    count += 1
+            num_rows[table] = count
+    finally:
+        cnxn.close()
+    logger.debug("Dumped %d tables from '%s' into '%s'.", len(num_rows), path_to_db, directory)
+    return num_rows
+
+def _read_database(path_to_db: str) -> dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], List[Tuple[Any, ...]]]]:
+    """
+    Returns the columns, their declared types, and the rows of every table in the db referenced by `path_to_db`.
+    """
+    tables = {}
+    cnxn = sqlite3.connect(ConnectionPool.get_uri(path_to_db), uri=True)
+    try:
+        names = [
+            name for (name,) in cnxn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name;"
+            )
+        ]
+        for table in names:
+            table_info = cnxn.execute('PRAGMA table_info("%s");' % table).fetchall()
+            columns = tuple(column_info[1] for column_info in table_info)
+            types = tuple((column_info[2] or "TEXT") for column_info in table_info)
+            rows = cnxn.execute('SELECT * FROM "%s" ORDER BY rowid;' % table).fetchall()
+            tables[table] = (columns, types, rows)
+    finally:
+        cnxn.close()
+    return tables
+
+def build_artifact(path: str, *, version: str, game_nos: Iterable[int] = GAME_NOS) -> str:
+    """
+    Consolidates the packaged db of each of `game_nos` into one artifact at `path`, replacing it atomically;
+    returns the checksum of its contents. Each table gains a `Game` column, and has the union of the columns
+    it has in each game; those a game lacks are NULL.
+    """
+    # imported here, as it is only needed to locate packaged data.
+    from aenir.morph import get_morph_class
+
+    game_tables = {
+        game_no: _read_database(get_morph_class(game_no).path_to("cleaned_stats.db"))
+        for game_no in sorted(game_nos)
+    }
+    # table -> column -> type, in the order in which columns are first seen.
+    schema: dict[str, dict[str, str]] = {}
+    for tables in game_tables.values():
+        for table, (columns, types, _) in tables.items():
+            table_schema = schema.setdefault(table, {})
+            for column, column_type in zip(columns, types):
+                table_schema.setdefault(column, column_type)
+    path_to_tmp = path + ".tmp"
+    if os.path.exists(path_to_tmp):
+        os.remove(path_to_tmp)
+    cnxn = sqlite3.connect(path_to_tmp, isolation_level=None)
+    try:
+        cnxn.execute("BEGIN;")
+        cnxn.execute("CREATE TABLE artifact_header (key TEXT PRIMARY KEY, value TEXT NOT NULL);")
+        cnxn.execute('CREATE TABLE artifact_columns (Game INTEGER NOT NULL, "Table" TEXT NOT NULL, Columns TEXT NOT NULL);')
+        for table in sorted(schema):
+            definitions = ", ".join(['"Game" INTEGER NOT NULL'] + ['"%s" %s' % item for item in schema[table].items()])
+            cnxn.execute('CREATE TABLE "%s" (%s);' % (table, definitions))
+            indexed_columns = [column for column in schema[table] if column in INDEXED_COLUMNS]
+            for column in indexed_columns:
+                cnxn.execute('CREATE INDEX "%s__%s" ON "%s" ("Game", "%s");' % (table, column, table, column))
+            if not indexed_columns:
+                cnxn.execute('CREATE INDEX "%s__Game" ON "%s" ("Game");' % (table, table))
+        columns_by_table = {}
+        for game_no, tables in game_tables.items():
+            for table, (columns, _, rows) in sorted(tables.items()):
+                placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+                column_list = ", ".join('"%s"' % column for column in ("Game",) + columns)
+                cnxn.executemany(
+                    'INSERT INTO "%s" (%s) VALUES (%s);' % (table, column_list, placeholders),
+                    ((game_no, *row) for row in rows),
+                )
+                cnxn.execute("INSERT INTO artifact_columns VALUES (?, ?, ?);", (game_no, table, json.dumps(columns)))
+                columns_by_table[(game_no, table)] = columns
+        checksum = get_artifact_checksum(cnxn, columns_by_table)
+        cnxn.executemany(
+            "INSERT INTO artifact_header VALUES (?, ?);",
+            (("format", str(ARTIFACT_FORMAT)), ("version", version), ("checksum", checksum)),
+        )
+        cnxn.execute("COMMIT;")
+        cnxn.execute("ANALYZE;")
+        cnxn.execute("VACUUM;")
+    except BaseException:
+        cnxn.close()
+        os.remove(path_to_tmp)
+        raise
+    cnxn.close()
+    os.replace(path_to_tmp, path)
+    logger.debug("Built artifact '%s' (version %s) of %d games.", path, version, len(game_tables))
+    return checksum
+
+def _get_path_to_db(database: str) -> str:
+    """
+    Returns `database`, or the path to the db packaged for the game it numbers.
+    """
+    if database.isdigit():
+        # imported here, as it is only needed to locate packaged data.
+        from aenir.morph import get_morph_class
+
+        return get_morph_class(int(database)).path_to("cleaned_stats.db")
+    return database
+
+def main(argv: List[str] | None = None) -> None:
+    """
+    Dumps a db to CSV files, or builds one from them, as the command line says.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    dump_parser = subparsers.add_parser("dump", help="write every table of a db to a CSV file")
+    dump_parser.add_argument("database", help="path to the db, or the number of a game")
+    dump_parser.add_argument("directory", help="directory to write CSV files to")
+    build_parser = subparsers.add_parser("build", help="build a db from every CSV file in a directory")
+    build_parser.add_argument("directory", help="directory to read CSV files from")
+    build_parser.add_argument("database", help="path to the db, or the number of a game")
+    artifact_parser = subparsers.add_parser("artifact", help="consolidate the db of every game into one artifact")
+    artifact_parser.add_argument("path", help="path to the artifact")
+    artifact_parser.add_argument("--version", help="version to declare in its header (default: that of this package)")
+    args = parser.parse_args(argv)
+    if args.command == "artifact":
+        # imported here, as reading package metadata is slow.
+        from aenir import __version__
+
+        print(build_artifact(args.path, version=args.version or __version__))
+        return
+    try:
+        path_to_db = _get_path_to_db(args.database)
+    except (ValueError, NotImplementedError) as err:
+        parser.error(str(err))
+    if args.command == "dump":
+        num_rows = dump_database(path_to_db, args.directory)
+    else:
+        num_rows = build_database(args.directory, path_to_db)
+    for table, count in num_rows.items():
+        print("%6d %s" % (count, table))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,169 @@
+"""
+Declares the `aenir` console script, which evaluates plans and writes their results to stdout.
+
+Plans are given as arguments, or else read from stdin, one JSON object per line, in the form accepted by `Plan.parse`:
+    {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": 19}, "promote"]}
+Results are written as they are ready, in the order of the plans; stats are in hundredths.
+Plans that cannot be read are reported on stderr, and the exit status is then 1.
+
+Usage: aenir [--jobs N] [--format json|csv|table] [PLAN ...]
+"""
+
+import argparse
+import csv
+import json
+import signal
+import sys
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    TextIO,
+)
+
+from aenir.morph import get_morph_class
+from aenir.parallel import iter_evaluate_plans
+from aenir.plans import (
+    Plan,
+    PlanResult,
+)
+from aenir._exceptions import PlanError
+from aenir._logging import logger
+
+# columns of every result, followed by the stats of every game in turn.
+_COLUMNS = ("game_no", "name", "current_cls", "current_lv")
+
+def _get_stat_columns() -> List[str]:
+    """
+    Returns the stats of every game, each once, in the order in which they first appear.
+    """
+    stat_columns: List[str] = []
+    for game_no in range(4, 10):
+        for stat in get_morph_class(game_no).STATS().STAT_LIST():
+            if stat not in stat_columns:
+                stat_columns.append(stat)
+    return stat_columns
+
+def read_plans(lines: Iterable[str], on_error: Callable[[int, BaseException], None]) -> Iterator[Plan]:
+    """
+    Yields a Plan from each line of JSON in `lines`, skipping blank lines;
+    lines that cannot be read are passed to `on_error` (with their number) and skipped.
+    """
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield Plan.parse(json.loads(line))
+        except (ValueError, PlanError) as err:
+            on_error(line_no, err)
+
+def _get_row(result: PlanResult) -> dict[str, Any]:
+    """
+    Returns `result` flattened into one value per column.
+    """
+    result_dict = result.as_dict()
+    row = {column: result_dict[column] for column in _COLUMNS}
+    row.update(result_dict["current_stats"] or {})
+    error = result_dict["error"]
+    row["error"] = None if error is None else "%s: %s" % (error["type"], error["message"])
+    return row
+
+def write_json(results: Iterable[PlanResult], stream: TextIO) -> None:
+    """
+    Writes each result as a line of JSON.
+    """
+    for result in results:
+        stream.write(json.dumps(result.as_dict()) + "\n")
+
+def write_csv(results: Iterable[PlanResult], stream: TextIO) -> None:
+    """
+    Writes a header, then a row for each result; stats that a game lacks are left blank.
+    """
+    columns = list(_COLUMNS) + _get_stat_columns() + ["error"]
+    writer = csv.DictWriter(stream, columns, lineterminator="\n")
+    writer.writeheader()
+    for result in results:
+        writer.writerow(_get_row(result))
+
+def write_table(results: Iterable[PlanResult], stream: TextIO) -> None:
+    """
+    Writes results as columns aligned for reading; unlike the other formats, waits for every result first.
+    """
+    rows = [_get_row(result) for result in results]
+    stat_columns = [column for column in _get_stat_columns() if any(column in row for row in rows)]
+    columns = list(_COLUMNS) + stat_columns
+    if any(row["error"] is not None for row in rows):
+        columns.append("error")
+    cells = [columns] + [["" if row.get(column) is None else str(row[column]) for column in columns] for row in rows]
+    widths = [max(len(line[index]) for line in cells) for index in range(len(columns))]
+    for line in cells:
+        stream.write("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() + "\n")
+
+class _VersionAction(argparse.Action):
+    """
+    Prints the version and exits; looks the version up only then, as doing so is slow.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help="show the version and exit"):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        import aenir
+
+        parser.exit(message=f"aenir {aenir.__version__}\n")
+
+_WRITERS = {
+    "json": write_json,
+    "csv": write_csv,
+    "table": write_table,
+}
+
+def main(argv: List[str] | None = None, *, stdin: TextIO | None = None, stdout: TextIO | None = None, stderr: TextIO | None = None) -> int:
+    """
+    Evaluates the plans given by `argv` (or read from `stdin`) and writes their results; returns the exit status.
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    stderr = sys.stderr if stderr is None else stderr
+    parser = argparse.ArgumentParser(
+        prog="aenir",
+        description=__doc__.strip().splitlines()[0],
+        epilog="Plans are read from stdin, one JSON object per line, if none are given.",
+    )
+    parser.add_argument("plans", nargs="*", metavar="PLAN", help="a plan as a JSON object")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="worker processes (default: 1, i.e. this one)")
+    parser.add_argument("--chunksize", type=int, default=64, help="plans sent to a worker at once (default: 64)")
+    parser.add_argument("--format", "-f", choices=tuple(_WRITERS), default="json", help="output format (default: json)")
+    parser.add_argument("--version", action=_VersionAction)
+    args = parser.parse_args(argv)
+    if args.jobs < 1 or args.chunksize < 1:
+        parser.error("--jobs and --chunksize must be positive")
+
+    num_errors = 0
+
+    def report_error(line_no: int, err: BaseException) -> None:
+        nonlocal num_errors
+        num_errors += 1
+        print(f"aenir: plan {line_no}: {err}", file=stderr)
+
+    lines = args.plans if args.plans else stdin
+    plans = read_plans(lines, report_error)
+    results = iter_evaluate_plans(plans, max_workers=args.jobs, chunksize=args.chunksize)
+    _WRITERS[args.format](results, stdout)
+    stdout.flush()
+    logger.debug("Evaluated plans with %d job(s); %d could not be read.", args.jobs, num_errors)
+    return 1 if num_errors else 0
+
+def run() -> None:
+    """
+    Calls `main` with the arguments on the command line; the entry point of the `aenir` script.
+    """
+    # end quietly when the reader of a pipe does, e.g. `aenir < plans.jsonl | head`.
+    if hasattr(signal, "SIGPIPE"):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+    sys.exit(main(sys.argv[1:]))
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,105 @@
+"""
+Declares functions that compute the exact distribution of each stat at the end of a plan.
+
+Each level, a stat grows by one point with probability equal to its growth rate;
+a growth rate above 100 guarantees one point per hundred, plus a chance at one more.
+Stat values are in hundredths of a point, as in Stats objects.
+"""
+
+import functools
+import math
+from typing import (
+    Any,
+    Iterable,
+    Tuple,
+)
+
+from aenir.morph import Morph
+from aenir.simulation import (
+    CompiledPlan,
+    StatDistributions,
+    compile_plan,
+)
+
+# the effect of one step on one stat: (growth rate or None, number of levels, increment, max stat or None)
+StatStep = Tuple[int | None, int, int, int | None]
+
+@functools.lru_cache(maxsize=None)
+def get_gain_distribution(growth_rate: int, num_levels: int) -> Tuple[Tuple[int, float], ...]:
+    """
+    Returns (gain, probability) pairs for the total gain from `num_levels` levels at `growth_rate`.
+    """
+    whole, percent = divmod(growth_rate, 100)
+    probability = percent / 100
+    guaranteed_gain = 100 * whole * num_levels
+    distribution = []
+    for num_successes in range(num_levels + 1):
+        num_successes_probability = (
+            math.comb(num_levels, num_successes)
+            * probability ** num_successes
+            * (1 - probability) ** (num_levels - num_successes)
+        )
+        if num_successes_probability:
+            distribution.append((guaranteed_gain + 100 * num_successes, num_successes_probability))
+    return tuple(distribution)
+
+@functools.lru_cache(maxsize=4096)
+def get_stat_distribution(initial_value: int, stat_steps: Tuple[StatStep, ...]) -> Tuple[Tuple[int, float], ...]:
+    """
+    Returns (value, probability) pairs, in ascending order, for a stat that undergoes `stat_steps`.
+    """
+    distribution = {initial_value: 1.0}
+    for growth_rate, num_levels, increment, max_stat in stat_steps:
+        if growth_rate:
+            convolution: dict[int, float] = {}
+            for gain, gain_probability in get_gain_distribution(growth_rate, num_levels):
+                for value, probability in distribution.items():
+                    new_value = value + gain
+                    convolution[new_value] = convolution.get(new_value, 0.0) + probability * gain_probability
+            distribution = convolution
+        elif increment:
+            distribution = {value + increment: probability for value, probability in distribution.items()}
+        if max_stat is not None:
+            bounded_distribution: dict[int, float] = {}
+            for value, probability in distribution.items():
+                # no stat in any game falls below zero; FE5 enforces this upon promotion.
+                new_value = max(0, min(value, max_stat))
+                bounded_distribution[new_value] = bounded_distribution.get(new_value, 0.0) + probability
+            distribution = bounded_distribution
+    return tuple(sorted(distribution.items()))
+
+class ExactDistributions(StatDistributions):
+    """
+    Holds the exact distribution of each stat at the end of a plan.
+    """
+
+    def __init__(self, compiled_plan: CompiledPlan) -> None:
+        """
+        Computes the distribution of each stat; stats without growth rates take a single value.
+        """
+        super().__init__(compiled_plan)
+        growable_stats = set(self.Stats.get_growable_stats())
+        self._distributions = {}
+        for index, stat in enumerate(self.Stats.STAT_LIST()):
+            stat_steps = tuple(
+                (
+                    (step.growth_rates[index] if step.growth_rates is not None and stat in growable_stats else None),
+                    step.num_levels,
+                    step.increment[index],
+                    (step.max_stats[index] if step.max_stats is not None else None),
+                )
+                for step in compiled_plan.steps
+            )
+            self._distributions[stat] = dict(get_stat_distribution(compiled_plan.initial_stats[index], stat_steps))
+
+    def distributions(self) -> dict[str, dict[int, float]]:
+        """
+        Returns the probability of each final value, per stat.
+        """
+        return self._distributions
+
+def get_exact_distributions(morph: Morph, plan: Iterable[Any]) -> ExactDistributions:
+    """
+    Returns the exact distribution of each stat after `plan` is performed on `morph`; `morph` is left unchanged.
+    """
+    return ExactDistributions(compile_plan(morph, plan))
@@ -0,0 +1,146 @@
+"""
+Declares an executor of plans that remembers the states reached along the way,
+so that plans which share a prefix of operations replay only what follows it.
+"""
+
+import collections
+import time
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Tuple,
+)
+
+from aenir.morph import (
+    Morph,
+    UnitSpec,
+)
+from aenir.plans import (
+    PLAN_ERRORS,
+    Operation,
+    Plan,
+    PlanResult,
+    apply_operation,
+)
+from aenir._logging import logger
+
+# identifies the state of a unit after some of its operations: (game_no, unit, operations performed).
+StateKey = Tuple[int, UnitSpec, Tuple[Operation, ...]]
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a PlanExecutor's cache, in the manner of `functools.lru_cache`.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class PlanExecutor:
+    """
+    Evaluates plans, memoizing the Morph reached after each prefix of operations.
+    Entries are evicted when there are more than `maxsize` of them, least recently used first,
+    and upon lookup when older than `ttl` seconds (if set). Not thread-safe; use one per thread.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Declares an empty cache.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative: {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (time of insertion, morph); never handed out, only copied.
+        self._states: collections.OrderedDict[StateKey, Tuple[float, Morph]] = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _get_state(self, key: StateKey) -> Morph | None:
+        """
+        Returns the memoized Morph for `key` if it has not expired, marking it as recently used.
+        """
+        entry = self._states.get(key)
+        if entry is None:
+            return None
+        inserted_at, morph = entry
+        if self.ttl is not None and self._clock() - inserted_at > self.ttl:
+            del self._states[key]
+            return None
+        self._states.move_to_end(key)
+        return morph
+
+    def _set_state(self, key: StateKey, morph: Morph) -> None:
+        """
+        Memoizes `morph` for `key`, evicting the least recently used entries over `maxsize`;
+        `morph` now belongs to the cache, and must not be changed.
+        """
+        if not self.maxsize:
+            return
+        self._states[key] = (self._clock(), morph)
+        self._states.move_to_end(key)
+        while len(self._states) > self.maxsize:
+            self._states.popitem(last=False)
+
+    def _execute(self, plan: Plan) -> Morph:
+        """
+        Returns the Morph reached by `plan`, resuming from the longest memoized prefix; it must not be changed.
+        """
+        operations = plan.operations
+        for num_performed in range(len(operations), -1, -1):
+            morph = self._get_state((plan.game_no, plan.unit, operations[:num_performed]))
+            if morph is not None:
+                self._hits += 1
+                break
+        else:
+            self._misses += 1
+            num_performed = 0
+            morph = plan.create_morph()
+            self._set_state((plan.game_no, plan.unit, ()), morph)
+        logger.debug("Resuming plan for '%s' after %d of %d operations.", plan.unit.name, num_performed, len(operations))
+        for num_performed in range(num_performed + 1, len(operations) + 1):
+            # the memoized state is left as it was; each operation is performed upon a new copy.
+            morph = morph.copy()
+            apply_operation(morph, operations[num_performed - 1])
+            self._set_state((plan.game_no, plan.unit, operations[:num_performed]), morph)
+        return morph
+
+    def execute(self, plan: Any) -> Morph:
+        """
+        Returns a new Morph on which the operations of `plan` (see `Plan.parse`) have been performed.
+        Raises as `apply_operation` does.
+        """
+        return self._execute(Plan.parse(plan)).copy()
+
+    def evaluate(self, plan: Any) -> PlanResult:
+        """
+        As `evaluate_plan`, but with memoized prefixes.
+        """
+        plan = Plan.parse(plan)
+        try:
+            morph = self._execute(plan)
+        except PLAN_ERRORS as err:
+            return PlanResult.from_error(plan, err)
+        return PlanResult.from_morph(plan.game_no, morph)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the number of plans that resumed from a memoized state, and of those that started afresh.
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._states))
+
+    def cache_clear(self) -> None:
+        """
+        Forgets every memoized state, and resets statistics.
+        """
+        self._states.clear()
+        self._hits = 0
+        self._misses = 0
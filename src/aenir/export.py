@@ -0,0 +1,236 @@
+"""
+Declares a streaming exporter of the static data of a game, one JSON-lines record per unit and per class.
+
+Records are produced one at a time from a cursor over each table, so memory use does not grow with the output;
+the tables that records are joined against are read once into the indexes that Morphs share.
+Output depends on nothing but the db, so identical data yields identical bytes, and a digest of it serves as an ETag.
+
+Usage: python -m aenir.export GAME [--output FILE]
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import sqlite3
+import sys
+from typing import (
+    Any,
+    BinaryIO,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from aenir.games import FireEmblemGame
+from aenir.morph import (
+    BaseMorph,
+    Morph,
+    get_morph_class,
+)
+from aenir._database import (
+    DataBackend,
+    get_artifact,
+    get_preloaded_database,
+)
+from aenir._logging import logger
+
+# compact, and with keys in the order in which they are declared.
+_encoder = json.JSONEncoder(ensure_ascii=True, separators=(",", ":"))
+
+def _get_morph_class(game: FireEmblemGame | int) -> type[Morph]:
+    """
+    Returns the Morph class of `game`; throws NotImplementedError if there is none.
+    """
+    return get_morph_class(FireEmblemGame(game).value)
+
+def _iter_table(morph_cls: type[BaseMorph], table: str, fields: Tuple[str, ...]) -> Iterator[dict[str, Any]]:
+    """
+    Yields the `fields` of each record in `table`, in the order in which they are stored.
+    """
+    resultset = morph_cls.query_db(morph_cls.path_to("cleaned_stats.db"), table, fields, None)
+    for record in resultset:
+        yield dict(record)
+
+def _get_columns(morph_cls: type[BaseMorph], table: str) -> Tuple[str, ...] | None:
+    """
+    Returns the names of the columns of `table`, or None if it does not exist.
+    """
+    path_to_db = morph_cls.path_to("cleaned_stats.db")
+    if morph_cls.data_backend is DataBackend.ARTIFACT:
+        return get_artifact().get_columns(morph_cls.GAME().value, table)
+    if morph_cls.data_backend is DataBackend.PRELOADED:
+        try:
+            return get_preloaded_database(path_to_db).tables[table][0]
+        except KeyError:
+            return None
+    cnxn = morph_cls.connection_pool.get_connection(path_to_db)
+    try:
+        cursor = cnxn.execute("SELECT * FROM '%s' LIMIT 0;" % table)
+    except sqlite3.OperationalError:
+        return None
+    return tuple(description[0] for description in cursor.description)
+
+def _get_alias(morph_cls: type[BaseMorph], home_table: str, target_table: str, name: str) -> Any:
+    """
+    As `BaseMorph.get_alias`, for use without an instance.
+    """
+    aliases = morph_cls.get_index(f"{home_table}-JOIN-{target_table}", "Name", ("Alias",)).get(name)
+    if aliases is None:
+        return None
+    return aliases[0]["Alias"]
+
+def _get_stats(morph_cls: type[Morph], record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the stats of `record`, in the order of the Stats class of `morph_cls`.
+    """
+    return {stat: record[stat] for stat in morph_cls.STATS().STAT_LIST()}
+
+def _get_promotions(
+        morph_cls: type[Morph],
+        home_table: str,
+        name: str,
+        seen: Tuple[str, ...] = (),
+    ) -> List[dict[str, Any]]:
+    """
+    Returns the classes to which `name` (of `home_table`) may promote: their gains, the class of their maximum stats,
+    and the promotions available from them in turn (FE8's trainees promote twice).
+    """
+    alias = _get_alias(morph_cls, home_table, "classes__promotion_gains", name)
+    if alias is None:
+        return []
+    fields = morph_cls.STATS().STAT_LIST() + ("Promotion",)
+    promotions = []
+    for record in morph_cls.get_index("classes__promotion_gains0", "Class", fields).get(alias, []):
+        promo_cls = record["Promotion"]
+        if promo_cls in seen:
+            continue
+        promotions.append({
+            "class": promo_cls,
+            "gains": _get_stats(morph_cls, record),
+            "max_stats_class": _get_alias(morph_cls, "classes__promotion_gains", "classes__maximum_stats", promo_cls),
+            "promotions": _get_promotions(morph_cls, "classes__promotion_gains", promo_cls, seen + (promo_cls,)),
+        })
+    return promotions
+
+def iter_unit_records(game: FireEmblemGame | int) -> Iterator[dict[str, Any]]:
+    """
+    Yields a record for each row of each table of base stats of `game`: class, level, bases, growths,
+    maximum stats and promotions. `which_bases` identifies the table; `father` is set for FE4's children.
+    """
+    morph_cls = _get_morph_class(game)
+    stat_list = morph_cls.STATS().STAT_LIST()
+    max_stats_index = morph_cls.get_index("classes__maximum_stats0", "Class", stat_list)
+    for which_bases in itertools.count():
+        table = "characters__base_stats%d" % which_bases
+        columns = _get_columns(morph_cls, table)
+        if columns is None:
+            break
+        has_father = "Father" in columns
+        fields = ("Name", "Class", "Lv") + stat_list + (("Father",) if has_father else ())
+        for record in _iter_table(morph_cls, table, fields):
+            name = record["Name"]
+            if has_father:
+                growth_records = [
+                    growth_record
+                    for growth_record in morph_cls.get_index("characters__growth_rates1", "Name", stat_list + ("Father",)).get(name, [])
+                    if growth_record["Father"] == record["Father"]
+                ]
+            else:
+                alias = _get_alias(morph_cls, "characters__base_stats", "characters__growth_rates", name)
+                growth_records = morph_cls.get_index("characters__growth_rates0", "Name", stat_list).get(alias, [])
+            max_stats_class = _get_alias(morph_cls, "characters__base_stats", "classes__maximum_stats", name)
+            max_records = max_stats_index.get(max_stats_class, [])
+            yield {
+                "type": "unit",
+                "name": name,
+                "which_bases": which_bases,
+                "father": record["Father"] if has_father else None,
+                "class": record["Class"],
+                "level": record["Lv"],
+                "bases": _get_stats(morph_cls, record),
+                "growths": _get_stats(morph_cls, growth_records[0]) if growth_records else None,
+                "max_stats_class": max_stats_class,
+                "max_stats": _get_stats(morph_cls, max_records[0]) if max_records else None,
+                "promotions": _get_promotions(morph_cls, "characters__base_stats", name),
+            }
+
+def iter_class_records(game: FireEmblemGame | int) -> Iterator[dict[str, Any]]:
+    """
+    Yields a record for each class of `game` with maximum stats; units and promotions refer to it by name.
+    """
+    morph_cls = _get_morph_class(game)
+    fields = ("Class",) + morph_cls.STATS().STAT_LIST()
+    for record in _iter_table(morph_cls, "classes__maximum_stats0", fields):
+        yield {
+            "type": "class",
+            "name": record["Class"],
+            "max_stats": _get_stats(morph_cls, record),
+        }
+
+def iter_records(game: FireEmblemGame | int) -> Iterator[dict[str, Any]]:
+    """
+    Yields every unit record of `game`, then every class record.
+    """
+    game = FireEmblemGame(game)
+    yield {"type": "game", "game_no": game.value, "name": game.formal_name}
+    yield from iter_unit_records(game)
+    yield from iter_class_records(game)
+
+def iter_lines(game: FireEmblemGame | int) -> Iterator[bytes]:
+    """
+    Yields each record of `game` as a line of JSON, encoded as ASCII and terminated by a newline.
+    """
+    for record in iter_records(game):
+        yield (_encoder.encode(record) + "\n").encode("ascii")
+
+def write_jsonl(game: FireEmblemGame | int, stream: BinaryIO) -> int:
+    """
+    Writes every record of `game` to `stream` as JSON lines; returns the number of records written.
+    """
+    num_records = 0
+    for line in iter_lines(game):
+        stream.write(line)
+        num_records += 1
+    logger.debug("Exported %d records for FE%d.", num_records, FireEmblemGame(game).value)
+    return num_records
+
+def get_etag(game: FireEmblemGame | int) -> str:
+    """
+    Returns a digest of the JSON lines of `game`, without holding them in memory.
+    """
+    digest = hashlib.sha256()
+    for line in iter_lines(game):
+        digest.update(line)
+    return digest.hexdigest()
+
+def main(argv: List[str] | None = None) -> None:
+    """
+    Writes the JSON lines of the game given on the command line to a file, or to stdout.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("game", type=int, help="number of the game, e.g. 6 for The Binding Blade")
+    parser.add_argument("--output", "-o", help="file to write to (default: stdout)")
+    parser.add_argument("--etag", action="store_true", help="print the digest of the output instead")
+    args = parser.parse_args(argv)
+    try:
+        _get_morph_class(args.game)
+    except (ValueError, NotImplementedError) as err:
+        parser.error(str(err))
+    if args.etag:
+        print(get_etag(args.game))
+    elif args.output is None:
+        write_jsonl(args.game, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as stream:
+            write_jsonl(args.game, stream)
+
+def run() -> None:
+    """
+    Calls `main` with the arguments on the command line; the entry point of the `aenir-export` script.
+    """
+    main(sys.argv[1:])
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,259 @@
+"""
+Declares opt-in instrumentation of Morphs, kept in an in-process registry of counters and histograms.
+
+Each call to a public method of a Morph (its construction included) is an operation: its wall time is recorded,
+as are the queries and connections it makes and the Stats objects it allocates. Calls made by an operation
+are counted towards it, rather than as operations of their own. Instrumentation is off by default;
+while it is off, methods are not wrapped at all, and each of the other hooks costs a flag-check.
+Turn it on for a block of code:
+
+    with instrument() as metrics:
+        get_morph(9, "Lethe").equip_demi_band()
+    print(metrics.dumps(indent=2))
+
+or for the whole process, with `enable` and `disable`.
+"""
+
+import bisect
+import contextlib
+import functools
+import json
+import threading
+import time
+import types
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    TextIO,
+    Tuple,
+)
+
+# upper bounds of the buckets of latency histograms, in milliseconds.
+LATENCY_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, float("inf"))
+
+class LatencyHistogram:
+    """
+    Counts durations into fixed buckets; cheap to update, and to merge into a report.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """
+        Declares empty buckets with upper bounds `buckets` (in milliseconds).
+        """
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, duration: float) -> None:
+        """
+        Counts `duration` (in milliseconds).
+        """
+        self.counts[bisect.bisect_left(self.buckets, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.maximum = max(self.maximum, duration)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the upper bound of the bucket in which the `percent`-th percentile falls (or the maximum, if lower).
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns counts of each bucket (keyed by upper bound), and summary statistics.
+        """
+        return {
+            "count": self.count,
+            "mean_ms": (self.total / self.count) if self.count else 0.0,
+            "max_ms": self.maximum,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": {("+Inf" if bound == float("inf") else str(bound)): count for bound, count in zip(self.buckets, self.counts)},
+        }
+
+class MetricsRegistry:
+    """
+    Holds counters and latency histograms by name; safe to update from any thread.
+    """
+
+    def __init__(self) -> None:
+        """
+        Declares empty counters and histograms.
+        """
+        self._lock = threading.Lock()
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, LatencyHistogram] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """
+        Adds `value` to the counter `name`.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record(self, name: str, duration: float) -> None:
+        """
+        Counts `duration` (in milliseconds) into the histogram `name`.
+        """
+        with self._lock:
+            try:
+                histogram = self.histograms[name]
+            except KeyError:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(duration)
+
+    def reset(self) -> None:
+        """
+        Discards all counters and histograms.
+        """
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns counters and summaries of histograms, each sorted by name.
+        """
+        with self._lock:
+            return {
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {name: self.histograms[name].as_dict() for name in sorted(self.histograms)},
+            }
+
+    def dumps(self, **kwargs: Any) -> str:
+        """
+        Returns `as_dict` as JSON; `kwargs` are passed on to `json.dumps`.
+        """
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def dump(self, stream: TextIO, **kwargs: Any) -> None:
+        """
+        Writes `as_dict` to `stream` as JSON; `kwargs` are passed on to `json.dump`.
+        """
+        json.dump(self.as_dict(), stream, **kwargs)
+
+# the registry to which metrics are recorded unless `instrument` is given another.
+registry = MetricsRegistry()
+
+# read by every hook; set by `enable`, `disable` and `instrument` alone.
+enabled = False
+_current = registry
+# counts of the operation in progress on each thread, if any.
+_local = threading.local()
+# (class, attribute, method, wrapper) of every method registered by `instrument_methods`;
+# wrappers are installed in place of methods only while instrumentation is on.
+_methods: List[Tuple[type, str, Callable, Callable]] = []
+_methods_lock = threading.Lock()
+
+def _install_wrappers(install: bool) -> None:
+    """
+    Puts the wrapper of every registered method in its place if `install`, or the method itself otherwise.
+    """
+    with _methods_lock:
+        for cls, attr, method, wrapper in _methods:
+            setattr(cls, attr, wrapper if install else method)
+
+def enable(metrics: MetricsRegistry | None = None) -> MetricsRegistry:
+    """
+    Turns instrumentation on for the whole process, recording to `metrics` (or `registry`), and returns it.
+    """
+    global enabled, _current
+    _current = registry if metrics is None else metrics
+    if not enabled:
+        enabled = True
+        _install_wrappers(True)
+    return _current
+
+def disable() -> None:
+    """
+    Turns instrumentation off, and restores `registry` as the registry to record to.
+    """
+    global enabled, _current
+    if enabled:
+        enabled = False
+        _install_wrappers(False)
+    _current = registry
+
+@contextlib.contextmanager
+def instrument(metrics: MetricsRegistry | None = None) -> Iterator[MetricsRegistry]:
+    """
+    Turns instrumentation on within the block, recording to `metrics` (or `registry`), which is yielded.
+    Instrumentation is restored to its previous state afterwards.
+    """
+    global _current
+    was_enabled, previous = enabled, _current
+    metrics = enable(metrics)
+    try:
+        yield metrics
+    finally:
+        if was_enabled:
+            _current = previous
+        else:
+            disable()
+
+def count(name: str) -> None:
+    """
+    Counts one `name` event towards the registry, and towards the operation in progress on this thread;
+    the hooks call this only while instrumentation is on.
+    """
+    _current.increment(name)
+    counts = getattr(_local, "counts", None)
+    if counts is not None:
+        counts[name] = counts.get(name, 0) + 1
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Wraps `method` so that each call, unless made by another operation, is recorded as an operation
+    named after the class of the instance and `method`, e.g. "Morph9.equip_demi_band".
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        """
+        Calls `method`, recording its wall time and counts while instrumentation is on.
+        """
+        if not enabled or getattr(_local, "counts", None) is not None:
+            return method(self, *args, **kwargs)
+        name = "%s.%s" % (type(self).__name__, method.__name__)
+        counts = _local.counts = {}
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            _local.counts = None
+            metrics = _current
+            metrics.record(name, duration)
+            metrics.increment(name + ".calls")
+            for event, value in counts.items():
+                metrics.increment("%s.%s" % (name, event), value)
+
+    return wrapper
+
+def instrument_methods(cls: type) -> type:
+    """
+    Registers each public method declared by `cls`, and its `__init__`, to be wrapped with `instrumented`
+    while instrumentation is on (at once, if it is); returns `cls`.
+    """
+    with _methods_lock:
+        for attr, value in list(vars(cls).items()):
+            if isinstance(value, types.FunctionType) and (attr == "__init__" or not attr.startswith("_")):
+                wrapper = instrumented(value)
+                _methods.append((cls, attr, value, wrapper))
+                if enabled:
+                    setattr(cls, attr, wrapper)
+    return cls
@@ -0,0 +1,231 @@
+"""
+Declares a solver for the set of growth items (FE5 scrolls, FE9 bands) that best serves an objective.
+
+Items add to growth rates, so an objective is scored on the growth rates that a loadout results in.
+Every objective here is non-decreasing in each growth rate, so the best that can be done with
+the items left to consider is bounded by giving each stat the largest bonuses it could get from them;
+branches of the search whose bound is no better than the best loadout found so far are pruned.
+"""
+
+import abc
+from typing import (
+    Any,
+    List,
+    Mapping,
+    NamedTuple,
+    Tuple,
+)
+
+from aenir.distributions import get_gain_distribution
+from aenir.morph import (
+    Morph,
+    Morph5,
+    Morph9,
+)
+from aenir._logging import logger
+
+class LoadoutObjective(abc.ABC):
+    """
+    Scores the growth rates of a unit; must not decrease as any growth rate increases.
+    """
+
+    def __init__(self, stat_dict: Mapping[str, Any], num_levels: int) -> None:
+        """
+        Declares the stats that are scored, and the number of levels over which they grow.
+        """
+        if any(value < 0 for value in stat_dict.values()):
+            raise ValueError(f"Values must not be negative: {dict(stat_dict)}")
+        if num_levels < 0:
+            raise ValueError(f"Number of levels must not be negative: {num_levels}")
+        self.stat_dict = dict(stat_dict)
+        self.num_levels = num_levels
+
+    @property
+    def stats(self) -> Tuple[str, ...]:
+        """
+        The stats on which the score depends.
+        """
+        return tuple(self.stat_dict)
+
+    @abc.abstractmethod
+    def score(self, morph: Morph, growth_rates: Mapping[str, int]) -> float:
+        """
+        Returns the score of `morph` were its growth rates `growth_rates`.
+        """
+        raise NotImplementedError
+
+class ExpectedStats(LoadoutObjective):
+    """
+    Weighs the stats that a unit is expected to have after `num_levels` levels; capped at its maximum stats unless told otherwise.
+    Uncapped, this is equivalent to weighing growth rates.
+    """
+
+    def __init__(self, weights: Mapping[str, float], num_levels: int, *, capped: bool = True) -> None:
+        """
+        Declares weight of each stat.
+        """
+        super().__init__(weights, num_levels)
+        self.capped = capped
+
+    def score(self, morph: Morph, growth_rates: Mapping[str, int]) -> float:
+        """
+        Returns weighted sum of expected stats.
+        """
+        score = 0.0
+        for stat, weight in self.stat_dict.items():
+            current_stat = getattr(morph.current_stats, stat)
+            if self.capped:
+                max_stat = getattr(morph.max_stats, stat)
+                expected_stat = sum(
+                    probability * min(current_stat + gain, max_stat)
+                    for gain, probability in get_gain_distribution(growth_rates[stat], self.num_levels)
+                )
+            else:
+                expected_stat = current_stat + growth_rates[stat] * self.num_levels
+            score += weight * expected_stat
+        return score
+
+class ThresholdProbability(LoadoutObjective):
+    """
+    The probability that, after `num_levels` levels, every stat is at least its threshold.
+    """
+
+    def score(self, morph: Morph, growth_rates: Mapping[str, int]) -> float:
+        """
+        Returns product of the probability of each stat reaching its threshold; stats grow independently,
+        up to the maximum stats of `morph`, so a threshold above a maximum is never reached.
+        """
+        score = 1.0
+        for stat, threshold in self.stat_dict.items():
+            current_stat = getattr(morph.current_stats, stat)
+            max_stat = getattr(morph.max_stats, stat)
+            score *= sum(
+                probability
+                for gain, probability in get_gain_distribution(growth_rates[stat], self.num_levels)
+                if min(current_stat + gain, max_stat) >= threshold
+            )
+        return score
+
+class Loadout(NamedTuple):
+    """
+    The items to equip, their score, and the unit with them equipped.
+    """
+    items: Tuple[str, ...]
+    score: float
+    morph: Morph
+
+def _get_item_bonuses(morph: Morph) -> dict[str, dict[str, int]]:
+    """
+    Returns the growth bonuses of each item that `morph` may equip; throws NotImplementedError if none can be.
+    """
+    if isinstance(morph, Morph5):
+        return dict(morph.scroll_dict)
+    if isinstance(morph, Morph9):
+        item_bonuses = dict(morph.band_dict)
+        if morph.is_knight:
+            knight_ward_bonus = morph.Stats.get_stat_dict(0)
+            knight_ward_bonus["Spd"] = 30
+            item_bonuses["Knight Ward"] = knight_ward_bonus
+        return item_bonuses
+    raise NotImplementedError(f"Units from {morph.game.formal_name} do not equip growth items.")
+
+def _equip_loadout(morph: Morph, items: Tuple[str, ...]) -> Morph:
+    """
+    Returns copy of `morph` with exactly `items` equipped (and the Demi Band, if it was equipped).
+    """
+    morph = morph.copy()
+    if isinstance(morph, Morph5):
+        for scroll_name in list(morph.equipped_scrolls):
+            morph.unequip_scroll(scroll_name)
+        for scroll_name in items:
+            morph.equip_scroll(scroll_name)
+    else:
+        for band_name in list(morph.equipped_bands):
+            if band_name == "Knight Ward":
+                morph.unequip_knight_ward()
+            elif band_name != "Demi Band":
+                morph.unequip_band(band_name)
+        for band_name in items:
+            if band_name == "Knight Ward":
+                morph.equip_knight_ward()
+            else:
+                morph.equip_band(band_name)
+    return morph
+
+def optimize_loadout(morph: Morph, objective: LoadoutObjective, *, max_items: int | None = None) -> Loadout:
+    """
+    Returns the loadout of at most `max_items` items (by default, as many as `morph` can equip) with the best score.
+    Of loadouts with equal scores, one without unnecessary items is returned. `morph` is left unchanged.
+    """
+    item_bonuses = _get_item_bonuses(morph)
+    if max_items is None:
+        max_items = morph.inventory_size
+        if "Demi Band" in getattr(morph, "equipped_bands", {}):
+            max_items -= 1
+    # FE5 floors growth rates at zero once scrolls are applied.
+    floor = 0 if isinstance(morph, Morph5) else None
+    stats = objective.stats
+    base_growths = {stat: getattr(morph._og_growth_rates, stat) for stat in stats}
+
+    def get_growths(bonus_totals: Mapping[str, int]) -> dict[str, int]:
+        growths = {stat: base_growths[stat] + bonus_totals[stat] for stat in stats}
+        if floor is not None:
+            growths = {stat: max(floor, growth) for stat, growth in growths.items()}
+        return growths
+
+    # items that raise no stat in question can only lower the score.
+    candidates = [
+        (item_name, {stat: bonus[stat] for stat in stats})
+        for item_name, bonus in item_bonuses.items()
+        if any(bonus[stat] > 0 for stat in stats)
+    ]
+    empty_totals = dict.fromkeys(stats, 0)
+
+    def get_item_score(candidate: Tuple[str, dict[str, int]]) -> float:
+        return objective.score(morph, get_growths({stat: candidate[1][stat] for stat in stats}))
+
+    candidates.sort(key=get_item_score, reverse=True)
+    # for the items from index i onwards: the positive bonuses to each stat, largest first.
+    suffix_bonuses: List[dict[str, List[int]]] = []
+    for index in range(len(candidates) + 1):
+        suffix_bonuses.append({
+            stat: sorted((bonus[stat] for _, bonus in candidates[index:] if bonus[stat] > 0), reverse=True)
+            for stat in stats
+        })
+    best_items: Tuple[str, ...] = ()
+    best_score = objective.score(morph, get_growths(empty_totals))
+    num_nodes = 0
+
+    def search(index: int, items: Tuple[str, ...], bonus_totals: dict[str, int]) -> None:
+        nonlocal best_items, best_score, num_nodes
+        num_nodes += 1
+        num_slots = max_items - len(items)
+        if index == len(candidates) or not num_slots:
+            return
+        optimistic_totals = {
+            stat: bonus_totals[stat] + sum(suffix_bonuses[index][stat][:num_slots]) for stat in stats
+        }
+        if objective.score(morph, get_growths(optimistic_totals)) <= best_score:
+            return
+        item_name, bonus = candidates[index]
+        new_totals = {stat: bonus_totals[stat] + bonus[stat] for stat in stats}
+        new_items = items + (item_name,)
+        new_score = objective.score(morph, get_growths(new_totals))
+        if new_score > best_score:
+            best_items, best_score = new_items, new_score
+        search(index + 1, new_items, new_totals)
+        search(index + 1, items, bonus_totals)
+
+    search(0, (), empty_totals)
+    # drop whatever does not contribute, e.g. an item whose bonus is made moot by another's.
+    for item_name in best_items:
+        fewer_items = tuple(name for name in best_items if name != item_name)
+        fewer_totals = dict(empty_totals)
+        for name, bonus in candidates:
+            if name in fewer_items:
+                fewer_totals = {stat: fewer_totals[stat] + bonus[stat] for stat in stats}
+        if objective.score(morph, get_growths(fewer_totals)) >= best_score:
+            best_items = fewer_items
+    logger.debug("Searched %d nodes over %d items for %s: %s.", num_nodes, len(candidates), morph.name, best_items)
+    loadout_morph = _equip_loadout(morph, best_items)
+    return Loadout(best_items, objective.score(morph, loadout_morph.growth_rates.as_dict()), loadout_morph)
@@ -2,9 +2,8 @@
 Defines classes essential to comparing Fire Emblem unit stats.
 """
 
-import importlib.resources
 import abc
-import sqlite3
+import functools
 #import json
 from typing import (
     Self,
@@ -14,10 +13,11 @@ from typing import (
     Iterable,
     Iterator,
     Mapping,
+    NamedTuple,
 )
-import copy
 from textwrap import indent
 
+from aenir import instrumentation
 from aenir.games import FireEmblemGame
 from aenir.stats import (
     GenealogyStats,
@@ -27,6 +27,7 @@ from aenir.stats import (
     RadiantStats,
 )
 from aenir._exceptions import (
+    AenirError,
     UnitNotFoundError,
     LevelUpError,
     PromotionError,
@@ -38,8 +39,18 @@ from aenir._exceptions import (
     InitError,
     TransformationError,
     DemiBandError,
+    PlanError,
 )
 from aenir._logging import logger
+from aenir._database import (
+    ConnectionPool,
+    DataArtifact,
+    DataBackend,
+    connection_pool,
+    get_artifact,
+    get_preloaded_database,
+    swap_artifact,
+)
 
 # TODO: Turn constants back into static methods.
 
@@ -47,6 +58,12 @@ class BaseMorph(abc.ABC):
     """
     Defines attributes pertinent to backend side of stat comparison.
     """
+    connection_pool: ConnectionPool = connection_pool
+    # set to DataBackend.PRELOADED to read static data from memory instead of from disk,
+    # or call `use_artifact` to read that of every game from one file.
+    data_backend: DataBackend = DataBackend.SQLITE
+    # shared by all subclasses; keyed by source (db-path, or artifact-checksum and db-path), table, key-field and fields.
+    _indexes: dict[Tuple[Any, str, str, Tuple[str, ...]], dict[Any, List[Mapping[str, Any]]]] = {}
 
     @classmethod
     @abc.abstractmethod
@@ -72,37 +89,96 @@ class BaseMorph(abc.ABC):
         }[cls.GAME().value]
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def path_to(cls, file: str) -> str:
         """
-        Returns a path to the folder containing static files for `GAME`.
+        Returns a path to the folder containing static files for `GAME`; computed once per class and file.
         """
+        # imported here, so that importing this module does not pay for it.
+        import importlib.resources
+
         root = importlib.resources.files("aenir")
         path = "/".join((str(root), "static", cls.GAME().url_name, file))
         return path
 
-    @staticmethod
+    @classmethod
+    def preload_data(cls) -> None:
+        """
+        Reads all static data for `GAME` into memory; for use with the preloaded data backend.
+        """
+        get_preloaded_database(cls.path_to("cleaned_stats.db"))
+
+    @classmethod
+    def close_connections(cls) -> None:
+        """
+        Closes all pooled db-connections; worker processes may call this to recycle them.
+        """
+        cls.connection_pool.close()
+
+    @classmethod
+    def use_artifact(cls, path: str) -> DataArtifact:
+        """
+        Reads the static data of every game from the consolidated artifact at `path` from now on, and returns it.
+        To swap data without restarting, move a new artifact over the old (e.g. with `os.replace`) and call this again;
+        indexes built from the data swapped out are discarded.
+        """
+        artifact = swap_artifact(path)
+        BaseMorph.data_backend = DataBackend.ARTIFACT
+        for index_key in list(cls._indexes):
+            source = index_key[0]
+            if isinstance(source, tuple) and source[0] != artifact.checksum:
+                cls._indexes.pop(index_key, None)
+        return artifact
+
+    @classmethod
     def query_db(
+            cls,
             path_to_db: str,
             table: str,
             fields: Iterable[str],
             filters: Mapping[str, str | None] | None,
+            artifact: DataArtifact | None = None,
         ) -> Any:
         """
         Queries `table` from db referenced by `path_to_db` for `fields` for which `filters` hold.
+        If `artifact` is given, or with the artifact backend, the records of `GAME` in the artifact are queried instead.
+        """
+        if instrumentation.enabled:
+            instrumentation.count("queries")
+        if artifact is not None:
+            return artifact.select(cls.GAME().value, table, fields, filters)
+        if cls.data_backend is DataBackend.PRELOADED:
+            return get_preloaded_database(path_to_db).select(table, fields, filters)
+        if cls.data_backend is DataBackend.ARTIFACT:
+            return get_artifact().select(cls.GAME().value, table, fields, filters)
+        if filters:
+            filter_fields = tuple(filters.keys())
+            parameters = tuple(filters.values())
+        else:
+            filter_fields = ()
+            parameters = ()
+        query = cls.get_statement(table, tuple(fields), filter_fields)
+        cnxn = cls.connection_pool.get_connection(path_to_db)
+        return cnxn.execute(query, parameters)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_statement(table: str, fields: Tuple[str, ...], filter_fields: Tuple[str, ...]) -> str:
+        """
+        Returns a statement that selects `fields` from `table`, with a placeholder for each of `filter_fields`.
+        Values are always bound, so each table is only ever queried with a handful of distinct statements.
+        Records come in the order they were inserted, even where the query is answered from an index.
         """
         query = f"SELECT {', '.join(fields)} FROM '{table}'"
-        if filters:
+        if filter_fields:
             conditions = " AND ".join(
                 [
-                    #(f"{field}={value}") for field, value in filters.items()
-                    ("%s=%r" % (field, value)) for field, value in filters.items()
+                    ("%s=?" % field) for field in filter_fields
                 ]
             )
             query += " WHERE " + conditions
-        query += ";"
-        with sqlite3.connect(path_to_db) as cnxn:
-            cnxn.row_factory = sqlite3.Row
-        return cnxn.execute(query)
+        query += " ORDER BY rowid;"
+        return query
 
     def __init__(self) -> None:
         """
@@ -110,6 +186,56 @@ class BaseMorph(abc.ABC):
         """
         self.Stats = self.STATS()
 
+    @classmethod
+    def get_index(
+            cls,
+            table: str,
+            key_field: str,
+            fields: Tuple[str, ...],
+        ) -> Mapping[Any, List[Mapping[str, Any]]]:
+        """
+        Returns the `fields` of each record in `table`, grouped by value of `key_field`.
+        Each index is built from a single query the first time it is requested.
+        """
+        path_to_db = cls.path_to("cleaned_stats.db")
+        artifact = None
+        if cls.data_backend is DataBackend.ARTIFACT:
+            # the data of one artifact may differ from that of another, or of the db;
+            # resolved once, so that an artifact swapped in meanwhile is not indexed under the checksum of this one.
+            artifact = get_artifact()
+            index_key = ((artifact.checksum, path_to_db), table, key_field, fields)
+        else:
+            index_key = (path_to_db, table, key_field, fields)
+        try:
+            return cls._indexes[index_key]
+        except KeyError:
+            pass
+        index: dict[Any, List[Mapping[str, Any]]] = {}
+        resultset = cls.query_db(path_to_db, table, (key_field,) + fields, None, artifact)
+        for record in resultset:
+            record = dict(record)
+            index.setdefault(record.pop(key_field), []).append(record)
+        if artifact is None or artifact is get_artifact():
+            cls._indexes[index_key] = index
+        return index
+
+    @classmethod
+    def clear_indexes(cls) -> None:
+        """
+        Discards all indexes; they are rebuilt on next use.
+        """
+        cls._indexes.clear()
+
+    def get_alias(self, home_table: str, target_table: str, name: str) -> Any:
+        """
+        Returns the alias by which `target_table` refers to `name` from `home_table`, if any.
+        """
+        table_name = f"{home_table}-JOIN-{target_table}"
+        aliases = self.get_index(table_name, "Name", ("Alias",)).get(name)
+        if aliases is None:
+            return None
+        return aliases[0]["Alias"]
+
     def lookup(
             self,
             home_data: Tuple[str, str],
@@ -123,14 +249,7 @@ class BaseMorph(abc.ABC):
         # unpack arguments
         home_table, value_to_lookup = home_data
         target_table, field_to_scan = target_data
-        table_name = f"{home_table}-JOIN-{target_table}"
-        path_to_db = self.path_to("cleaned_stats.db")
-        with sqlite3.connect(path_to_db) as cnxn:
-            #cnxn.row_factory = sqlite3.Row
-            resultset = cnxn.execute("SELECT Alias FROM '%s' WHERE Name=\"%s\"" % (table_name, value_to_lookup))
-            aliased_value = resultset.fetchone()
-            if aliased_value is not None:
-                (aliased_value,) = aliased_value
+        aliased_value = self.get_alias(home_table, target_table, value_to_lookup)
         if aliased_value is None:
             query_kwargs = None
         else:
@@ -146,13 +265,45 @@ class BaseMorph(abc.ABC):
             }
         return query_kwargs
 
+    def lookup_records(
+            self,
+            home_data: Tuple[str, str],
+            target_data: Tuple[str, str],
+            tableindex: int,
+            extra_fields: Tuple[str, ...] = (),
+        ) -> List[dict[str, Any]] | None:
+        """
+        Looks up alias of `home_data` that's recognized by `target_data` and returns
+        the stats (plus `extra_fields`) of the records it refers to, or None if there is no alias.
+        """
+        home_table, value_to_lookup = home_data
+        target_table, field_to_scan = target_data
+        aliased_value = self.get_alias(home_table, target_table, value_to_lookup)
+        if aliased_value is None:
+            return None
+        table = "%s%d" % (target_table, tableindex)
+        fields = self.Stats.STAT_LIST() + extra_fields
+        records = self.get_index(table, field_to_scan, fields).get(aliased_value, [])
+        return [dict(record) for record in records]
+
+@instrumentation.instrument_methods
 class Morph(BaseMorph):
     """
     Represents a Fire Emblem unit from the game associated with `game_no`.
+    Calls to public methods are recorded while instrumentation is on; see `aenir.instrumentation`.
     """
     game_no: int = 0
     #character_list_filter = lambda name: True
     stat_boosters = None
+    # attributes holding reference data that no operation mutates; shared by copies.
+    _shared_attributes: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Registers the public methods declared by the subclass for instrumentation, as those of this class are.
+        """
+        super().__init_subclass__(**kwargs)
+        instrumentation.instrument_methods(cls)
 
     @staticmethod
     def CHARACTERS():
@@ -167,6 +318,14 @@ class Morph(BaseMorph):
         """
         return FireEmblemGame(cls.game_no)
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_character_set(cls) -> frozenset[str]:
+        """
+        Returns `CHARACTERS` as a set, for constant-time lookup; computed once per class.
+        """
+        return frozenset(cls.CHARACTERS())
+
     def __init__(self, name: str, *, which_bases: int, which_growths: int):
         """
         Initializes game, name, base stats, growth rates, max stats, and other variables for containing
@@ -174,8 +333,8 @@ class Morph(BaseMorph):
         """
         super().__init__()
         game = self.GAME()
-        character_list = self.CHARACTERS()
-        if name not in character_list:
+        if name not in self.get_character_set():
+            character_list = self.CHARACTERS()
             raise UnitNotFoundError(
                 f"{name} not found. List of characters from Fire Emblem: {game.formal_name}: {character_list}",
                 unit_list=character_list,
@@ -184,37 +343,26 @@ class Morph(BaseMorph):
         path_to_db = self.path_to("cleaned_stats.db")
         table = "characters__base_stats%d" % which_bases
         fields = self.Stats.STAT_LIST() + ("Class", "Lv")
-        filters = {"Name": name}
-        basestats_query = self.query_db(
-            path_to_db,
-            table,
-            fields,
-            filters,
-        ).fetchone()
-        stat_dict = dict(basestats_query)
+        stat_dict = dict(self.get_index(table, "Name", fields)[name][0])
         current_cls = stat_dict.pop("Class")
         current_lv = stat_dict.pop("Lv")
         # bases
-        current_stats = self.Stats(multiplier=100, **stat_dict)
+        current_stats = self.Stats._from_record(stat_dict)
         # growths
-        resultset = self.query_db(
-            **self.lookup(
-                ("characters__base_stats", name),
-                ("characters__growth_rates", "Name"),
-                which_growths,
-            )
-        ).fetchall()
-        growth_rates = self.Stats(multiplier=1, **resultset.pop(which_growths))
+        resultset = self.lookup_records(
+            ("characters__base_stats", name),
+            ("characters__growth_rates", "Name"),
+            which_growths,
+        )
+        growth_rates = self.Stats._from_record(resultset.pop(which_growths), multiplier=1)
         # maximum
         current_clstype = "characters__base_stats"
-        stat_dict2 = self.query_db(
-            **self.lookup(
-                (current_clstype, name),
-                ("classes__maximum_stats", "Class"),
-                tableindex=0,
-            )
-        ).fetchone()
-        max_stats = self.Stats(**stat_dict2)
+        stat_dict2 = self.lookup_records(
+            (current_clstype, name),
+            ("classes__maximum_stats", "Class"),
+            tableindex=0,
+        )[0]
+        max_stats = self.Stats._from_record(stat_dict2)
         # (miscellany)
         _meta: dict[str, Any] = {"Stat Boosters": []}
         # initialize all attributes here.
@@ -303,44 +451,42 @@ class Morph(BaseMorph):
         # cap stats
         self.current_stats.imin(self.max_stats)
 
-    def _get_promo_query_kwargs(self) -> Mapping[str, Any] | None:
+    def _get_promotion_records(self) -> List[dict[str, Any]] | None:
         """
-        Gets data to use to query for promotion, including list of classes to promote to.
+        Gets promotion data, including list of classes to promote to.
         """
         value_to_lookup = {
             "characters__base_stats": self.name,
             "classes__promotion_gains": self.current_cls,
         }[self.current_clstype]
-        query_kwargs = self.lookup(
+        records = self.lookup_records(
             (self.current_clstype, value_to_lookup),
             ("classes__promotion_gains", "Class"),
             tableindex=0,
+            extra_fields=("Promotion",),
         )
-        return query_kwargs
+        return records
 
     def get_promotion_list(self) -> List[str]:
         """
         Gets a list of classes a unit can promote to.
         """
-        query_kwargs = self._get_promo_query_kwargs()
-        if query_kwargs is None:
+        resultset = self._get_promotion_records()
+        if resultset is None:
             return []
-        query_kwargs['fields'] += ("Promotion",)
-        resultset = self.query_db(**query_kwargs).fetchall()
         return [result["Promotion"] for result in resultset]
 
-    def promote(self, *, promo_cls=None) -> None:
+    def promote(self, *, promo_cls: str | None = None) -> None:
         """
         Changes unit class and boosts stats among other parameters, given the right conditions are met.
         """
-        query_kwargs = self._get_promo_query_kwargs()
+        resultset = self._get_promotion_records()
         # quit if resultset is empty
-        if query_kwargs is None:
+        if resultset is None:
             raise PromotionError(
                 f"{self.name} has no available promotions.",
                 reason=PromotionError.Reason.NO_PROMOTIONS,
             )
-        query_kwargs['fields'] += ("Promotion",)
         # check if unit's level is high enough to enable promotion
         if self.min_promo_level is None:
             self._set_min_promo_level()
@@ -351,8 +497,6 @@ class Morph(BaseMorph):
                 reason=PromotionError.Reason.LEVEL_TOO_LOW,
                 min_promo_level=self.min_promo_level,
             )
-        # get promotion data
-        resultset = self.query_db(**query_kwargs).fetchall()
         # if resultset has length > 1, filter to relevant
         if len(resultset) > 1:
             if promo_cls is not None:
@@ -382,16 +526,15 @@ class Morph(BaseMorph):
         # ! change class
         self.current_cls = stat_dict.pop('Promotion')
         # ! increment stats
-        promo_bonuses = self.Stats(**stat_dict)
+        promo_bonuses = self.Stats._from_record(stat_dict)
         self.current_stats += promo_bonuses
         # ! set max stats, then cap current stats
-        query_kwargs2 = self.lookup(
+        stat_dict2 = self.lookup_records(
             (self.current_clstype, self.current_cls),
             ("classes__maximum_stats", "Class"),
             tableindex=0,
         )
-        stat_dict2 = self.query_db(**query_kwargs2).fetchall()
-        self.max_stats = self.Stats(**stat_dict2.pop())
+        self.max_stats = self.Stats._from_record(stat_dict2.pop())
         self.current_stats.imin(self.max_stats)
         # ! reset level
         self.current_lv = 1
@@ -405,7 +548,7 @@ class Morph(BaseMorph):
         Boosts stats in accordance with item specified; appends record to `_meta`.
         """
         item_bonus_dict = self.stat_boosters
-        increment = self.Stats(**self.Stats.get_stat_dict(0))
+        increment = self.Stats._from_record(self.Stats.get_stat_dict(0))
         if item_name not in item_bonus_dict:
             raise StatBoosterError(
                 f"'{item_name}' is not a valid stat booster. Valid stat boosters: {list(item_bonus_dict.keys())}",
@@ -428,34 +571,48 @@ class Morph(BaseMorph):
     def copy(self) -> Self:
         """
         Returns copy of self; for preview purposes.
+        Copies mutable state only; attributes in `_shared_attributes` are shared with the copy.
+        """
+        morph_copy = object.__new__(self.__class__)
+        shared_attributes = self._shared_attributes
+        morph_copy.__dict__.update(
+            (attr, (value if attr in shared_attributes else self._copy_value(value)))
+            for attr, value in self.__dict__.items()
+        )
+        return morph_copy
+
+    @classmethod
+    def _copy_value(cls, value: Any) -> Any:
+        """
+        Returns copy of an attribute-value; Stats objects and containers thereof are copied, all else is shared.
         """
-        return copy.deepcopy(self)
+        if isinstance(value, AbstractStats):
+            stats_copy = value.copy()
+            stats_copy.has_been_augmented = value.has_been_augmented
+            return stats_copy
+        if isinstance(value, dict):
+            return {key: cls._copy_value(subvalue) for key, subvalue in value.items()}
+        if isinstance(value, list):
+            return [cls._copy_value(subvalue) for subvalue in value]
+        # str, int, bool, None, enum members, classes, and tuples thereof
+        return value
 
     def get_promotion_item(self) -> str | None:
         """
         Returns name of item used to promote, if applicable.
         """
         val_field = "Item"
-        path_to_db = self.path_to("cleaned_stats.db")
         table = "characters__base_stats-JOIN-promotion_items"
-        fields = [val_field]
         #unitcls_as_key = self.promo_cls or self.current_cls
-        filters = {
-            "Name": {
-                "characters__base_stats": self.name,
-                "classes__promotion_gains": self.current_cls,
-            }[self.current_clstype]
-        }
-        record = self.query_db(
-            path_to_db,
-            table,
-            fields,
-            filters,
-        ).fetchone()
-        if record is None:
+        name = {
+            "characters__base_stats": self.name,
+            "classes__promotion_gains": self.current_cls,
+        }[self.current_clstype]
+        records = self.get_index(table, "Name", (val_field,)).get(name)
+        if records is None:
             promotion_item = None
         else:
-            promotion_item = record[val_field]
+            promotion_item = records[0][val_field]
         return promotion_item
 
     @property
@@ -588,6 +745,19 @@ class Morph4(Morph):
         """
         return 7
 
+    @classmethod
+    def _get_kid_record(cls, table: str, name: str, father: str, extra_fields: Tuple[str, ...] = ()) -> dict[str, Any]:
+        """
+        Returns the stats (plus `extra_fields`) that `table` lists for the child `name` of `father`.
+        """
+        fields = cls.STATS().STAT_LIST() + extra_fields + ("Father",)
+        for record in cls.get_index(table, "Name", fields)[name]:
+            if record["Father"] == father:
+                record = dict(record)
+                record.pop("Father")
+                return record
+        raise KeyError((name, father))
+
     def __init__(self, name: str, *, father: str | None = None):
         """
         Implements creation of kids with variable stats, in addition to normal units.
@@ -624,44 +794,24 @@ class Morph4(Morph):
             Stats = self.STATS()
             game = self.GAME()
             # begin query
-            path_to_db = self.path_to("cleaned_stats.db")
-            table = "characters__base_stats1"
-            fields = Stats.STAT_LIST() + ("Class", "Lv")
-            filters = {"Name": name, "Father": father_}
             self.Stats = Stats
-            stat_dict = dict(
-                self.query_db(
-                    path_to_db,
-                    table,
-                    fields,
-                    filters,
-                ).fetchone()
-            )
+            stat_dict = self._get_kid_record("characters__base_stats1", name, father_, ("Class", "Lv"))
             # class and level
             current_cls = stat_dict.pop("Class")
             current_lv = stat_dict.pop("Lv")
             # bases
-            current_stats = Stats(**stat_dict)
+            current_stats = Stats._from_record(stat_dict)
             # growths
-            stat_dict2 = dict(
-                self.query_db(
-                    path_to_db,
-                    table="characters__growth_rates1",
-                    fields=Stats.STAT_LIST(),
-                    filters={"Name": name, "Father": father_},
-                ).fetchone()
-            )
-            growth_rates = Stats(multiplier=1, **stat_dict2)
+            stat_dict2 = self._get_kid_record("characters__growth_rates1", name, father_)
+            growth_rates = Stats._from_record(stat_dict2, multiplier=1)
             # maximum
             current_clstype = "characters__base_stats"
-            stat_dict3 = self.query_db(
-                **self.lookup(
-                    (current_clstype, name),
-                    ("classes__maximum_stats", "Class"),
-                    tableindex=0,
-                )
-            ).fetchone()
-            max_stats = Stats(**stat_dict3)
+            stat_dict3 = self.lookup_records(
+                (current_clstype, name),
+                ("classes__maximum_stats", "Class"),
+                tableindex=0,
+            )[0]
+            max_stats = Stats._from_record(stat_dict3)
             # (miscellany)
             #self._meta = {'History': [], "Father": father}
             _meta = {'History': []}
@@ -680,12 +830,7 @@ class Morph4(Morph):
         except KeyError:
             promo_cls = None
         _meta["Stat Boosters"] = None
-        table_name = "characters__base_stats-JOIN-classes__promotion_gains"
-        path_to_db = self.path_to("cleaned_stats.db")
-        with sqlite3.connect(path_to_db) as cnxn:
-            #cnxn.row_factory = sqlite3.Row
-            resultset = cnxn.execute("SELECT Alias FROM '%s' WHERE Name='%s';" % (table_name, name))
-            can_promote = resultset.fetchone()[0] is not None
+        can_promote = self.get_alias("characters__base_stats", "classes__promotion_gains", name) is not None
         if can_promote:
             max_level = 20
         else:
@@ -768,7 +913,7 @@ class Morph4(Morph):
             promotion_item = "*Promote at Base*"
         return promotion_item
 
-    def promote(self, *, promo_cls=None) -> None:
+    def promote(self, *, promo_cls: str | None = None) -> None:
         """
         Promotes unit and resets max level and current level to original.
         """
@@ -794,6 +939,7 @@ class Morph5(Morph):
         "Body Ring": ("Con", 3),
         "Leg Ring": ("Mov", 2),
     }
+    _shared_attributes = ("scroll_dict",)
 
     @staticmethod
     def CHARACTERS():
@@ -943,7 +1089,7 @@ class Morph5(Morph):
             min_promo_level = 1
         self.min_promo_level = min_promo_level
 
-    def promote(self, *, promo_cls=None) -> None:
+    def promote(self, *, promo_cls: str | None = None) -> None:
         """
         Provides logic for promotion of Lara and other thieves in addition to usual units.
         """
@@ -959,7 +1105,7 @@ class Morph5(Morph):
                 reason=PromotionError.Reason.NO_PROMOTIONS,
             )
         super().promote(promo_cls=promo_cls)
-        self.current_stats.imax(self.Stats(**self.Stats.get_stat_dict(0)))
+        self.current_stats.imax(self.Stats._from_record(self.Stats.get_stat_dict(0)))
         self.min_promo_level = None
 
     def _apply_scroll_bonuses(self) -> None:
@@ -969,10 +1115,10 @@ class Morph5(Morph):
         self.growth_rates = self._og_growth_rates.copy()
         for bonus in self.equipped_scrolls.values():
             self.growth_rates += bonus
-        self.growth_rates.imax(self.Stats(**self.Stats.get_stat_dict(0)))
+        self.growth_rates.imax(self.Stats._from_record(self.Stats.get_stat_dict(0)))
         self.growth_rates.has_been_augmented = bool(self.equipped_scrolls)
 
-    def set_scrolls(self, scrolls):
+    def set_scrolls(self, scrolls: Iterable[str]) -> None:
         """
         Enables user to equip scrolls en masse.
         """
@@ -991,7 +1137,7 @@ class Morph5(Morph):
                 reason=ScrollError.Reason.NOT_FOUND,
                 valid_scrolls=valid_scrolls,
             )
-        self.equipped_scrolls = {scroll_name: self.Stats(multiplier=1, **self.scroll_dict[scroll_name]) for scroll_name in scrolls}
+        self.equipped_scrolls = {scroll_name: self.Stats._from_record(self.scroll_dict[scroll_name], multiplier=1) for scroll_name in scrolls}
         self._apply_scroll_bonuses()
 
     def unequip_scroll(self, scroll_name: str) -> None:
@@ -1017,16 +1163,9 @@ class Morph5(Morph):
         Returns a list of valid scrolls and their corresponding bonuses.
         """
         # get scroll list
-        path_to_db = cls.path_to("cleaned_stats.db")
         table = "scroll_bonuses"
-        stat_list = list(cls.STATS().STAT_LIST())
-        resultset = cls.query_db(
-            path_to_db,
-            table,
-            fields=["Name"] + stat_list,
-            filters={},
-        ).fetchall()
-        scroll_dict = {result["Name"]: {stat: result[stat] for stat in stat_list} for result in resultset}
+        stat_list = cls.STATS().STAT_LIST()
+        scroll_dict = {name: dict(records[0]) for name, records in cls.get_index(table, "Name", stat_list).items()}
         return scroll_dict
 
     def equip_scroll(self, scroll_name: str) -> None:
@@ -1061,7 +1200,7 @@ class Morph5(Morph):
                 valid_scrolls=valid_scrolls,
             )
         stat_dict = scroll_list[scroll_name]
-        self.equipped_scrolls[scroll_name] = self.Stats(multiplier=1, **stat_dict)
+        self.equipped_scrolls[scroll_name] = self.Stats._from_record(stat_dict, multiplier=1)
         self._apply_scroll_bonuses()
 
 class Morph6(Morph):
@@ -1255,7 +1394,7 @@ class Morph6(Morph):
             stat_dict = self.Stats.get_stat_dict(-1 * number_of_declines)
             stat_dict["Mov"] = 0
             stat_dict["Con"] = 0
-            decrement = self.Stats(**stat_dict)
+            decrement = self.Stats._from_record(stat_dict)
             self.current_stats += decrement
         # set instance attributes
         self._meta["Hard Mode"] = hard_mode
@@ -1466,7 +1605,7 @@ class Morph6(Morph):
             )
         stat_dict = self.current_stats.as_dict()
         stat_dict.update(stat_bonus)
-        self.current_stats = self.Stats(**stat_dict, multiplier=1)
+        self.current_stats = self.Stats._from_record(stat_dict, multiplier=1)
 
     @property
     def inventory_size(self) -> int:
@@ -1754,7 +1893,7 @@ class Morph7(Morph):
         num_levels = 5
         for stat, value in hard_mode_bonus.items():
             stat_dict[stat] += value * num_levels
-        self.current_stats = self.Stats(**stat_dict, multiplier=1)
+        self.current_stats = self.Stats._from_record(stat_dict, multiplier=1)
 
     def _set_min_promo_level(self) -> None:
         """
@@ -1786,7 +1925,7 @@ class Morph7(Morph):
         # save copy of original stats.
         self._og_growth_rates = self.growth_rates.copy()
         # increment
-        growths_increment = self.Stats(multiplier=1, **self.Stats.get_stat_dict(5))
+        growths_increment = self.Stats._from_record(self.Stats.get_stat_dict(5), multiplier=1)
         growths_increment.Mov = 0
         growths_increment.Con = 0
         self.growth_rates += growths_increment
@@ -1912,7 +2051,7 @@ class Morph8(Morph):
         else:
             self.max_level = 20
 
-    def promote(self, *, promo_cls=None) -> None:
+    def promote(self, *, promo_cls: str | None = None) -> None:
         """
         Promotes, then sets max_level to None so that it may be recalculated.
         """
@@ -1933,7 +2072,7 @@ class Morph8(Morph):
         # save copy of original stats.
         self._og_growth_rates = self.growth_rates.copy()
         # increment
-        growths_increment = self.Stats(multiplier=1, **self.Stats.get_stat_dict(5))
+        growths_increment = self.Stats._from_record(self.Stats.get_stat_dict(5), multiplier=1)
         growths_increment.Mov = 0
         growths_increment.Con = 0
         self.growth_rates += growths_increment
@@ -1957,6 +2096,7 @@ class Morph9(Morph):
         "Boots": ("Mov", 2),
         "Body Ring": ("Con", 3),
     }
+    _shared_attributes = ("band_dict",)
 
     @staticmethod
     def CHARACTERS():
@@ -2215,16 +2355,9 @@ class Morph9(Morph):
         """
         Returns a list of valid scrolls.
         """
-        path_to_db = cls.path_to("cleaned_stats.db")
         table = "band_growths"
-        stat_list = list(cls.STATS().STAT_LIST())
-        resultset = cls.query_db(
-            path_to_db,
-            table,
-            fields=["Name"] + stat_list,
-            filters={},
-        ).fetchall()
-        band_dict = {result["Name"]: {stat: result[stat] for stat in stat_list} for result in resultset}
+        stat_list = cls.STATS().STAT_LIST()
+        band_dict = {name: dict(records[0]) for name, records in cls.get_index(table, "Name", stat_list).items()}
         return band_dict
 
     def equip_band(self, band_name: str) -> None:
@@ -2256,7 +2389,7 @@ class Morph9(Morph):
                 valid_bands=valid_bands,
             )
         stat_dict = band_list[band_name]
-        self.equipped_bands[band_name] = self.Stats(multiplier=1, **stat_dict)
+        self.equipped_bands[band_name] = self.Stats._from_record(stat_dict, multiplier=1)
         self._apply_band_bonuses()
 
     def unequip_band(self, band_name: str) -> None:
@@ -2283,7 +2416,7 @@ class Morph9(Morph):
         stat_dict = self.Stats.get_stat_dict(0)
         stat_dict['Spd'] = 30
         # set to list of bands
-        self.equipped_bands[band_name] = self.Stats(multiplier=1, **stat_dict)
+        self.equipped_bands[band_name] = self.Stats._from_record(stat_dict, multiplier=1)
 
     def equip_knight_ward(self) -> None:
         """
@@ -2362,7 +2495,7 @@ class Morph9(Morph):
             except KnightWardError as err:
                 raise err
 
-    def set_bands(self, bands):
+    def set_bands(self, bands: Iterable[str]) -> None:
         """
         Enables user to equip bands en masse.
         """
@@ -2402,7 +2535,7 @@ class Morph9(Morph):
         except DemiBandError as err:
             self.equipped_bands = equipped_bands
             raise err
-        self.equipped_bands.update({band_name: self.Stats(multiplier=1, **self.band_dict[band_name]) for band_name in bands})
+        self.equipped_bands.update({band_name: self.Stats._from_record(self.band_dict[band_name], multiplier=1) for band_name in bands})
         self._apply_band_bonuses()
 
     def transform(self):
@@ -2466,10 +2599,10 @@ class Morph9(Morph):
         max_statdict = statdict0.copy()
         max_statdict.update(maxes)
         # update attributes
-        self.max_stats = self.Stats(multiplier=100, **max_statdict)
+        self.max_stats = self.Stats._from_record(max_statdict)
         bonus_statdict = statdict0.copy()
         bonus_statdict.update(bonus)
-        self.current_stats += self.Stats(multiplier=100, **bonus_statdict)
+        self.current_stats += self.Stats._from_record(bonus_statdict)
         self.cls_to_transform_to, self.current_cls = self.current_cls, self.cls_to_transform_to
         self.is_transformed = True
 
@@ -2542,10 +2675,10 @@ class Morph9(Morph):
         max_statdict = statdict0.copy()
         max_statdict.update(maxes)
         # update attributes
-        self.max_stats = self.Stats(multiplier=100, **max_statdict)
+        self.max_stats = self.Stats._from_record(max_statdict)
         bonus_statdict = statdict0.copy()
         bonus_statdict.update(bonus)
-        self.current_stats += self.Stats(multiplier=-100, **bonus_statdict)
+        self.current_stats += self.Stats._from_record(bonus_statdict, multiplier=-100)
         self.cls_to_transform_to, self.current_cls = self.current_cls, self.cls_to_transform_to
         self.is_transformed = False
 
@@ -2628,13 +2761,13 @@ class Morph9(Morph):
         max_statdict = statdict0.copy()
         max_statdict.update(maxes)
         # update attributes
-        self.max_stats = self.Stats(multiplier=100, **max_statdict)
+        self.max_stats = self.Stats._from_record(max_statdict)
         bonus_statdict = statdict0.copy()
         bonus_statdict.update(bonus)
-        self.current_stats += self.Stats(multiplier=100, **bonus_statdict)
+        self.current_stats += self.Stats._from_record(bonus_statdict)
         self.cls_to_transform_to, self.current_cls = self.current_cls, self.cls_to_transform_to
         self.is_transformed = True
-        self.equipped_bands["Demi Band"] = self.Stats(**self.Stats.get_stat_dict(0))
+        self.equipped_bands["Demi Band"] = self.Stats._from_record(self.Stats.get_stat_dict(0))
 
     def unequip_demi_band(self):
         """
@@ -2704,10 +2837,10 @@ class Morph9(Morph):
         max_statdict = statdict0.copy()
         max_statdict.update(maxes)
         # update attributes
-        self.max_stats = self.Stats(multiplier=100, **max_statdict)
+        self.max_stats = self.Stats._from_record(max_statdict)
         bonus_statdict = statdict0.copy()
         bonus_statdict.update(bonus)
-        self.current_stats += self.Stats(multiplier=-100, **bonus_statdict)
+        self.current_stats += self.Stats._from_record(bonus_statdict, multiplier=-100)
         self.cls_to_transform_to, self.current_cls = self.current_cls, self.cls_to_transform_to
         self.is_transformed = False
         self.equipped_bands.pop("Demi Band")
@@ -2730,6 +2863,83 @@ def get_morph(game_no: int, name: str, **kwargs) -> Morph:
     morph = morph_cls(name, **kwargs)
     return morph
 
+class UnitSpec(NamedTuple):
+    """
+    Identifies a unit to be instantiated: its name and any extra initialization parameters.
+    """
+    name: str
+    kwargs: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def parse(cls, spec: Any) -> "UnitSpec":
+        """
+        Returns UnitSpec from a UnitSpec, a name, a (name, kwargs) pair, or a mapping of the form {"name": name, **kwargs}.
+        """
+        if isinstance(spec, UnitSpec):
+            return spec
+        if isinstance(spec, str):
+            return cls(spec)
+        if isinstance(spec, Mapping):
+            kwargs = dict(spec)
+            name = kwargs.pop("name")
+        else:
+            name, kwargs = spec
+        return cls(name, tuple(sorted(kwargs.items())))
+
+    def create_morph(self, morph_cls: type) -> "Morph":
+        """
+        Returns a new instance of `morph_cls` for this unit;
+        throws PlanError if the unit has initialization parameters that `morph_cls` does not accept.
+        """
+        # imported here, since `inspect` takes longer to import than this module.
+        from aenir._arguments import (
+            check_arguments,
+            get_signature,
+        )
+        kwargs = dict(self.kwargs)
+        try:
+            check_arguments(get_signature(morph_cls, "__init__", morph_cls), self.name, **kwargs)
+        except TypeError as err:
+            raise PlanError(
+                f"Invalid initialization parameters for '{self.name}': {err}",
+                reason=PlanError.Reason.INVALID_ARGUMENTS,
+                operation=self,
+            ) from None
+        return morph_cls(self.name, **kwargs)
+
+class Roster(NamedTuple):
+    """
+    The Morphs built by `get_roster`, in the order of their specs (None for units that could not be built),
+    and the errors raised for those units, with the spec of each (as given, if it could not be parsed).
+    """
+    morphs: List[Morph | None]
+    errors: List[Tuple[Any, BaseException]]
+
+def get_roster(game_no: int, specs: Iterable[Any]) -> Roster:
+    """
+    Instantiates a Morph for each of `specs` (see `UnitSpec.parse`) without aborting upon invalid units.
+    Per-game data is shared by the whole batch: each table is read once, in full, then looked up by name.
+    """
+    morph_cls = get_morph_class(game_no)
+    morphs = []
+    errors = []
+    for spec in specs:
+        try:
+            try:
+                spec = UnitSpec.parse(spec)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                raise PlanError(
+                    f"Cannot interpret {spec!r} as a unit.",
+                    reason=PlanError.Reason.MALFORMED,
+                    operation=spec,
+                ) from None
+            morphs.append(spec.create_morph(morph_cls))
+        except AenirError as err:
+            morphs.append(None)
+            errors.append((spec, err))
+    logger.debug("Built roster of %d units for FE%d; %d errors.", len(morphs) - len(errors), game_no, len(errors))
+    return Roster(morphs, errors)
+
 def get_morph_class(game_no: int):
     """
     Ergonomic means whereby one may access all Morph classes.
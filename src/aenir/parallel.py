@@ -0,0 +1,140 @@
+"""
+Declares functions that evaluate many plans at once across a pool of worker processes.
+"""
+
+import collections
+import concurrent.futures
+import itertools
+import os
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from aenir.morph import (
+    BaseMorph,
+    get_morph_class,
+)
+from aenir.executor import PlanExecutor
+from aenir.plans import (
+    Plan,
+    PlanResult,
+)
+from aenir._database import (
+    DataBackend,
+    get_artifact,
+)
+from aenir._exceptions import ArtifactError
+from aenir._logging import logger
+
+def _get_artifact_key() -> Tuple[str, str] | None:
+    """
+    Returns the path and checksum of the artifact from which this process reads static data, if it reads from one.
+    """
+    if BaseMorph.data_backend is not DataBackend.ARTIFACT:
+        return None
+    artifact = get_artifact()
+    return artifact.path, artifact.checksum
+
+def _init_worker(game_nos: Tuple[int, ...], artifact_key: Tuple[str, str] | None = None) -> None:
+    """
+    Reads the static data of every game in `game_nos` into memory, once per worker process;
+    or, if the parent process reads static data from an artifact (see `_get_artifact_key`), opens that artifact,
+    so that workers serve the same data as their parent.
+    """
+    if artifact_key is not None:
+        path, checksum = artifact_key
+        artifact = BaseMorph.use_artifact(path)
+        if artifact.checksum != checksum:
+            raise ArtifactError(
+                "'%s' has been replaced since it was loaded by the parent process." % path,
+                ArtifactError.Reason.CHECKSUM_MISMATCH,
+                path=path,
+            )
+        return
+    BaseMorph.data_backend = DataBackend.PRELOADED
+    for game_no in game_nos:
+        try:
+            morph_cls = get_morph_class(game_no)
+        except NotImplementedError:
+            # reported by each plan for this game.
+            continue
+        morph_cls.preload_data()
+
+def _evaluate_chunk(plans: Tuple[Plan, ...]) -> List[PlanResult]:
+    """
+    Evaluates `plans` in order; submitted as one task, so that inter-process overhead is paid per chunk.
+    Plans within a chunk share memoized prefixes.
+    """
+    executor = PlanExecutor()
+    return [executor.evaluate(plan) for plan in plans]
+
+def evaluate_plans(
+    plans: Iterable[Any],
+    *,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+) -> List[PlanResult]:
+    """
+    Evaluates `plans` (see `Plan.parse`) across `max_workers` processes; results are in the order of `plans`.
+    If `max_workers` is 1, plans are evaluated in the current process instead.
+    """
+    plans = [Plan.parse(plan) for plan in plans]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(plans)))
+    if max_workers == 1:
+        return _evaluate_chunk(tuple(plans))
+    if chunksize is None:
+        # several chunks per worker, so that uneven plans even out.
+        chunksize = max(1, -(-len(plans) // (max_workers * 4)))
+    chunks = [tuple(plans[start:start + chunksize]) for start in range(0, len(plans), chunksize)]
+    game_nos = tuple(sorted({plan.game_no for plan in plans}))
+    logger.debug("Evaluating %d plans in %d chunks across %d workers.", len(plans), len(chunks), max_workers)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(game_nos, _get_artifact_key()),
+    ) as executor:
+        results = []
+        for chunk_results in executor.map(_evaluate_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+def iter_evaluate_plans(
+    plans: Iterable[Any],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = 64,
+) -> Iterator[PlanResult]:
+    """
+    As `evaluate_plans`, but yields results in the order of `plans` as soon as they are ready; `plans` is consumed
+    lazily, with a few chunks per worker in flight at a time, so that it may be endless (e.g. lines of a pipe).
+    Static data is read by each worker upon first use, as the games of `plans` are not known in advance.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    plans = map(Plan.parse, plans)
+    if max_workers <= 1:
+        executor = PlanExecutor()
+        for plan in plans:
+            yield executor.evaluate(plan)
+        return
+    max_in_flight = max_workers * 2
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=((), _get_artifact_key()),
+    ) as executor:
+        in_flight: collections.deque[concurrent.futures.Future] = collections.deque()
+        while True:
+            chunk = tuple(itertools.islice(plans, chunksize))
+            if chunk:
+                in_flight.append(executor.submit(_evaluate_chunk, chunk))
+            if not in_flight:
+                break
+            if len(in_flight) >= max_in_flight or not chunk:
+                yield from in_flight.popleft().result()
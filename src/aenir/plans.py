@@ -0,0 +1,225 @@
+"""
+Declares plans: sequences of operations to be performed on a Morph.
+"""
+
+from typing import (
+    Any,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Tuple,
+)
+
+from aenir.morph import (
+    Morph,
+    UnitSpec,
+    get_morph_class,
+)
+from aenir._arguments import (
+    check_arguments,
+    get_signature,
+)
+from aenir._exceptions import (
+    AenirError,
+    PlanError,
+)
+
+# methods of Morph (and its subclasses) that may be called from a plan.
+OPERATIONS = (
+    "level_up",
+    "promote",
+    "use_stat_booster",
+    "equip_scroll",
+    "unequip_scroll",
+    "set_scrolls",
+    "use_afas_drops",
+    "use_metiss_tome",
+    "equip_band",
+    "unequip_band",
+    "set_bands",
+    "equip_knight_ward",
+    "unequip_knight_ward",
+    "transform",
+    "revert",
+    "equip_demi_band",
+    "unequip_demi_band",
+)
+
+# errors that fail a single plan, rather than a batch of them.
+# NotImplementedError: unsupported game or operation.
+PLAN_ERRORS = (AenirError, NotImplementedError)
+
+class Operation(NamedTuple):
+    """
+    A call to one of the `OPERATIONS`; hashable, so that plans may be used as keys.
+    """
+    name: str
+    kwargs: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def of(cls, name: str, **kwargs) -> "Operation":
+        """
+        Returns Operation that calls `name` with `kwargs`; list-values are converted to tuples.
+        """
+        items = tuple(
+            (key, (tuple(value) if isinstance(value, list) else value))
+            for key, value in sorted(kwargs.items())
+        )
+        return cls(name, items)
+
+    @classmethod
+    def parse(cls, operation: Any) -> "Operation":
+        """
+        Returns Operation from an Operation, a name, or a mapping of the form {"op": name, **kwargs}.
+        """
+        if isinstance(operation, Operation):
+            return operation
+        if isinstance(operation, str):
+            return cls.of(operation)
+        if isinstance(operation, Mapping) and isinstance(operation.get("op"), str):
+            kwargs = dict(operation)
+            return cls.of(kwargs.pop("op"), **kwargs)
+        raise PlanError(
+            f"Cannot interpret {operation!r} as an operation.",
+            reason=PlanError.Reason.MALFORMED,
+            operation=operation,
+            valid_operations=OPERATIONS,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns operation in the form accepted by `parse`.
+        """
+        return {"op": self.name, **dict(self.kwargs)}
+
+def parse_plan(plan: Iterable[Any]) -> Tuple[Operation, ...]:
+    """
+    Returns tuple of Operations from an iterable of anything `Operation.parse` accepts.
+    """
+    return tuple(map(Operation.parse, plan))
+
+def apply_operation(morph: Morph, operation: Operation) -> None:
+    """
+    Performs `operation` on `morph`; throws PlanError if the operation does not apply to `morph`.
+    """
+    method = getattr(morph, operation.name, None) if operation.name in OPERATIONS else None
+    if method is None:
+        valid_operations = tuple(name for name in OPERATIONS if hasattr(morph, name))
+        raise PlanError(
+            f"'{operation.name}' is not a valid operation for {morph.name}. Valid operations: {valid_operations}",
+            reason=PlanError.Reason.UNKNOWN_OPERATION,
+            operation=operation,
+            valid_operations=valid_operations,
+        )
+    kwargs = dict(operation.kwargs)
+    try:
+        check_arguments(get_signature(type(morph), operation.name, method), **kwargs)
+    except TypeError as err:
+        raise PlanError(
+            f"Invalid arguments for '{operation.name}': {err}",
+            reason=PlanError.Reason.INVALID_ARGUMENTS,
+            operation=operation,
+        ) from None
+    method(**kwargs)
+
+def apply_plan(morph: Morph, plan: Iterable[Any]) -> None:
+    """
+    Performs each operation in `plan` on `morph`, in order.
+    """
+    for operation in parse_plan(plan):
+        apply_operation(morph, operation)
+
+class Plan(NamedTuple):
+    """
+    A unit, and the operations to be performed on it; hashable, and cheap to send between processes.
+    """
+    game_no: int
+    unit: UnitSpec
+    operations: Tuple[Operation, ...] = ()
+
+    @classmethod
+    def parse(cls, plan: Any) -> "Plan":
+        """
+        Returns Plan from a Plan, or a mapping of the form {"game_no": int, "unit": spec, "operations": [...]}.
+        """
+        if isinstance(plan, Plan):
+            return plan
+        try:
+            return cls(
+                int(plan["game_no"]),
+                UnitSpec.parse(plan["unit"]),
+                parse_plan(plan.get("operations", ())),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            raise PlanError(
+                f"Cannot interpret {plan!r} as a plan.",
+                reason=PlanError.Reason.MALFORMED,
+                operation=plan,
+            ) from None
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns plan in the form accepted by `parse`.
+        """
+        return {
+            "game_no": self.game_no,
+            "unit": {"name": self.unit.name, **dict(self.unit.kwargs)},
+            "operations": [operation.as_dict() for operation in self.operations],
+        }
+
+    def create_morph(self) -> Morph:
+        """
+        Returns a new Morph for `unit`, before any operations are performed;
+        throws PlanError if `unit` has initialization parameters that its game does not accept.
+        """
+        return self.unit.create_morph(get_morph_class(self.game_no))
+
+class PlanResult(NamedTuple):
+    """
+    The outcome of a plan, as plain values; `error` is the (type, message) of the exception raised, if any.
+    """
+    game_no: int
+    name: str
+    current_cls: str | None = None
+    current_lv: int | None = None
+    current_stats: Tuple[Any, ...] | None = None
+    error: Tuple[str, str] | None = None
+
+    @classmethod
+    def from_morph(cls, game_no: int, morph: Morph) -> "PlanResult":
+        """
+        Returns the class, level and stats of `morph`.
+        """
+        return cls(game_no, morph.name, morph.current_cls, morph.current_lv, tuple(morph.current_stats.as_dict().values()))
+
+    @classmethod
+    def from_error(cls, plan: Plan, err: Exception) -> "PlanResult":
+        """
+        Returns the type and message of `err`, raised while evaluating `plan`.
+        """
+        return cls(plan.game_no, plan.unit.name, error=(type(err).__name__, str(err)))
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns result with stats keyed by name.
+        """
+        result = self._asdict()
+        if self.current_stats is not None:
+            statlist = get_morph_class(self.game_no).STATS().STAT_LIST()
+            result["current_stats"] = dict(zip(statlist, self.current_stats))
+        if self.error is not None:
+            result["error"] = dict(zip(("type", "message"), self.error))
+        return result
+
+def evaluate_plan(plan: Any) -> PlanResult:
+    """
+    Creates the unit of `plan` and performs its operations; errors are reported in the result rather than raised.
+    """
+    plan = Plan.parse(plan)
+    try:
+        morph = plan.create_morph()
+        for operation in plan.operations:
+            apply_operation(morph, operation)
+    except PLAN_ERRORS as err:
+        return PlanResult.from_error(plan, err)
+    return PlanResult.from_morph(plan.game_no, morph)
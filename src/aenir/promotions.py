@@ -0,0 +1,161 @@
+"""
+Declares a search over the ways in which a unit may be promoted: which class, at which level,
+and, for units with several promotions ahead of them, in which order.
+
+Each stat of a unit grows independently of the others, and every operation that a route consists of
+(levelling up, promoting, capping) never lets a lower stat overtake a higher one.
+So, of two routes that leave a unit in the same class with the same history of classes,
+one whose stats are no lower than the other's can be followed alone; the other is pruned.
+"""
+
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Tuple,
+)
+
+from aenir.morph import Morph
+from aenir.plans import Operation
+from aenir._exceptions import (
+    LevelUpError,
+    PromotionError,
+)
+from aenir._logging import logger
+
+class PromotionPath(NamedTuple):
+    """
+    A route to a unit's final stats, and the unit at the end of it.
+    """
+    operations: Tuple[Operation, ...]
+    morph: Morph
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns route as a plan, along with the final class and stats.
+        """
+        return {
+            "operations": [operation.as_dict() for operation in self.operations],
+            "current_cls": self.morph.current_cls,
+            "current_lv": self.morph.current_lv,
+            "current_stats": self.morph.current_stats.as_dict(),
+        }
+
+# a route still being followed, and the values of the stats compared in the search.
+_Branch = Tuple[Tuple[Operation, ...], Morph, Tuple[Any, ...]]
+
+def _get_values(morph: Morph, stats: Tuple[str, ...] | None) -> Tuple[Any, ...]:
+    """
+    Returns the values of `stats` of `morph`, or of every stat if `stats` is None.
+    """
+    stat_dict = morph.current_stats.as_dict()
+    if stats is None:
+        return tuple(stat_dict.values())
+    return tuple(stat_dict[stat] for stat in stats)
+
+def _add_to_front(front: List[_Branch], branch: _Branch) -> None:
+    """
+    Adds `branch` to the Pareto front `front` unless another is no worse in every stat;
+    removes whatever `branch` is no worse than.
+    """
+    values = branch[2]
+    for _, _, other_values in front:
+        if all(other >= value for other, value in zip(other_values, values)):
+            return
+    front[:] = [
+        other_branch
+        for other_branch in front
+        if not all(value >= other for value, other in zip(values, other_branch[2]))
+    ]
+    front.append(branch)
+
+def _level_up_to_max(morph: Morph) -> int:
+    """
+    Levels `morph` up one level at a time until its maximum; returns the number of levels gained.
+    """
+    num_levels = 0
+    while True:
+        try:
+            morph.level_up(1)
+        except LevelUpError:
+            return num_levels
+        num_levels += 1
+
+def _with_levels(operations: Tuple[Operation, ...], num_levels: int) -> Tuple[Operation, ...]:
+    """
+    Returns `operations` followed by a level-up of `num_levels`, if any.
+    """
+    if not num_levels:
+        return operations
+    return operations + (Operation.of("level_up", num_levels=num_levels),)
+
+def _get_promotions(branch: _Branch, stats: Tuple[str, ...] | None) -> Iterable[_Branch]:
+    """
+    Yields a branch for each promotion available to the unit of `branch`, at each level it may be performed.
+    """
+    operations, morph, _ = branch
+    for promo_cls in morph.get_promotion_list():
+        # declared ahead of time, as some units' minimum promotion level depends on it.
+        probe = morph.copy()
+        probe.promo_cls = promo_cls
+        num_levels = 0
+        while True:
+            promoted_morph = probe.copy()
+            try:
+                promoted_morph.promote(promo_cls=promo_cls)
+            except PromotionError as err:
+                if err.reason != PromotionError.Reason.LEVEL_TOO_LOW:
+                    break
+            else:
+                promoted_operations = _with_levels(operations, num_levels) + (
+                    Operation.of("promote", promo_cls=promo_cls),
+                )
+                yield promoted_operations, promoted_morph, _get_values(promoted_morph, stats)
+            try:
+                probe.level_up(1)
+            except LevelUpError:
+                break
+            num_levels += 1
+
+def search_promotion_paths(morph: Morph, *, stats: Iterable[str] | None = None) -> List[PromotionPath]:
+    """
+    Returns the Pareto-optimal routes by which `morph` may be promoted, each ending at the maximum level.
+    If `stats` is given, only those stats are compared. Routes with identical stats are reported once.
+    Routes that stop short of the last promotion are considered too. `morph` is left unchanged.
+    """
+    if stats is not None:
+        stats = tuple(stats)
+    branches: List[_Branch] = [((), morph.copy(), ())]
+    final_front: List[_Branch] = []
+    num_branches = 0
+    while branches:
+        num_branches += len(branches)
+        fronts: dict[Tuple[Any, ...], List[_Branch]] = {}
+        for branch in branches:
+            operations, branch_morph, _ = branch
+            final_morph = branch_morph.copy()
+            num_levels = _level_up_to_max(final_morph)
+            _add_to_front(final_front, (_with_levels(operations, num_levels), final_morph, _get_values(final_morph, stats)))
+            for promoted_branch in _get_promotions(branch, stats):
+                promoted_morph = promoted_branch[1]
+                state = (
+                    promoted_morph.current_cls,
+                    promoted_morph.current_lv,
+                    tuple(cls for _, cls in promoted_morph.history),
+                )
+                _add_to_front(fronts.setdefault(state, []), promoted_branch)
+        branches = [branch for front in fronts.values() for branch in front]
+    logger.debug("Searched %d branches for %s; %d are Pareto-optimal.", num_branches, morph.name, len(final_front))
+    return [PromotionPath(operations, final_morph) for operations, final_morph, _ in final_front]
+
+def rank_promotion_paths(paths: Iterable[PromotionPath], weights: Mapping[str, float]) -> List[PromotionPath]:
+    """
+    Returns `paths` sorted by the weighted sum of their final stats, best first.
+    """
+    def score(path: PromotionPath) -> float:
+        stat_dict = path.morph.current_stats.as_dict()
+        return sum(weight * stat_dict[stat] for stat, weight in weights.items())
+
+    return sorted(paths, key=score, reverse=True)
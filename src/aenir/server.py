@@ -0,0 +1,594 @@
+"""
+Declares an HTTP server that keeps Morphs in memory between requests, built on asyncio and the standard library.
+
+Each session holds one Morph; sessions are evicted least recently used first once there are too many.
+Operations on a Morph are performed in a bounded pool of threads, so that the event loop is free to accept requests;
+requests beyond what the pool can queue are turned away with 503. The latency of each endpoint is kept in a histogram.
+
+Endpoints (bodies and responses are JSON):
+    POST   /sessions                     {"game_no": 6, "unit": "Roy" | {"name": ..., **kwargs}}
+    GET    /sessions/{id}
+    DELETE /sessions/{id}
+    POST   /sessions/{id}/level_up       {"num_levels": 10}
+    POST   /sessions/{id}/promote        {"promo_cls": ...} (optional)
+    POST   /sessions/{id}/boost          {"item_name": "Energy Ring"}
+    POST   /sessions/{id}/equip          {"item_name": "Odo"} (a scroll, band or the Knight Ward)
+    POST   /sessions/{id}/transform
+    POST   /compare                      {"sessions": [id, other_id]}
+    GET    /metrics
+    GET    /health
+
+Usage: python -m aenir.server [--host HOST] [--port PORT] [--max-sessions N] [--workers N] [--artifact FILE]
+                              [--log-file FILE] [--log-level LEVEL]
+"""
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import json
+import signal
+import sys
+import time
+import uuid
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    Tuple,
+)
+
+from aenir.instrumentation import LatencyHistogram
+from aenir.morph import (
+    BaseMorph,
+    Morph,
+    Morph5,
+    Morph9,
+    UnitSpec,
+    get_morph_class,
+)
+from aenir.plans import (
+    Operation,
+    apply_operation,
+)
+from aenir._database import (
+    DataBackend,
+    get_artifact,
+)
+from aenir._exceptions import (
+    AenirError,
+    UnitNotFoundError,
+)
+from aenir._logging import (
+    configure_production_logging,
+    logger,
+)
+
+# bodies larger than this are refused.
+MAX_BODY_SIZE = 1 << 20
+
+# requests with more header lines than this are refused; lines longer than the limit of the stream reader are too.
+MAX_HEADERS = 100
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+class HTTPError(Exception):
+    """
+    To be raised by a handler so that the client receives `status` and `message`.
+    """
+
+    def __init__(self, status: int, message: str, **details: Any) -> None:
+        """
+        Declares `status` and any `details` to report alongside `message`.
+        """
+        super().__init__(message)
+        self.status = status
+        self.details = details
+
+class Session:
+    """
+    A Morph, and a lock under which it is replaced by the result of an operation, one request at a time.
+    """
+
+    def __init__(self, session_id: str, game_no: int, morph: Morph) -> None:
+        """
+        Declares the Morph of the session identified by `session_id`.
+        """
+        self.session_id = session_id
+        self.game_no = game_no
+        self.morph = morph
+        self.lock = asyncio.Lock()
+
+class SessionStore:
+    """
+    Holds at most `maxsize` sessions, evicting the least recently used.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Declares an empty store.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self._sessions: collections.OrderedDict[str, Session] = collections.OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of sessions held.
+        """
+        return len(self._sessions)
+
+    def add(self, game_no: int, morph: Morph) -> Session:
+        """
+        Returns a new session for `morph`, evicting the least recently used sessions over `maxsize`.
+        """
+        session = Session(uuid.uuid4().hex, game_no, morph)
+        self._sessions[session.session_id] = session
+        while len(self._sessions) > self.maxsize:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self.evictions += 1
+            logger.debug("Evicted session '%s'.", evicted_id)
+        return session
+
+    def get(self, session_id: str) -> Session:
+        """
+        Returns the session identified by `session_id`, marking it as recently used; throws HTTPError if there is none.
+        """
+        try:
+            session = self._sessions[session_id]
+        except KeyError:
+            raise HTTPError(404, f"No such session: '{session_id}'.", session_id=session_id) from None
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def remove(self, session_id: str) -> None:
+        """
+        Forgets the session identified by `session_id`; throws HTTPError if there is none.
+        """
+        if self._sessions.pop(session_id, None) is None:
+            raise HTTPError(404, f"No such session: '{session_id}'.", session_id=session_id)
+
+def describe_morph(morph: Morph) -> dict[str, Any]:
+    """
+    Returns the state of `morph` as plain values; stats are in hundredths, as elsewhere.
+    """
+    description = {
+        "game_no": morph.game.value,
+        "name": morph.name,
+        "current_cls": morph.current_cls,
+        "current_lv": morph.current_lv,
+        "max_level": morph.max_level,
+        "current_stats": morph.current_stats.as_dict(),
+        "growth_rates": morph.growth_rates.as_dict(),
+        "max_stats": morph.max_stats.as_dict(),
+        "promotions": morph.get_promotion_list(),
+        "history": [list(entry) for entry in morph.history],
+    }
+    for attr in ("equipped_scrolls", "equipped_bands"):
+        if hasattr(morph, attr):
+            description["equipped"] = list(getattr(morph, attr))
+    if getattr(morph, "is_transformed", None) is not None:
+        description["is_transformed"] = morph.is_transformed
+    return description
+
+def _get_equip_operation(morph: Morph, item_name: Any) -> Operation:
+    """
+    Returns the operation that equips `item_name`: a scroll in FE5, a band (or the Knight Ward) in FE9.
+    """
+    if isinstance(morph, Morph5):
+        return Operation.of("equip_scroll", scroll_name=item_name)
+    if isinstance(morph, Morph9):
+        if item_name == "Knight Ward":
+            return Operation.of("equip_knight_ward")
+        if item_name == "Demi Band":
+            return Operation.of("equip_demi_band")
+        return Operation.of("equip_band", band_name=item_name)
+    raise HTTPError(400, f"Units from {morph.game.formal_name} do not equip growth items.")
+
+def _get_operation(morph: Morph, action: str, body: Mapping[str, Any]) -> Operation:
+    """
+    Returns the operation that `action` (the last segment of the path) performs with `body`.
+    """
+    if action == "equip":
+        return _get_equip_operation(morph, body.get("item_name"))
+    name = {"boost": "use_stat_booster"}.get(action, action)
+    return Operation.of(name, **body)
+
+def _error_payload(err: BaseException) -> dict[str, Any]:
+    """
+    Returns the type and message of `err`, and its reason if it has one.
+    """
+    payload: dict[str, Any] = {"error": type(err).__name__, "message": str(err)}
+    reason = getattr(err, "reason", None)
+    if reason is not None:
+        payload["reason"] = reason.name
+    return payload
+
+# (method, path segments) -> endpoint name; "{id}" matches any session id.
+_ROUTES = {
+    ("POST", ("sessions",)): "create",
+    ("GET", ("sessions", "{id}")): "get",
+    ("DELETE", ("sessions", "{id}")): "delete",
+    ("POST", ("sessions", "{id}", "level_up")): "level_up",
+    ("POST", ("sessions", "{id}", "promote")): "promote",
+    ("POST", ("sessions", "{id}", "boost")): "boost",
+    ("POST", ("sessions", "{id}", "equip")): "equip",
+    ("POST", ("sessions", "{id}", "transform")): "transform",
+    ("POST", ("compare",)): "compare",
+    ("GET", ("metrics",)): "metrics",
+    ("GET", ("health",)): "health",
+}
+
+def _match_route(method: str, path: str) -> Tuple[str, List[str]]:
+    """
+    Returns the endpoint that `method` and `path` refer to, and the session id(s) in the path.
+    """
+    segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+    template = tuple(segments)
+    params = []
+    if len(segments) >= 2 and segments[0] == "sessions":
+        template = ("sessions", "{id}") + template[2:]
+        params.append(segments[1])
+    endpoint = _ROUTES.get((method, template))
+    if endpoint is None:
+        if any(route_template == template for _, route_template in _ROUTES):
+            raise HTTPError(405, f"Method {method} is not allowed for '{path}'.")
+        raise HTTPError(404, f"No such endpoint: '{path}'.")
+    return endpoint, params
+
+class AenirServer:
+    """
+    Serves sessions over HTTP/1.1; responds to every request with JSON.
+    """
+
+    def __init__(self, *, max_sessions: int = 1024, max_workers: int = 4, max_pending: int = 64) -> None:
+        """
+        Declares at most `max_sessions` sessions, operated upon by `max_workers` threads,
+        with at most `max_pending` operations queued or in progress at once.
+        """
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be positive: {max_pending}")
+        self.sessions = SessionStore(max_sessions)
+        self.max_pending = max_pending
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aenir")
+        self._num_pending = 0
+        self.histograms: collections.defaultdict[str, LatencyHistogram] = collections.defaultdict(LatencyHistogram)
+        self.status_counts: collections.Counter[int] = collections.Counter()
+        self._server: asyncio.base_events.Server | None = None
+        # open connections, so that they may be closed along with the server.
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._handlers: dict[str, Callable[[List[str], Any], Awaitable[Tuple[int, Any]]]] = {
+            "create": self._create,
+            "get": self._get,
+            "delete": self._delete,
+            **{
+                action: functools.partial(self._operate, action=action)
+                for action in ("level_up", "promote", "boost", "equip", "transform")
+            },
+            "compare": self._compare,
+            "metrics": self._metrics,
+            "health": self._health,
+        }
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Returns the result of `function(*args)`, called in the pool; throws HTTPError if too much is queued already.
+        """
+        if self._num_pending >= self.max_pending:
+            raise HTTPError(503, "Too many operations in progress; try again later.")
+        self._num_pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        finally:
+            self._num_pending -= 1
+
+    async def _create(self, params: List[str], body: Any) -> Tuple[int, Any]:
+        """
+        Creates a unit, and a session to hold it.
+        """
+        if not isinstance(body, Mapping) or "game_no" not in body or "unit" not in body:
+            raise HTTPError(400, "Expected a body of the form {\"game_no\": int, \"unit\": spec}.")
+        try:
+            game_no = int(body["game_no"])
+            unit = UnitSpec.parse(body["unit"])
+        except (TypeError, ValueError, KeyError, AttributeError, AenirError):
+            raise HTTPError(400, f"Cannot interpret {body!r} as a unit.") from None
+
+        def create() -> Tuple[Morph, dict[str, Any]]:
+            morph = unit.create_morph(get_morph_class(game_no))
+            return morph, describe_morph(morph)
+
+        morph, description = await self._run(create)
+        session = self.sessions.add(game_no, morph)
+        return 201, {"session_id": session.session_id, "morph": description}
+
+    async def _get(self, params: List[str], body: Any) -> Tuple[int, Any]:
+        """
+        Reports the unit of a session.
+        """
+        session = self.sessions.get(params[0])
+        # operations replace the Morph of a session rather than change it, so it may be read at any time.
+        description = await self._run(describe_morph, session.morph)
+        return 200, {"session_id": session.session_id, "morph": description}
+
+    async def _delete(self, params: List[str], body: Any) -> Tuple[int, Any]:
+        """
+        Ends a session.
+        """
+        self.sessions.remove(params[0])
+        return 200, {"session_id": params[0]}
+
+    async def _operate(self, params: List[str], body: Any, *, action: str) -> Tuple[int, Any]:
+        """
+        Performs an operation on the unit of a session; the unit is left unchanged if the operation fails.
+        """
+        if body is None:
+            body = {}
+        if not isinstance(body, Mapping):
+            raise HTTPError(400, "Expected a JSON object as the body.")
+        session = self.sessions.get(params[0])
+        operation = _get_operation(session.morph, action, body)
+
+        def operate() -> Tuple[Morph, dict[str, Any]]:
+            # performed on a copy, so that a failed operation does not leave the unit half-changed.
+            morph = session.morph.copy()
+            apply_operation(morph, operation)
+            return morph, describe_morph(morph)
+
+        async with session.lock:
+            morph, description = await self._run(operate)
+            session.morph = morph
+        return 200, {"session_id": session.session_id, "morph": description}
+
+    async def _compare(self, params: List[str], body: Any) -> Tuple[int, Any]:
+        """
+        Reports the difference between the current stats of two sessions' units (the first less the second).
+        """
+        session_ids = body.get("sessions") if isinstance(body, Mapping) else None
+        if not isinstance(session_ids, list) or len(session_ids) != 2:
+            raise HTTPError(400, "Expected a body of the form {\"sessions\": [id, other_id]}.")
+        session, other_session = (self.sessions.get(session_id) for session_id in session_ids)
+        try:
+            difference = session.morph.current_stats > other_session.morph.current_stats
+        except TypeError:
+            raise HTTPError(400, "Only units of the same game can be compared.") from None
+        return 200, {"sessions": session_ids, "difference": difference.as_dict()}
+
+    async def _metrics(self, params: List[str], body: Any) -> Tuple[int, Any]:
+        """
+        Reports latency histograms of each endpoint, and counts of sessions and responses.
+        """
+        return 200, {
+            "sessions": len(self.sessions),
+            "evictions": self.sessions.evictions,
+            "pending": self._num_pending,
+            "responses": {str(status): count for status, count in sorted(self.status_counts.items())},
+            "latency": {endpoint: histogram.as_dict() for endpoint, histogram in sorted(self.histograms.items())},
+        }
+
+    async def _health(self, params: List[str], body: Any) -> Tuple[int, Any]:
+        """
+        Reports that the server is up, and which data artifact it serves, if any.
+        """
+        payload: dict[str, Any] = {"status": "ok"}
+        if BaseMorph.data_backend is DataBackend.ARTIFACT:
+            artifact = get_artifact()
+            payload["data"] = {"path": artifact.path, "version": artifact.version, "checksum": artifact.checksum}
+        return 200, payload
+
+    async def handle_request(self, method: str, path: str, body: Any = None) -> Tuple[int, Any]:
+        """
+        Returns the status and payload of the response to `method` on `path` with `body` (already decoded);
+        errors are reported as payloads of the form {"error": type, "message": ...}.
+        """
+        start = time.perf_counter()
+        endpoint = "unknown"
+        try:
+            endpoint, params = _match_route(method, path)
+            status, payload = await self._handlers[endpoint](params, body)
+        except HTTPError as err:
+            status, payload = err.status, {**_error_payload(err), **err.details}
+        except UnitNotFoundError as err:
+            status, payload = 404, _error_payload(err)
+        except (AenirError, NotImplementedError) as err:
+            status, payload = 400, _error_payload(err)
+        except Exception as err:
+            logger.exception("Unexpected error while handling %s %s.", method, path)
+            status, payload = 500, _error_payload(err)
+        self.histograms[endpoint].record((time.perf_counter() - start) * 1000)
+        self.status_counts[status] += 1
+        return status, payload
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Reads requests from a connection and writes responses, until either side closes it.
+        """
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except ValueError:
+                    # longer than the limit of the stream reader.
+                    self._write_response(writer, 400, {"error": "HTTPError", "message": "Request line too long."}, False)
+                    await writer.drain()
+                    break
+                if not request_line.strip():
+                    break
+                keep_alive = await self._respond(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, request_line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """
+        Reads the rest of the request that begins with `request_line`, and writes its response;
+        returns whether the connection may be kept open.
+        """
+        try:
+            method, path, version = request_line.decode("latin-1").split()
+        except ValueError:
+            self._write_response(writer, 400, {"error": "HTTPError", "message": "Malformed request line."}, False)
+            return False
+        headers = {}
+        num_headers = 0
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # longer than the limit of the stream reader.
+                self._write_response(writer, 431, {"error": "HTTPError", "message": "Header line too long."}, False)
+                return False
+            if not line.strip():
+                break
+            num_headers += 1
+            if num_headers > MAX_HEADERS:
+                self._write_response(writer, 431, {"error": "HTTPError", "message": "Too many header lines."}, False)
+                return False
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        try:
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            content_length = -1
+        if not 0 <= content_length <= MAX_BODY_SIZE:
+            status = 413 if content_length > MAX_BODY_SIZE else 400
+            self._write_response(writer, status, {"error": "HTTPError", "message": "Invalid Content-Length."}, False)
+            return False
+        data = await reader.readexactly(content_length)
+        try:
+            body = json.loads(data) if data else None
+        except ValueError:
+            status, payload = 400, {"error": "HTTPError", "message": "Body is not valid JSON."}
+        else:
+            status, payload = await self.handle_request(method.upper(), path, body)
+        self._write_response(writer, status, payload, keep_alive)
+        return keep_alive
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        """
+        Writes `payload` as a JSON response with `status`.
+        """
+        data = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        )
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write((head + "\r\n").encode("latin-1") + data)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> Tuple[str, int]:
+        """
+        Begins accepting connections; returns the address bound (pass port 0 for any free port).
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        address = self._server.sockets[0].getsockname()
+        logger.info("Serving on %s:%d.", address[0], address[1])
+        return address[0], address[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Accepts connections until cancelled.
+        """
+        if self._server is None:
+            raise RuntimeError("The server has not been started.")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stops accepting connections, closes those open, and shuts the pool down.
+        """
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        self._executor.shutdown(wait=True)
+
+def _reload_artifact(path: str) -> None:
+    """
+    Swaps in the artifact at `path`; keeps serving the current one if it cannot be read.
+    """
+    try:
+        BaseMorph.use_artifact(path)
+    except AenirError as err:
+        logger.error("Could not reload '%s': %s", path, err)
+
+async def _serve(args: argparse.Namespace) -> None:
+    """
+    Runs a server configured by `args` until interrupted.
+    """
+    server = AenirServer(max_sessions=args.max_sessions, max_workers=args.workers, max_pending=args.max_pending)
+    if args.artifact:
+        BaseMorph.use_artifact(args.artifact)
+        # SIGHUP reloads the artifact, so that one moved over it is served without restarting.
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _reload_artifact, args.artifact)
+    host, port = await server.start(args.host, args.port)
+    print(f"Serving on http://{host}:{port}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv: List[str] | None = None) -> None:
+    """
+    Serves on the address given on the command line until interrupted.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to bind (default: 8080)")
+    parser.add_argument("--max-sessions", type=int, default=1024, help="sessions kept before the least recently used are evicted")
+    parser.add_argument("--workers", type=int, default=4, help="threads that operate on units")
+    parser.add_argument("--max-pending", type=int, default=64, help="operations queued before requests are turned away")
+    parser.add_argument("--artifact", help="consolidated data artifact to serve; reloaded upon SIGHUP (default: the packaged databases)")
+    parser.add_argument("--log-file", help="file to log to, without blocking requests (default: no logging)")
+    parser.add_argument("--log-level", default="WARNING", choices=("DEBUG", "INFO", "WARNING", "ERROR"), help="least severe level logged (default: WARNING)")
+    args = parser.parse_args(argv)
+    if args.log_file:
+        configure_production_logging(args.log_level, filename=args.log_file)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+def run() -> None:
+    """
+    Calls `main` with the arguments on the command line; the entry point of the `aenir-server` script.
+    """
+    main(sys.argv[1:])
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,306 @@
+"""
+Declares functions that sample the outcomes of randomized level-ups.
+
+`Morph.level_up` adds the expected value of each level's growth; here, each growth is rolled instead.
+Stat values are in hundredths of a point, as in Stats objects.
+Trials are vectorized with numpy if it is installed; otherwise, they are run one at a time.
+"""
+
+import abc
+import collections
+import functools
+import math
+import operator
+import random
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Tuple,
+    Type,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from aenir.morph import Morph
+from aenir.plans import (
+    apply_operation,
+    parse_plan,
+)
+from aenir.stats import AbstractStats
+from aenir._logging import logger
+
+# operations that cap stats at `max_stats`; the others (e.g. transformations) leave them uncapped.
+CAPPING_OPERATIONS = frozenset(("level_up", "promote", "use_stat_booster"))
+
+class Step(NamedTuple):
+    """
+    The effect of one operation on the stats of a trial.
+    """
+    # growth rates to roll `num_levels` times; None if the effect is deterministic.
+    growth_rates: Tuple[int, ...] | None
+    num_levels: int
+    increment: Tuple[int, ...]
+    # None if the operation leaves stats uncapped.
+    max_stats: Tuple[int, ...] | None
+
+class CompiledPlan(NamedTuple):
+    """
+    A plan reduced to its effects on the stats of a given unit.
+    """
+    Stats: Type[AbstractStats]
+    initial_stats: Tuple[int, ...]
+    steps: Tuple[Step, ...]
+    max_stats: Tuple[int, ...]
+
+def _get_values(stats: AbstractStats) -> Tuple[Any, ...]:
+    """
+    Returns stat-values of `stats`, ordered by `STAT_LIST`.
+    """
+    return tuple(stats.as_dict().values())
+
+def compile_plan(morph: Morph, plan: Iterable[Any]) -> CompiledPlan:
+    """
+    Performs `plan` on a copy of `morph` to validate it and measure the effect of each operation.
+    """
+    probe = morph.copy()
+    steps = []
+    for operation in parse_plan(plan):
+        if operation.name == "level_up":
+            growth_rates = _get_values(probe.growth_rates)
+            apply_operation(probe, operation)
+            increment = (0,) * len(growth_rates)
+            steps.append(Step(growth_rates, dict(operation.kwargs)["num_levels"], increment, _get_values(probe.max_stats)))
+            continue
+        # measure from halfway to each maximum, where neither the cap nor zero can interfere.
+        baseline = [max_stat // 2 for max_stat in _get_values(probe.max_stats)]
+        probe.current_stats = probe.Stats._from_values(baseline)
+        apply_operation(probe, operation)
+        increment = tuple(map(operator.sub, _get_values(probe.current_stats), baseline))
+        max_stats = _get_values(probe.max_stats) if operation.name in CAPPING_OPERATIONS else None
+        steps.append(Step(None, 0, increment, max_stats))
+    return CompiledPlan(morph.Stats, _get_values(morph.current_stats), tuple(steps), _get_values(probe.max_stats))
+
+@functools.lru_cache(maxsize=1024)
+def _get_roll_thresholds(num_levels: int, percent: int) -> Tuple[int, ...]:
+    """
+    Returns 32-bit thresholds that split uniform draws into counts of successes out of `num_levels` rolls.
+    A draw meets the k-th threshold with probability P(more than k successes), to within 2 ** -32.
+    """
+    probability = percent / 100
+    thresholds = []
+    cumulative_probability = 0.0
+    for num_successes in range(num_levels):
+        cumulative_probability += (
+            math.comb(num_levels, num_successes)
+            * probability ** num_successes
+            * (1 - probability) ** (num_levels - num_successes)
+        )
+        threshold = round(cumulative_probability * 2 ** 32)
+        if threshold >= 2 ** 32:
+            # the remaining outcomes are less likely than the resolution of a draw.
+            break
+        thresholds.append(threshold)
+    return tuple(thresholds)
+
+def _run_trials_numpy(compiled_plan: CompiledPlan, num_trials: int, rng: Any, batch_size: int) -> Any:
+    """
+    Returns array of final stats, one row per trial; trials are run `batch_size` at a time.
+    """
+    num_stats = len(compiled_plan.initial_stats)
+    # one row per stat, so that each stat is updated in contiguous memory.
+    samples = numpy.empty((num_stats, num_trials), dtype=numpy.int32)
+    for start in range(0, num_trials, batch_size):
+        batch = samples[:, start:start + batch_size]
+        size = batch.shape[1]
+        batch[:] = numpy.array(compiled_plan.initial_stats, dtype=numpy.int32)[:, None]
+        for step in compiled_plan.steps:
+            if step.growth_rates is None:
+                batch += numpy.array(step.increment, dtype=numpy.int32)[:, None]
+            else:
+                for row, growth_rate in zip(batch, step.growth_rates):
+                    whole, percent = divmod(growth_rate, 100)
+                    if whole:
+                        row += 100 * whole * step.num_levels
+                    if percent:
+                        draws = rng.integers(0, 2 ** 32, size, dtype=numpy.uint32)
+                        num_successes = numpy.zeros(size, dtype=numpy.int32)
+                        for threshold in _get_roll_thresholds(step.num_levels, percent):
+                            num_successes += draws >= threshold
+                        row += 100 * num_successes
+            if step.max_stats is not None:
+                # no stat in any game falls below zero; FE5 enforces this upon promotion.
+                numpy.minimum(batch, numpy.array(step.max_stats, dtype=numpy.int32)[:, None], out=batch)
+                numpy.maximum(batch, 0, out=batch)
+    return samples.T
+
+def _run_trials_python(compiled_plan: CompiledPlan, num_trials: int, rng: random.Random) -> List[List[int]]:
+    """
+    Returns list of final stats, one list per trial.
+    """
+    samples = []
+    for _ in range(num_trials):
+        values = list(compiled_plan.initial_stats)
+        for step in compiled_plan.steps:
+            if step.growth_rates is None:
+                values = list(map(operator.add, values, step.increment))
+            else:
+                for index, growth_rate in enumerate(step.growth_rates):
+                    whole, percent = divmod(growth_rate, 100)
+                    num_procs = sum(rng.random() * 100 < percent for _ in range(step.num_levels)) if percent else 0
+                    values[index] += 100 * (whole * step.num_levels + num_procs)
+            if step.max_stats is not None:
+                values = [max(0, min(value, max_stat)) for value, max_stat in zip(values, step.max_stats)]
+        samples.append(values)
+    return samples
+
+class StatDistributions(abc.ABC):
+    """
+    Summarizes the probability distribution of each stat at the end of a plan.
+    """
+
+    def __init__(self, compiled_plan: CompiledPlan) -> None:
+        """
+        Declares the Stats class and the maximum stats at the end of the plan.
+        """
+        self.Stats = compiled_plan.Stats
+        self.max_stats = compiled_plan.max_stats
+
+    @abc.abstractmethod
+    def distributions(self) -> dict[str, dict[int, float]]:
+        """
+        Returns the probability of each final value, per stat; values are in ascending order.
+        """
+        raise NotImplementedError
+
+    def mean(self) -> AbstractStats:
+        """
+        Returns the mean of each stat.
+        """
+        return self.Stats._from_values(
+            sum(value * probability for value, probability in distribution.items())
+            for distribution in self.distributions().values()
+        )
+
+    def percentile(self, percent: float) -> AbstractStats:
+        """
+        Returns, for each stat, the least value that at least `percent` percent of outcomes do not exceed.
+        """
+        values = []
+        for distribution in self.distributions().values():
+            cumulative_probability = 0.0
+            for value, probability in distribution.items():
+                cumulative_probability += probability
+                # tolerate rounding error in the running sum.
+                if cumulative_probability * 100 >= percent - 1e-9:
+                    break
+            values.append(value)
+        return self.Stats._from_values(values)
+
+    def probability_capped(self) -> dict[str, float]:
+        """
+        Returns, for each stat, the probability that it finishes at its maximum.
+        """
+        return {
+            stat: distribution.get(max_stat, 0.0)
+            for (stat, distribution), max_stat in zip(self.distributions().items(), self.max_stats)
+        }
+
+    def probability_at_least(self, thresholds: Mapping[str, int]) -> float:
+        """
+        Returns the probability that every stat in `thresholds` finishes at or above its threshold.
+        Each stat grows independently of the others, so this is a product of per-stat probabilities.
+        """
+        distributions = self.distributions()
+        probability = 1.0
+        for stat, threshold in thresholds.items():
+            probability *= sum(
+                stat_probability for value, stat_probability in distributions[stat].items() if value >= threshold
+            )
+        return probability
+
+class SimulationResult(StatDistributions):
+    """
+    Holds the final stats of every trial, and summarizes them.
+    """
+
+    def __init__(self, compiled_plan: CompiledPlan, samples: Any) -> None:
+        """
+        Stores samples; if they are a numpy array, summaries are vectorized.
+        """
+        super().__init__(compiled_plan)
+        self.samples = samples
+        self._distributions: dict[str, dict[int, float]] | None = None
+
+    @property
+    def num_trials(self) -> int:
+        """
+        The number of trials run.
+        """
+        return len(self.samples)
+
+    def distributions(self) -> dict[str, dict[int, float]]:
+        """
+        Returns the observed probability of each final value, per stat.
+        """
+        if self._distributions is not None:
+            return self._distributions
+        num_trials = self.num_trials
+        distributions = {}
+        for index, stat in enumerate(self.Stats.STAT_LIST()):
+            if numpy is not None and isinstance(self.samples, numpy.ndarray):
+                column = self.samples[:, index]
+                offset = int(column.min()) if num_trials else 0
+                counts = numpy.bincount(column - offset)
+                distribution = {
+                    int(value) + offset: int(counts[value]) / num_trials for value in numpy.flatnonzero(counts)
+                }
+            else:
+                counter = collections.Counter(sample[index] for sample in self.samples)
+                distribution = {value: counter[value] / num_trials for value in sorted(counter)}
+            distributions[stat] = distribution
+        self._distributions = distributions
+        return distributions
+
+    def probability_at_least(self, thresholds: Mapping[str, int]) -> float:
+        """
+        Returns the proportion of trials in which every stat in `thresholds` finishes at or above its threshold.
+        """
+        statlist = self.Stats.STAT_LIST()
+        criteria = [(statlist.index(stat), threshold) for stat, threshold in thresholds.items()]
+        if numpy is not None and isinstance(self.samples, numpy.ndarray):
+            passed = numpy.ones(self.num_trials, dtype=bool)
+            for index, threshold in criteria:
+                passed &= self.samples[:, index] >= threshold
+            return float(passed.mean())
+        num_passed = sum(
+            all(sample[index] >= threshold for index, threshold in criteria) for sample in self.samples
+        )
+        return num_passed / self.num_trials
+
+def simulate(
+    morph: Morph,
+    plan: Iterable[Any],
+    num_trials: int,
+    *,
+    seed: int | None = None,
+    batch_size: int = 2 ** 17,
+) -> SimulationResult:
+    """
+    Performs `plan` on `num_trials` copies of `morph`, rolling each level-up; `morph` is left unchanged.
+    The same `seed` reproduces the same samples, provided numpy is (or is not) installed both times.
+    """
+    if num_trials <= 0:
+        raise ValueError("Number of trials must be positive. Number was: %d" % num_trials)
+    compiled_plan = compile_plan(morph, plan)
+    if numpy is not None:
+        samples = _run_trials_numpy(compiled_plan, num_trials, numpy.random.default_rng(seed), batch_size)
+    else:
+        samples = _run_trials_python(compiled_plan, num_trials, random.Random(seed))
+    logger.debug("Simulated %d trials of %d steps for %s.", num_trials, len(compiled_plan.steps), morph.name)
+    return SimulationResult(compiled_plan, samples)
@@ -0,0 +1,424 @@
+"""
+Declares a compact, versioned binary format for the state of a Morph.
+
+Layout (little-endian):
+- header: magic, format version, game number, number of stats per Stats object, and flags.
+- string table: the length of the table, then its strings, UTF-8 encoded and separated by NUL;
+  each string in the snapshot is stored once, and referred to by its index.
+- fixed record: name, class, class type, promotion class, level, maximum level, minimum promotion level,
+  which of these are None, the augmentation flags of the three Stats objects,
+  then current stats, growth rates and maximum stats (in hundredths) as 32-bit integers or doubles.
+- tagged values: history, `_meta`, then a mapping of every other attribute to its value
+  (e.g. equipped scrolls or bands, transformation flags, father).
+
+Tables shared by every unit of a game (Stats class, scroll and band bonuses) are not stored;
+they are restored from the Morph class, so that no query is made.
+"""
+
+import functools
+import struct
+from typing import (
+    Any,
+    Callable,
+    List,
+    Tuple,
+)
+
+from aenir.morph import (
+    Morph,
+    get_morph_class,
+)
+from aenir._exceptions import SnapshotError
+
+MAGIC = b"AEMS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sBBBB")
+_COUNT = struct.Struct("<H")
+_LENGTH = struct.Struct("<I")
+_INT32 = struct.Struct("<i")
+_INT64 = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+# header flags.
+_FLOAT_STATS = 1
+
+# none-mask of the fixed record.
+_NO_PROMO_CLS = 1
+_NO_MAX_LEVEL = 2
+_NO_MIN_PROMO_LEVEL = 4
+
+# has_been_augmented: None, False, True.
+_AUGMENTATION_FLAGS = (None, False, True)
+
+# not stored; restored from the Morph class.
+_CLASS_ATTRIBUTES: dict[str, Callable[[type], Any]] = {
+    "Stats": lambda morph_cls: morph_cls.STATS(),
+    "_game": lambda morph_cls: morph_cls.GAME(),
+}
+
+# not stored; one of these for each of the `_shared_attributes` of any Morph class.
+_SHARED_ATTRIBUTES: dict[str, Callable[[type], Any]] = {
+    "scroll_dict": lambda morph_cls: morph_cls.SCROLL_DICT(),
+    "band_dict": lambda morph_cls: morph_cls.BAND_DICT(),
+}
+
+# stored in the fixed record, or as the first tagged values.
+_FIXED_ATTRIBUTES = (
+    "_name",
+    "current_cls",
+    "current_clstype",
+    "promo_cls",
+    "current_lv",
+    "max_level",
+    "min_promo_level",
+    "current_stats",
+    "growth_rates",
+    "max_stats",
+    "history",
+    "_meta",
+)
+
+# tags of values.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_LONG = 4
+_FLOAT_TAG = 5
+_STR = 6
+_LIST = 7
+_TUPLE = 8
+_DICT = 9
+_STATS = 10
+_STR_DICT = 11
+_EMPTY_LIST = 12
+_EMPTY_DICT = 13
+
+# values of the tags _NONE, _FALSE and _TRUE.
+_CONSTANTS = (None, False, True)
+
+# number of values in the fixed record before the stats.
+_NUM_RECORD_FIELDS = 11
+
+@functools.lru_cache(maxsize=None)
+def _get_record_struct(num_stats: int, float_stats: bool) -> struct.Struct:
+    """
+    Returns the layout of the fixed record.
+    """
+    return struct.Struct("<4H3i4B%d%s" % (3 * num_stats, "d" if float_stats else "i"))
+
+@functools.lru_cache(maxsize=None)
+def _get_stats_struct(num_stats: int, float_stats: bool) -> struct.Struct:
+    """
+    Returns the layout of a tagged Stats object.
+    """
+    return struct.Struct("<B%d%s" % (num_stats, "d" if float_stats else "i"))
+
+@functools.lru_cache(maxsize=None)
+def _get_class_state(morph_cls: type) -> dict[str, Any]:
+    """
+    Returns the attributes that every instance of `morph_cls` is restored with.
+    """
+    class_state = {attr: get_value(morph_cls) for attr, get_value in _CLASS_ATTRIBUTES.items()}
+    for attr in morph_cls._shared_attributes:
+        class_state[attr] = _SHARED_ATTRIBUTES[attr](morph_cls)
+    return class_state
+
+def _unsupported_value(value: Any) -> SnapshotError:
+    """
+    Returns error for a value that cannot be stored.
+    """
+    return SnapshotError(
+        f"Cannot store value of type {type(value).__name__}: {value!r}",
+        reason=SnapshotError.Reason.UNSUPPORTED_VALUE,
+        version=SNAPSHOT_VERSION,
+    )
+
+class _Encoder:
+    """
+    Encodes the values of one Morph, interning strings as it goes.
+    """
+
+    def __init__(self, stats_cls: type, stats_struct: struct.Struct) -> None:
+        """
+        Declares an empty body and string table.
+        """
+        self.stats_cls = stats_cls
+        self.stats_struct = stats_struct
+        self.body = bytearray()
+        self.strings: dict[str, int] = {}
+
+    def intern(self, value: Any) -> int:
+        """
+        Returns the index of string `value` in the string table.
+        """
+        if not isinstance(value, str):
+            raise _unsupported_value(value)
+        index = self.strings.get(value)
+        if index is None:
+            if "\0" in value:
+                raise _unsupported_value(value)
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def encode(self, value: Any) -> None:
+        """
+        Appends tagged `value`; throws SnapshotError if its type cannot be stored.
+        """
+        body = self.body
+        if value is None:
+            body.append(_NONE)
+        elif value is False:
+            body.append(_FALSE)
+        elif value is True:
+            body.append(_TRUE)
+        elif isinstance(value, int):
+            if -2 ** 31 <= value < 2 ** 31:
+                body.append(_INT)
+                body += _INT32.pack(value)
+            else:
+                body.append(_LONG)
+                body += _INT64.pack(value)
+        elif isinstance(value, float):
+            body.append(_FLOAT_TAG)
+            body += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            body.append(_STR)
+            body += _COUNT.pack(self.intern(value))
+        elif isinstance(value, (list, tuple)):
+            if not value and isinstance(value, list):
+                body.append(_EMPTY_LIST)
+                return
+            body.append(_LIST if isinstance(value, list) else _TUPLE)
+            body += _COUNT.pack(len(value))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, dict):
+            if not value:
+                body.append(_EMPTY_DICT)
+            elif all(isinstance(key, str) for key in value):
+                # keys are stored as untagged string indices.
+                body.append(_STR_DICT)
+                body += _COUNT.pack(len(value))
+                for key, item in value.items():
+                    body += _COUNT.pack(self.intern(key))
+                    self.encode(item)
+            else:
+                body.append(_DICT)
+                body += _COUNT.pack(len(value))
+                for key, item in value.items():
+                    self.encode(key)
+                    self.encode(item)
+        elif isinstance(value, self.stats_cls):
+            body.append(_STATS)
+            body += self.stats_struct.pack(_AUGMENTATION_FLAGS.index(value.has_been_augmented), *value._values)
+        else:
+            raise _unsupported_value(value)
+
+class _Decoder:
+    """
+    Decodes the tagged values of one Morph.
+    """
+
+    def __init__(self, data: bytes, offset: int, strings: List[str], stats_cls: type, stats_struct: struct.Struct) -> None:
+        """
+        Declares where the tagged values begin.
+        """
+        self.data = data
+        self.offset = offset
+        self.strings = strings
+        self.stats_cls = stats_cls
+        self.stats_struct = stats_struct
+
+    def read_str(self) -> str:
+        """
+        Returns the string whose untagged index is next.
+        """
+        offset = self.offset
+        self.offset = offset + _COUNT.size
+        return self.strings[_COUNT.unpack_from(self.data, offset)[0]]
+
+    def decode(self) -> Any:
+        """
+        Returns the next tagged value; the commonest tags are tested first.
+        """
+        data = self.data
+        offset = self.offset
+        tag = data[offset]
+        offset += 1
+        if tag <= _TRUE:
+            self.offset = offset
+            return _CONSTANTS[tag]
+        if tag == _STR:
+            self.offset = offset + _COUNT.size
+            return self.strings[_COUNT.unpack_from(data, offset)[0]]
+        if tag == _INT:
+            self.offset = offset + _INT32.size
+            return _INT32.unpack_from(data, offset)[0]
+        if tag == _STR_DICT:
+            (count,) = _COUNT.unpack_from(data, offset)
+            self.offset = offset + _COUNT.size
+            return {self.read_str(): self.decode() for _ in range(count)}
+        if tag == _EMPTY_LIST:
+            self.offset = offset
+            return []
+        if tag == _EMPTY_DICT:
+            self.offset = offset
+            return {}
+        if tag in (_LIST, _TUPLE, _DICT):
+            (count,) = _COUNT.unpack_from(data, offset)
+            self.offset = offset + _COUNT.size
+            if tag == _LIST:
+                return [self.decode() for _ in range(count)]
+            if tag == _TUPLE:
+                return tuple([self.decode() for _ in range(count)])
+            # each key is evaluated before its value.
+            return {self.decode(): self.decode() for _ in range(count)}
+        if tag == _STATS:
+            flag, *values = self.stats_struct.unpack_from(data, offset)
+            self.offset = offset + self.stats_struct.size
+            stats = self.stats_cls._from_values(values)
+            stats._has_been_augmented = _AUGMENTATION_FLAGS[flag]
+            return stats
+        if tag == _LONG:
+            self.offset = offset + _INT64.size
+            return _INT64.unpack_from(data, offset)[0]
+        if tag == _FLOAT_TAG:
+            self.offset = offset + _FLOAT.size
+            return _FLOAT.unpack_from(data, offset)[0]
+        raise ValueError(f"Unknown tag: {tag}")
+
+def dumps(morph: Morph) -> bytes:
+    """
+    Returns snapshot of the state of `morph`.
+    """
+    stats_cls = morph.Stats
+    num_stats = len(stats_cls.STAT_LIST())
+    state = morph.__dict__
+    all_stats = (state["current_stats"], state["growth_rates"], state["max_stats"])
+    stat_values: List[Any] = []
+    for stats in all_stats:
+        if not isinstance(stats, stats_cls):
+            raise _unsupported_value(stats)
+        stat_values += stats._values
+    try:
+        _get_stats_struct(num_stats * 3, False).pack(0, *stat_values)
+    except struct.error:
+        float_stats = True
+    else:
+        float_stats = False
+    encoder = _Encoder(stats_cls, _get_stats_struct(num_stats, float_stats))
+    promo_cls, max_level, min_promo_level = state["promo_cls"], state["max_level"], state["min_promo_level"]
+    none_mask = (
+        (_NO_PROMO_CLS if promo_cls is None else 0)
+        | (_NO_MAX_LEVEL if max_level is None else 0)
+        | (_NO_MIN_PROMO_LEVEL if min_promo_level is None else 0)
+    )
+    try:
+        record = _get_record_struct(num_stats, float_stats).pack(
+            encoder.intern(state["_name"]),
+            encoder.intern(state["current_cls"]),
+            encoder.intern(state["current_clstype"]),
+            (0 if promo_cls is None else encoder.intern(promo_cls)),
+            state["current_lv"],
+            max_level or 0,
+            min_promo_level or 0,
+            none_mask,
+            *(_AUGMENTATION_FLAGS.index(stats.has_been_augmented) for stats in all_stats),
+            *stat_values,
+        )
+    except struct.error:
+        raise _unsupported_value((state["current_lv"], max_level, min_promo_level)) from None
+    encoder.encode(state["history"])
+    encoder.encode(state["_meta"])
+    encoder.encode({
+        attr: value
+        for attr, value in state.items()
+        if attr not in _FIXED_ATTRIBUTES and attr not in _CLASS_ATTRIBUTES and attr not in morph._shared_attributes
+    })
+    string_table = "\0".join(encoder.strings).encode("utf-8")
+    return b"".join((
+        _HEADER.pack(MAGIC, SNAPSHOT_VERSION, morph.game.value, num_stats, (_FLOAT_STATS if float_stats else 0)),
+        _LENGTH.pack(len(string_table)),
+        string_table,
+        record,
+        encoder.body,
+    ))
+
+def _read_strings(data: bytes, offset: int) -> Tuple[List[str], int]:
+    """
+    Returns the string table at `offset`, and the offset after it.
+    """
+    (length,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    if offset + length > len(data):
+        raise ValueError("String table is truncated.")
+    strings = data[offset:offset + length].decode("utf-8").split("\0")
+    return strings, offset + length
+
+def loads(data: bytes) -> Morph:
+    """
+    Returns Morph restored from snapshot `data`; throws SnapshotError if `data` is not a readable snapshot.
+    """
+    try:
+        magic, version, game_no, num_stats, flags = _HEADER.unpack_from(data)
+    except struct.error:
+        magic = version = None
+    if magic != MAGIC:
+        raise SnapshotError(
+            "Data is not a Morph snapshot.",
+            reason=SnapshotError.Reason.NOT_A_SNAPSHOT,
+        )
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(
+            f"Snapshot version {version} is not supported. Supported version: {SNAPSHOT_VERSION}",
+            reason=SnapshotError.Reason.UNSUPPORTED_VERSION,
+            version=version,
+        )
+    try:
+        morph_cls = get_morph_class(game_no)
+        class_state = _get_class_state(morph_cls)
+        stats_cls = class_state["Stats"]
+        if num_stats != len(stats_cls.STAT_LIST()):
+            raise ValueError(f"Expected {len(stats_cls.STAT_LIST())} stats; found {num_stats}.")
+        float_stats = bool(flags & _FLOAT_STATS)
+        strings, offset = _read_strings(data, _HEADER.size)
+        record_struct = _get_record_struct(num_stats, float_stats)
+        record = record_struct.unpack_from(data, offset)
+        offset += record_struct.size
+        name, current_cls, current_clstype, promo_cls, current_lv, max_level, min_promo_level, none_mask = record[:8]
+        all_stats = []
+        for index, flag in enumerate(record[8:_NUM_RECORD_FIELDS]):
+            start = _NUM_RECORD_FIELDS + index * num_stats
+            stats = stats_cls._from_values(record[start:start + num_stats])
+            stats._has_been_augmented = _AUGMENTATION_FLAGS[flag]
+            all_stats.append(stats)
+        decoder = _Decoder(data, offset, strings, stats_cls, _get_stats_struct(num_stats, float_stats))
+        state = {
+            "_name": strings[name],
+            "current_cls": strings[current_cls],
+            "current_clstype": strings[current_clstype],
+            "promo_cls": (None if none_mask & _NO_PROMO_CLS else strings[promo_cls]),
+            "current_lv": current_lv,
+            "max_level": (None if none_mask & _NO_MAX_LEVEL else max_level),
+            "min_promo_level": (None if none_mask & _NO_MIN_PROMO_LEVEL else min_promo_level),
+            "current_stats": all_stats[0],
+            "growth_rates": all_stats[1],
+            "max_stats": all_stats[2],
+            "history": decoder.decode(),
+            "_meta": decoder.decode(),
+        }
+        state.update(decoder.decode())
+        if decoder.offset != len(data):
+            raise ValueError(f"{len(data) - decoder.offset} bytes left over.")
+    except (NotImplementedError, ValueError, IndexError, KeyError, TypeError, struct.error, UnicodeDecodeError) as err:
+        raise SnapshotError(
+            f"Snapshot is corrupt: {err}",
+            reason=SnapshotError.Reason.CORRUPT,
+            version=version,
+        ) from None
+    morph = object.__new__(morph_cls)
+    state.update(class_state)
+    morph.__dict__.update(state)
+    return morph
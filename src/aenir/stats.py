@@ -3,6 +3,7 @@ Declares classes that store numerical stat data for a given unit.
 """
 
 import abc
+import operator
 from typing import (
     Iterable,
     Iterator,
@@ -13,14 +14,66 @@ from typing import (
     Self,
 )
 
+from aenir import instrumentation
 from aenir._logging import logger
 
 
+class _StatField:
+    """
+    Exposes one entry of a Stats object's value-vector as an attribute.
+    """
+
+    def __init__(self, index: int) -> None:
+        """
+        Declares position of the stat in the value-vector.
+        """
+        self.index = index
+
+    def __get__(self, instance: "AbstractStats | None", owner: type | None = None) -> Any:
+        """
+        Returns value of the stat.
+        """
+        if instance is None:
+            return self
+        return instance._values[self.index]
+
+    def __set__(self, instance: "AbstractStats", value: Any) -> None:
+        """
+        Sets value of the stat.
+        """
+        instance._values[self.index] = value
+
+class _AugmentationFlag:
+    """
+    Exposes whether a Stats object has been augmented; None if it has never been set.
+    """
+
+    def __get__(self, instance: "AbstractStats | None", owner: type | None = None) -> bool | None:
+        """
+        Returns value of flag, or None when accessed from the class.
+        """
+        if instance is None:
+            return None
+        return instance._has_been_augmented
+
+    def __set__(self, instance: "AbstractStats", value: bool | None) -> None:
+        """
+        Sets value of flag.
+        """
+        instance._has_been_augmented = value
+
 class AbstractStats(abc.ABC):
     """
     Defines methods for comparison, setting, and incrementation of numerical stats.
+    Stats are stored in a list ordered by `STAT_LIST`, so that operations act on all of them at once.
     """
-    has_been_augmented: bool | None = None
+    __slots__ = ("_values", "_has_been_augmented")
+    has_been_augmented = _AugmentationFlag()
+    # layout of subclasses; computed once, upon their creation.
+    _STAT_LIST: Tuple[str, ...] | None = None
+    _GROWABLE_STATS: Tuple[str, ...] = ()
+    _IS_GROWABLE: Tuple[bool, ...] = ()
+    _ABSOLUTE_MAXES: Tuple[int, ...] | None = None
 
     @staticmethod
     def STAT_LIST():
@@ -34,12 +87,37 @@ class AbstractStats(abc.ABC):
         """
         raise NotImplementedError
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Computes the layout of the subclass and declares an attribute for each stat in `STAT_LIST`,
+        if it is valid. Invalid `STAT_LIST` values are reported upon initialization instead.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._STAT_LIST = None
+        try:
+            statlist = cls.STAT_LIST()
+            zero_growth_statlist = cls.ZERO_GROWTH_STAT_LIST()
+        except NotImplementedError:
+            return
+        if not isinstance(statlist, tuple) or not all(isinstance(stat, str) for stat in statlist):
+            return
+        for index, stat in enumerate(statlist):
+            setattr(cls, stat, _StatField(index))
+        cls._STAT_LIST = statlist
+        cls._IS_GROWABLE = tuple(stat not in zero_growth_statlist for stat in statlist)
+        cls._GROWABLE_STATS = tuple(
+            stat for stat, is_growable in zip(statlist, cls._IS_GROWABLE) if is_growable
+        )
+        absolute_maxes = getattr(cls, "ABSOLUTE_MAXES", None)
+        if absolute_maxes is not None:
+            cls._ABSOLUTE_MAXES = tuple(absolute_maxes())
+
     @classmethod
     def get_stat_dict(cls, fill_value: Any) -> Mapping[str, Any]:
         """
         Returns `kwargs` for initialization; each key is mapped to `fill_value`.
         """
-        stat_dict = dict((stat, fill_value) for stat in cls.STAT_LIST())
+        stat_dict = dict.fromkeys(cls._STAT_LIST or cls.STAT_LIST(), fill_value)
         return stat_dict
 
     @classmethod
@@ -47,30 +125,48 @@ class AbstractStats(abc.ABC):
         """
         Returns iterable of stats with growth rates.
         """
-        return filter(lambda stat_: stat_ not in cls.ZERO_GROWTH_STAT_LIST(), cls.STAT_LIST())
+        return iter(cls._GROWABLE_STATS)
 
     def as_dict(self) -> dict[str, Any]:
         """
         Returns key-val pairs of stats as dict object.
         """
-        stat_dict = {stat: getattr(self, stat) for stat in self.STAT_LIST()}
+        stat_dict = dict(zip(self._STAT_LIST, self._values))
         return stat_dict
 
     def as_list(self) -> List[Tuple[str, Any]]:
         """
         Returns key-val pairs of stats as list of 2-tuples.
         """
-        stat_list = [(stat, getattr(self, stat)) for stat in self.STAT_LIST()]
+        stat_list = list(zip(self._STAT_LIST, self._values))
         return stat_list
 
     def copy(self) -> Self:
         """
         Returns new instance of Stats identical to this one.
         """
-        stat_dict = {}
-        for stat in self.STAT_LIST():
-            stat_dict[stat] = getattr(self, stat)
-        return self.__class__(multiplier=1, **stat_dict)
+        return self._from_values(self._values)
+
+    @classmethod
+    def _from_values(cls, values: Iterable[Any]) -> Self:
+        """
+        Returns new instance of Stats holding `values`, which must be ordered by `STAT_LIST`.
+        Performs no validation; for internal use with trusted data.
+        """
+        if instrumentation.enabled:
+            instrumentation.count("stats")
+        stats = object.__new__(cls)
+        stats._has_been_augmented = None
+        stats._values = list(values)
+        return stats
+
+    @classmethod
+    def _from_record(cls, record: Mapping[str, int], multiplier: int = 100) -> Self:
+        """
+        Returns new instance of Stats from the stat-values in `record`, each multiplied by `multiplier`.
+        Performs no validation, and ignores extraneous keys; for internal use with trusted data.
+        """
+        return cls._from_values(record[stat] * multiplier for stat in cls._STAT_LIST)
 
     def __init__(self: Self, *, multiplier: int = 100, **stat_dict) -> None:
         """
@@ -78,7 +174,7 @@ class AbstractStats(abc.ABC):
         Warns user about unused kwargs.
         """
         # check if statlist in statdict
-        statlist = self.STAT_LIST()
+        statlist = self._STAT_LIST or self.STAT_LIST()
         if not isinstance(statlist, tuple):
             raise NotImplementedError("`STAT_LIST()` must return a tuple; instead it returns a %r" % type(statlist))
         expected_stats = set(statlist)
@@ -95,60 +191,56 @@ class AbstractStats(abc.ABC):
                 key=by_statlist_ordering,
             )
             raise AttributeError("Please supply values for the following stats: %s" % missing_stats)
-        # initialize
         for stat in statlist:
-            stat_value = stat_dict[stat]
-            if isinstance(stat_value, int):
-                stat_value *= multiplier
-            setattr(self, stat, stat_value)
+            if not isinstance(stat, str):
+                raise TypeError("Stat names must be strings; instead %r is a %r" % (stat, type(stat)))
+        # initialize
+        if instrumentation.enabled:
+            instrumentation.count("stats")
+        self._has_been_augmented = None
+        self._values = [
+            (stat_value * multiplier if isinstance(stat_value, int) else stat_value)
+            for stat_value in map(stat_dict.__getitem__, statlist)
+        ]
         # warn user of unused kwargs
         unused_stats = set(stat_dict) - set(statlist)
         if unused_stats:
             logger.warning("These keyword arguments have gone unused: %s", unused_stats)
 
+    def _check_type(self, other: Any) -> None:
+        """
+        Throws an error unless `other` is a Stats object of the same type as `self`.
+        """
+        if not type(self) == type(other):
+            raise TypeError("Stats must be of the same type: %r != %r" % (type(self), type(other)))
+
     def __mul__(self, other: int) -> Self:
         """
         Reads current stats, multiplies each stat by a scalar, then returns the result in a new Stats object.
         """
-        stat_dict = {}
-        for stat in self.STAT_LIST():
-            self_stat = getattr(self, stat)
-            stat_dict[stat] = self_stat * other
-        return self.__class__(multiplier=1, **stat_dict)
+        values = [self_stat * other for self_stat in self._values]
+        return self._from_values(values)
 
     def imin(self: Self, other: Self) -> None:
         """
         Sets each stat in `self` to minimum of itself and corresponding stat in `other`.
         """
-        if not type(self) == type(other):
-            raise TypeError("Stats must be of the same type: %r != %r", (type(self), type(other)))
-        for stat in self.STAT_LIST():
-            self_stat = getattr(self, stat)
-            other_stat = getattr(other, stat)
-            setattr(self, stat, min(self_stat, other_stat))
+        self._check_type(other)
+        self._values = list(map(min, self._values, other._values))
 
     def imax(self, other: Self) -> None:
         """
         Sets each stat in `self` to maximum of itself and corresponding stat in `other`.
         """
-        if not type(self) == type(other):
-            raise TypeError("Stats must be of the same type: %r != %r", (type(self), type(other)))
-        for stat in self.STAT_LIST():
-            self_stat = getattr(self, stat)
-            other_stat = getattr(other, stat)
-            setattr(self, stat, max(self_stat, other_stat))
+        self._check_type(other)
+        self._values = list(map(max, self._values, other._values))
 
     def __iadd__(self, other: Self) -> Self:
         """
         Increments values of `self` by corresponding values in `other`.
         """
-        if not type(self) == type(other):
-            raise TypeError("Stats must be of the same type: %r != %r", (type(self), type(other)))
-        for stat in self.STAT_LIST():
-            self_stat = getattr(self, stat)
-            other_stat = getattr(other, stat)
-            new_stat = self_stat + other_stat
-            setattr(self, stat, new_stat)
+        self._check_type(other)
+        self._values = list(map(operator.add, self._values, other._values))
         return self
 
     def __add__(self, other: Self) -> Self:
@@ -156,55 +248,43 @@ class AbstractStats(abc.ABC):
         Adds two Stats objects like they're Euclidean vectors and returns the result in a new Stats object.
         Error is thrown if the Stats objects are not of the same type.
         """
-        if not type(self) == type(other):
-            raise TypeError("Stats must be of the same type: %r != %r", (type(self), type(other)))
-        stat_dict = {}
-        for stat in self.STAT_LIST():
-            self_stat = getattr(self, stat)
-            other_stat = getattr(other, stat)
-            stat_dict[stat] = self_stat + other_stat
-        return self.__class__(multiplier=1, **stat_dict)
+        self._check_type(other)
+        values = list(map(operator.add, self._values, other._values))
+        return self._from_values(values)
 
     def __gt__(self, other: Self) -> Self:
         """
         Obtains difference of growable stats of two Stats objects and returns the result in a new Stats object.
         Error is thrown if the Stats objects are not of the same type.
         """
-        if not type(self) == type(other):
-            raise TypeError("Stats must be of the same type: %r != %r", (type(self), type(other)))
-        stat_dict = {}
-        for stat in self.get_growable_stats():
-            self_stat = getattr(self, stat)
-            other_stat = getattr(other, stat)
-            stat_dict[stat] = self_stat - other_stat
-        for stat in self.ZERO_GROWTH_STAT_LIST():
-            stat_dict[stat] = None
-        return self.__class__(multiplier=1, **stat_dict)
+        self._check_type(other)
+        values = [
+            (self_stat - other_stat if is_growable else None)
+            for is_growable, self_stat, other_stat in zip(self._IS_GROWABLE, self._values, other._values)
+        ]
+        return self._from_values(values)
 
     def __eq__(self: Self, other: Self) -> Self:
         """
         Returns a Stats object stating which attributes are equal and which are unequal.
         """
-        if not type(self) == type(other):
-            raise TypeError("Stats must be of the same type: %r != %r" % (type(self), type(other)))
-        stat_dict = {}
-        for stat in self.STAT_LIST():
-            self_stat = getattr(self, stat)
-            other_stat = getattr(other, stat)
-            stat_dict[stat] = self_stat == other_stat
-        return self.__class__(multiplier=1, **stat_dict)
+        self._check_type(other)
+        values = list(map(operator.eq, self._values, other._values))
+        return self._from_values(values)
 
     def __iter__(self) -> Iterator[int]:
         """
         Returns iterable of growable stats.
         """
-        for stat in self.get_growable_stats():
-            yield getattr(self, stat)
+        for is_growable, value in zip(self._IS_GROWABLE, self._values):
+            if is_growable:
+                yield value
 
 class GenealogyStats(AbstractStats):
     """
     Declares stats used for FE4: Genealogy of the Holy War.
     """
+    __slots__ = ()
     
     @staticmethod
     def STAT_LIST():
@@ -246,6 +326,7 @@ class ThraciaStats(AbstractStats):
     """
     Declares stats used for FE5: Thracia 776.
     """
+    __slots__ = ()
 
     @staticmethod
     def STAT_LIST():
@@ -299,6 +380,7 @@ class GBAStats(AbstractStats):
     """
     Declares stats used for FE6, FE7, and FE8.
     """
+    __slots__ = ()
 
     @staticmethod
     def STAT_LIST():
@@ -345,6 +427,7 @@ class RadiantStats(AbstractStats):
     """
     Declares stats used for FE9.
     """
+    __slots__ = ()
 
     @staticmethod
     def STAT_LIST():
@@ -0,0 +1,278 @@
+"""
+Defines tests for the consolidated data artifact.
+"""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from aenir.build import build_artifact
+from aenir.morph import (
+    BaseMorph,
+    Morph6,
+    get_morph,
+)
+from aenir.server import (
+    AenirServer,
+    _reload_artifact,
+)
+from aenir._database import (
+    ARTIFACT_FORMAT,
+    DataArtifact,
+    DataBackend,
+    get_artifact,
+)
+from aenir._exceptions import ArtifactError
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class ArtifactTest(unittest.TestCase):
+    """
+    Demonstrates that an artifact holds the data of every game, and is verified when it is opened.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Builds an artifact once for every test.
+        """
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "aenir.db")
+        cls.checksum = build_artifact(cls.path, version="1.0")
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Deletes the artifact.
+        """
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        """
+        Logs the name of the test.
+        """
+        logger.critical("%s", self.id())
+
+    def test_header(self):
+        """
+        Asserts that the header declares the version and checksum, and that every game is present.
+        """
+        artifact = DataArtifact(self.path)
+        self.assertEqual(artifact.version, "1.0")
+        self.assertEqual(artifact.checksum, self.checksum)
+        self.assertTupleEqual(artifact.game_nos, (4, 5, 6, 7, 8, 9))
+        self.assertIsNone(artifact.get_columns(6, "band_growths"))
+        self.assertEqual(artifact.get_columns(9, "band_growths")[0], "Name")
+        artifact.close()
+
+    def test_select(self):
+        """
+        Asserts that records are those of the game asked for, and that absent tables and columns are reported as SQLite does.
+        """
+        artifact = DataArtifact(self.path)
+        (record,) = artifact.select(6, "characters__base_stats0", ("Class", "Lv"), {"Name": "Roy"}).fetchall()
+        self.assertDictEqual(record, {"Class": "Lord", "Lv": 1})
+        self.assertListEqual(artifact.select(7, "characters__base_stats0", ("Class",), {"Name": "Roy"}).fetchall(), [])
+        with self.assertRaises(sqlite3.OperationalError):
+            artifact.select(6, "scroll_bonuses", ("Name",), None)
+        with self.assertRaises(sqlite3.OperationalError):
+            artifact.select(6, "characters__base_stats0", ("Str",), None)
+        artifact.close()
+
+    def test_deterministic(self):
+        """
+        Asserts that the same data and version build the same bytes.
+        """
+        path = os.path.join(self.directory, "copy.db")
+        self.assertEqual(build_artifact(path, version="1.0"), self.checksum)
+        with open(self.path, "rb") as stream, open(path, "rb") as copy_stream:
+            self.assertEqual(stream.read(), copy_stream.read())
+
+    def test_checksum_mismatch(self):
+        """
+        Asserts that an artifact whose contents were altered is refused.
+        """
+        path = os.path.join(self.directory, "tampered.db")
+        shutil.copyfile(self.path, path)
+        with sqlite3.connect(path) as cnxn:
+            cnxn.execute("UPDATE characters__base_stats0 SET Lv = 20 WHERE Game = 6 AND Name = 'Roy';")
+        cnxn.close()
+        with self.assertRaises(ArtifactError) as err_ctx:
+            DataArtifact(path)
+        self.assertEqual(err_ctx.exception.reason, ArtifactError.Reason.CHECKSUM_MISMATCH)
+
+    def test_not_an_artifact(self):
+        """
+        Asserts that databases and files that are not artifacts, or of another format, are refused.
+        """
+        for path in (get_morph(6, "Roy").path_to("cleaned_stats.db"), os.path.join(self.directory, "missing.db")):
+            with self.subTest(path=path):
+                with self.assertRaises(ArtifactError) as err_ctx:
+                    DataArtifact(path)
+                self.assertEqual(err_ctx.exception.reason, ArtifactError.Reason.NOT_AN_ARTIFACT)
+        path = os.path.join(self.directory, "truncated.db")
+        with open(self.path, "rb") as stream, open(path, "wb") as copy_stream:
+            copy_stream.write(stream.read()[:os.path.getsize(self.path) // 2])
+        path_without_version = os.path.join(self.directory, "unversioned.db")
+        shutil.copyfile(self.path, path_without_version)
+        with sqlite3.connect(path_without_version) as cnxn:
+            cnxn.execute("DELETE FROM artifact_header WHERE key = 'version';")
+        cnxn.close()
+        path_without_table = os.path.join(self.directory, "incomplete.db")
+        shutil.copyfile(self.path, path_without_table)
+        with sqlite3.connect(path_without_table) as cnxn:
+            cnxn.execute("DROP TABLE characters__base_stats0;")
+        cnxn.close()
+        for path in (path, path_without_version, path_without_table):
+            with self.subTest(path=path):
+                with self.assertRaises(ArtifactError) as err_ctx:
+                    DataArtifact(path)
+                self.assertEqual(err_ctx.exception.reason, ArtifactError.Reason.NOT_AN_ARTIFACT)
+        path = os.path.join(self.directory, "future.db")
+        shutil.copyfile(self.path, path)
+        with sqlite3.connect(path) as cnxn:
+            cnxn.execute("UPDATE artifact_header SET value = ? WHERE key = 'format';", (str(ARTIFACT_FORMAT + 1),))
+        cnxn.close()
+        with self.assertRaises(ArtifactError) as err_ctx:
+            DataArtifact(path)
+        self.assertEqual(err_ctx.exception.reason, ArtifactError.Reason.UNSUPPORTED_FORMAT)
+
+class ArtifactMorphTest(unittest.TestCase):
+    """
+    Demonstrates that Morphs behave identically when static data is read from an artifact, which may be swapped.
+    """
+
+    def setUp(self):
+        """
+        Builds an artifact, and discards indexes read by other tests.
+        """
+        logger.critical("%s", self.id())
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, "aenir.db")
+        build_artifact(self.path, version="1")
+        BaseMorph.clear_indexes()
+        BaseMorph.close_connections()
+
+    def tearDown(self):
+        """
+        Switches back to the default data backend.
+        """
+        BaseMorph.data_backend = DataBackend.SQLITE
+        BaseMorph.clear_indexes()
+
+    @staticmethod
+    def get_stats():
+        """
+        Returns the stats of a few Morphs after a few operations.
+        """
+        lakche = get_morph(4, "Lakche", father="Lex")
+        lara = get_morph(5, "Lara")
+        lara.level_up(8)
+        lara.promote(promo_cls="Thief Fighter")
+        ike = get_morph(9, "Ike")
+        ike.level_up(10)
+        ike.promote()
+        lethe = get_morph(9, "Lethe")
+        lethe.transform()
+        return [
+            morph.current_stats.as_dict() for morph in (lakche, lara, ike, lethe)
+        ] + [lethe.max_stats.as_dict(), lara.current_cls]
+
+    def test_morphs_match(self):
+        """
+        Asserts that Morphs read from the artifact have the same stats as those read from the databases,
+        and that no connection to the databases is opened.
+        """
+        expected = self.get_stats()
+        BaseMorph.clear_indexes()
+        BaseMorph.close_connections()
+        BaseMorph.use_artifact(self.path)
+        self.assertIs(BaseMorph.data_backend, DataBackend.ARTIFACT)
+        self.assertListEqual(self.get_stats(), expected)
+        self.assertEqual(BaseMorph.connection_pool.num_connections, 0)
+
+    def test_hot_swap(self):
+        """
+        Asserts that an artifact moved over the one in use is served once it is reloaded,
+        and that indexes of the artifact swapped out are discarded.
+        """
+        old_artifact = BaseMorph.use_artifact(self.path)
+        roy = get_morph(6, "Roy")
+        new_path = os.path.join(self.directory, "new.db")
+        build_artifact(new_path, version="2")
+        os.replace(new_path, self.path)
+        # until reloaded, the artifact opened first is served.
+        self.assertIs(get_artifact(), old_artifact)
+        new_artifact = BaseMorph.use_artifact(self.path)
+        self.assertEqual(new_artifact.version, "2")
+        self.assertIs(get_artifact(), new_artifact)
+        self.assertEqual(get_morph(6, "Roy").current_stats.as_dict(), roy.current_stats.as_dict())
+        self.assertTrue(BaseMorph._indexes)
+        self.assertTrue(all(index_key[0][0] == new_artifact.checksum for index_key in BaseMorph._indexes))
+
+    def test_swap_while_indexing(self):
+        """
+        Asserts that an index being built when another artifact is swapped in is read from one artifact only,
+        and is not kept under the checksum of the artifact swapped out.
+        """
+        old_artifact = BaseMorph.use_artifact(self.path)
+        new_path = os.path.join(self.directory, "new.db")
+        build_artifact(new_path, version="2")
+        query_db = BaseMorph.query_db.__func__
+        artifacts = []
+        def swapping_query_db(cls, path_to_db, table, fields, filters, artifact=None):
+            """
+            Swaps in the new artifact before the index is read, and records the artifact read.
+            """
+            BaseMorph.use_artifact(new_path)
+            artifacts.append(artifact)
+            return query_db(cls, path_to_db, table, fields, filters, artifact)
+        with patch.object(BaseMorph, "query_db", classmethod(swapping_query_db)):
+            index = Morph6.get_index("characters__base_stats0", "Name", ("Class",))
+        self.assertListEqual(artifacts, [old_artifact])
+        self.assertListEqual(index["Roy"], [{"Class": "Lord"}])
+        self.assertFalse(any(index_key[0][0] == old_artifact.checksum for index_key in BaseMorph._indexes))
+
+    def test_failed_reload(self):
+        """
+        Asserts that the artifact in use is kept if the one moved over it cannot be read.
+        """
+        artifact = BaseMorph.use_artifact(self.path)
+        new_path = os.path.join(self.directory, "new.db")
+        shutil.copyfile(self.path, new_path)
+        with sqlite3.connect(new_path) as cnxn:
+            cnxn.execute("DROP TABLE characters__base_stats0;")
+        cnxn.close()
+        os.replace(new_path, self.path)
+        _reload_artifact(self.path)
+        self.assertIs(get_artifact(), artifact)
+        self.assertEqual(get_morph(6, "Roy").current_cls, "Lord")
+
+    def test_health(self):
+        """
+        Asserts that the server reports the artifact it serves.
+        """
+        artifact = BaseMorph.use_artifact(self.path)
+
+        async def scenario():
+            server = AenirServer()
+            try:
+                return await server.handle_request("GET", "/health")
+            finally:
+                await server.close()
+
+        status, payload = asyncio.run(scenario())
+        self.assertEqual(status, 200)
+        self.assertDictEqual(payload["data"], {"path": artifact.path, "version": "1", "checksum": artifact.checksum})
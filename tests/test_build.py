@@ -0,0 +1,177 @@
+"""
+Defines tests for the build of static databases from CSV files.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from aenir.build import (
+    build_database,
+    dump_database,
+    get_column_type,
+)
+from aenir.morph import get_morph_class
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+GAME_NOS = (4, 5, 6, 7, 8, 9)
+
+def read_tables(path_to_db: str) -> dict:
+    """
+    Returns the columns and rows of every table in the db referenced by `path_to_db`, save those of SQLite itself.
+    """
+    tables = {}
+    with sqlite3.connect(path_to_db) as cnxn:
+        names = [
+            name for (name,) in cnxn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
+        ]
+        for name in names:
+            cursor = cnxn.execute('SELECT * FROM "%s" ORDER BY rowid;' % name)
+            tables[name] = (tuple(description[0] for description in cursor.description), cursor.fetchall())
+    cnxn.close()
+    return tables
+
+class GetColumnTypeTest(unittest.TestCase):
+    """
+    Demonstrates that columns are typed by the values they hold.
+    """
+
+    def setUp(self):
+        """
+        Logs the name of the test.
+        """
+        logger.critical("%s", self.id())
+
+    def test_get_column_type(self):
+        """
+        Asserts that only columns of integers (and empty values) are INTEGER.
+        """
+        self.assertEqual(get_column_type(["1", "-2", ""]), "INTEGER")
+        self.assertEqual(get_column_type(["1", "Lord"]), "TEXT")
+        self.assertEqual(get_column_type(["1.5"]), "TEXT")
+        self.assertEqual(get_column_type(["", ""]), "TEXT")
+
+class BuildDatabaseTest(unittest.TestCase):
+    """
+    Demonstrates that databases survive a round trip through CSV files, and are built deterministically.
+    """
+
+    def setUp(self):
+        """
+        Declares a directory to build in.
+        """
+        logger.critical("%s", self.id())
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_roundtrip(self):
+        """
+        Asserts that each game's db, dumped to CSV files and built again, holds the same columns, rows and types.
+        """
+        for game_no in GAME_NOS:
+            with self.subTest(game_no=game_no):
+                path_to_db = get_morph_class(game_no).path_to("cleaned_stats.db")
+                csv_dir = os.path.join(self.directory, str(game_no))
+                path_to_copy = os.path.join(self.directory, "%d.db" % game_no)
+                num_rows = dump_database(path_to_db, csv_dir)
+                self.assertDictEqual(build_database(csv_dir, path_to_copy), num_rows)
+                expected = read_tables(path_to_db)
+                actual = read_tables(path_to_copy)
+                self.assertDictEqual(actual, expected)
+                for table, (_, rows) in expected.items():
+                    self.assertListEqual(
+                        [tuple(map(type, row)) for row in actual[table][1]],
+                        [tuple(map(type, row)) for row in rows],
+                    )
+
+    def test_deterministic(self):
+        """
+        Asserts that the same CSV files build the same bytes.
+        """
+        dump_database(get_morph_class(6).path_to("cleaned_stats.db"), self.directory)
+        contents = []
+        for filename in ("a.db", "b.db"):
+            path_to_db = os.path.join(self.directory, filename)
+            build_database(self.directory, path_to_db)
+            with open(path_to_db, "rb") as stream:
+                contents.append(stream.read())
+        self.assertEqual(contents[0], contents[1])
+
+    def test_schema(self):
+        """
+        Asserts that columns are typed, lookup columns are indexed, and lookups by them are index seeks.
+        """
+        dump_database(get_morph_class(4).path_to("cleaned_stats.db"), self.directory)
+        path_to_db = os.path.join(self.directory, "cleaned_stats.db")
+        build_database(self.directory, path_to_db)
+        with sqlite3.connect(path_to_db) as cnxn:
+            column_types = {name: column_type for _, name, column_type, *_ in cnxn.execute('PRAGMA table_info("characters__base_stats1");')}
+            indexes = {name for (name,) in cnxn.execute("SELECT name FROM sqlite_master WHERE type='index';")}
+            (_, _, _, plan), = cnxn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM 'characters__base_stats1' WHERE Father=?;", ("Lex",)
+            )
+            (num_stats,), = cnxn.execute("SELECT COUNT(*) FROM sqlite_stat1;")
+        cnxn.close()
+        self.assertEqual(column_types["Name"], "TEXT")
+        self.assertEqual(column_types["Lv"], "INTEGER")
+        self.assertTrue(
+            {"characters__base_stats1__Name", "characters__base_stats1__Class", "characters__base_stats1__Father"} <= indexes
+        )
+        self.assertIn("USING INDEX characters__base_stats1__Father", plan)
+        self.assertGreater(num_stats, 0)
+
+    def test_failed_build(self):
+        """
+        Asserts that a build that fails leaves the db as it was, and no temporary file.
+        """
+        path_to_db = os.path.join(self.directory, "cleaned_stats.db")
+        with open(os.path.join(self.directory, "units.csv"), "w") as stream:
+            stream.write("Name,Lv\nRoy,1\n")
+        build_database(self.directory, path_to_db)
+        with open(os.path.join(self.directory, "broken.csv"), "w") as stream:
+            stream.write("Name,Lv\nLilina,1,extra\n")
+        with self.assertRaises(ValueError):
+            build_database(self.directory, path_to_db)
+        self.assertListEqual(list(read_tables(path_to_db)), ["units"])
+        self.assertFalse(os.path.exists(path_to_db + ".tmp"))
+
+    def test_no_csv_files(self):
+        """
+        Asserts that there must be something to build from.
+        """
+        with self.assertRaises(FileNotFoundError):
+            build_database(self.directory, os.path.join(self.directory, "cleaned_stats.db"))
+
+class PackagedDatabaseTest(unittest.TestCase):
+    """
+    Demonstrates that the packaged databases are built by this pipeline.
+    """
+
+    def setUp(self):
+        """
+        Logs the name of the test.
+        """
+        logger.critical("%s", self.id())
+
+    def test_indexed(self):
+        """
+        Asserts that units are looked up by name with an index seek in every packaged db.
+        """
+        for game_no in GAME_NOS:
+            with self.subTest(game_no=game_no):
+                uri = "file:%s?mode=ro" % get_morph_class(game_no).path_to("cleaned_stats.db")
+                with sqlite3.connect(uri, uri=True) as cnxn:
+                    (plan,) = [
+                        row[3] for row in cnxn.execute("EXPLAIN QUERY PLAN SELECT * FROM 'characters__base_stats0' WHERE Name=?;", ("",))
+                    ]
+                cnxn.close()
+                self.assertIn("USING INDEX characters__base_stats0__Name", plan)
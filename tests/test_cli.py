@@ -0,0 +1,166 @@
+"""
+Defines tests for the `aenir` console script.
+"""
+
+import csv
+import io
+import json
+import unittest
+
+from aenir.cli import main
+from aenir.parallel import iter_evaluate_plans
+from aenir.plans import evaluate_plan
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class CLITest(unittest.TestCase):
+    """
+    Demonstrates that plans given on the command line or on stdin are evaluated and written in each format.
+    """
+
+    def setUp(self):
+        """
+        Declares plans across several games, one of which fails.
+        """
+        logger.critical("%s", self.id())
+        self.plans = [
+            {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": 19}, "promote"]},
+            {"game_no": 4, "unit": {"name": "Lakche", "father": "Lex"}},
+            {"game_no": 9, "unit": "Ike", "operations": ["promote"]},
+            {"game_no": 6, "unit": "Marth"},
+        ]
+        self.expected = [evaluate_plan(plan).as_dict() for plan in self.plans]
+
+    def run_main(self, argv, stdin=""):
+        """
+        Returns exit status, stdout and stderr of the script.
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        status = main(argv, stdin=io.StringIO(stdin), stdout=stdout, stderr=stderr)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_main__argv(self):
+        """
+        Asserts that plans given as arguments are written as lines of JSON, in order.
+        """
+        status, stdout, stderr = self.run_main([json.dumps(plan) for plan in self.plans])
+        self.assertEqual(status, 0)
+        self.assertEqual(stderr, "")
+        self.assertListEqual([json.loads(line) for line in stdout.splitlines()], self.expected)
+
+    def test_main__stdin(self):
+        """
+        Asserts that plans are read from stdin, that blank lines are skipped, and that unreadable lines are reported.
+        """
+        lines = [json.dumps(plan) for plan in self.plans]
+        stdin = "\n".join(lines[:2] + ["", "{not json", '{"unit": "Roy"}'] + lines[2:]) + "\n"
+        status, stdout, stderr = self.run_main([], stdin)
+        self.assertEqual(status, 1)
+        self.assertListEqual([json.loads(line) for line in stdout.splitlines()], self.expected)
+        self.assertEqual(len(stderr.splitlines()), 2)
+        self.assertIn("plan 4", stderr)
+        self.assertIn("plan 5", stderr)
+
+    def test_main__invalid_argument_types(self):
+        """
+        Asserts that a plan with an argument of the wrong type is reported in its result, and the plans after it are evaluated.
+        """
+        plans = [
+            {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": "5"}]},
+            {"game_no": 5, "unit": "Leaf", "operations": [{"op": "set_scrolls", "scrolls": "Odo"}]},
+            {"game_no": 6, "unit": {"name": "Rutger", "hard_mode": "yes"}},
+            self.plans[0],
+        ]
+        for argv in ([], ["--jobs", "2"]):
+            with self.subTest(argv=argv):
+                status, stdout, stderr = self.run_main(argv, "\n".join(json.dumps(plan) for plan in plans))
+                self.assertEqual(status, 0)
+                self.assertEqual(stderr, "")
+                results = [json.loads(line) for line in stdout.splitlines()]
+                self.assertEqual(len(results), 4)
+                for result in results[:3]:
+                    self.assertEqual(result["error"]["type"], "PlanError")
+                self.assertIn("'num_levels' must be int, not str", results[0]["error"]["message"])
+                self.assertDictEqual(results[3], self.expected[0])
+
+    def test_main__jobs(self):
+        """
+        Asserts that results from worker processes are those of this process, in order.
+        """
+        stdin = "\n".join(json.dumps(plan) for plan in self.plans * 5)
+        status, stdout, _ = self.run_main(["--jobs", "2", "--chunksize", "3"], stdin)
+        self.assertEqual(status, 0)
+        self.assertListEqual([json.loads(line) for line in stdout.splitlines()], self.expected * 5)
+
+    def test_main__csv(self):
+        """
+        Asserts that rows have a column for each stat, left blank where a game lacks it.
+        """
+        _, stdout, _ = self.run_main(["--format", "csv"] + [json.dumps(plan) for plan in self.plans])
+        rows = list(csv.DictReader(io.StringIO(stdout)))
+        self.assertEqual(len(rows), len(self.plans))
+        self.assertEqual(rows[0]["current_cls"], self.expected[0]["current_cls"])
+        self.assertEqual(rows[0]["Pow"], str(self.expected[0]["current_stats"]["Pow"]))
+        self.assertEqual(rows[0]["Mag"], "")
+        self.assertEqual(rows[1]["Mag"], str(self.expected[1]["current_stats"]["Mag"]))
+        self.assertEqual(rows[0]["error"], "")
+        self.assertTrue(rows[3]["error"].startswith("UnitNotFoundError"))
+
+    def test_main__table(self):
+        """
+        Asserts that the table has a header and a line per result, aligned in columns.
+        """
+        _, stdout, _ = self.run_main(["--format", "table"] + [json.dumps(plan) for plan in self.plans[:2]])
+        lines = stdout.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("game_no"))
+        self.assertNotIn("error", lines[0])
+        self.assertEqual(lines[1].index("Master Lord"), lines[0].index("current_cls"))
+
+    def test_main__invalid_arguments(self):
+        """
+        Asserts that invalid options are refused.
+        """
+        for argv in (["--jobs", "0"], ["--format", "xml"]):
+            with self.assertRaises(SystemExit):
+                self.run_main(argv)
+
+class IterEvaluatePlansTest(unittest.TestCase):
+    """
+    Demonstrates that plans are evaluated lazily, in order.
+    """
+
+    def setUp(self):
+        """
+        Logs the name of the test.
+        """
+        logger.critical("%s", self.id())
+
+    def test_iter_evaluate_plans__lazy(self):
+        """
+        Asserts that the first result is ready before the plans run out.
+        """
+        def plans():
+            yield {"game_no": 6, "unit": "Roy"}
+            raise AssertionError("Plans were read ahead of the results.")
+
+        results = iter_evaluate_plans(plans(), max_workers=1)
+        self.assertEqual(next(results).name, "Roy")
+
+    def test_iter_evaluate_plans__matches_sequential(self):
+        """
+        Asserts that results from workers are in the order of the plans.
+        """
+        plans = [
+            {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": num_levels}]}
+            for num_levels in range(1, 20)
+        ]
+        expected = [evaluate_plan(plan) for plan in plans]
+        self.assertListEqual(list(iter_evaluate_plans(iter(plans), max_workers=2, chunksize=2)), expected)
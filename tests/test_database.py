@@ -0,0 +1,254 @@
+"""
+Defines tests for the pooling of db-connections.
+"""
+
+import sqlite3
+import threading
+import unittest
+from unittest.mock import patch
+
+from aenir.games import FireEmblemGame
+from aenir.morph import (
+    BaseMorph,
+    get_morph,
+    Morph6,
+)
+from aenir._database import (
+    ConnectionPool,
+    DataBackend,
+    PreloadedDatabase,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class ConnectionPoolTest(unittest.TestCase):
+    """
+    Demonstrates that connections are reused, read-only, and recyclable.
+    """
+
+    def setUp(self):
+        """
+        Initializes a fresh pool.
+        """
+        logger.critical("%s", self.id())
+        self.pool = ConnectionPool()
+        self.path_to_db = "src/aenir/static/binding-blade/cleaned_stats.db"
+
+    def tearDown(self):
+        """
+        Closes all connections opened during the test.
+        """
+        self.pool.close()
+
+    def test_get_connection__reused(self):
+        """
+        Asserts that one connection is opened per database per thread.
+        """
+        cnxn1 = self.pool.get_connection(self.path_to_db)
+        cnxn2 = self.pool.get_connection(self.path_to_db)
+        self.assertIs(cnxn1, cnxn2)
+        self.assertEqual(self.pool.num_connections, 1)
+
+    def test_get_connection__row_factory(self):
+        """
+        Asserts that rows can be accessed by column name.
+        """
+        cnxn = self.pool.get_connection(self.path_to_db)
+        row = cnxn.execute("SELECT Name FROM characters__base_stats0 WHERE Name='Roy';").fetchone()
+        self.assertEqual(row["Name"], "Roy")
+
+    def test_get_connection__read_only(self):
+        """
+        Asserts that the static databases cannot be written to.
+        """
+        cnxn = self.pool.get_connection(self.path_to_db)
+        with self.assertRaises(sqlite3.OperationalError):
+            cnxn.execute("DELETE FROM characters__base_stats0;")
+
+    def test_get_connection__db_dne(self):
+        """
+        Asserts that nonexistent databases are not created.
+        """
+        with self.assertRaises(sqlite3.OperationalError):
+            self.pool.get_connection("static/binding-blade/cleaned_stats.db")
+
+    def test_get_connection__per_thread(self):
+        """
+        Asserts that each thread receives its own connection.
+        """
+        cnxn1 = self.pool.get_connection(self.path_to_db)
+        connections = []
+        thread = threading.Thread(
+            target=lambda: connections.append(self.pool.get_connection(self.path_to_db)),
+        )
+        thread.start()
+        thread.join()
+        (cnxn2,) = connections
+        self.assertIsNot(cnxn1, cnxn2)
+        self.assertEqual(self.pool.num_connections, 2)
+
+    def test_close(self):
+        """
+        Asserts that closed connections are replaced upon the next request.
+        """
+        cnxn1 = self.pool.get_connection(self.path_to_db)
+        self.pool.close()
+        self.assertEqual(self.pool.num_connections, 0)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            cnxn1.execute("SELECT 1;")
+        cnxn2 = self.pool.get_connection(self.path_to_db)
+        self.assertIsNot(cnxn1, cnxn2)
+
+    def test_reset__after_fork(self):
+        """
+        Asserts that connections opened by a parent process are not reused.
+        """
+        cnxn1 = self.pool.get_connection(self.path_to_db)
+        with patch("os.getpid", return_value=-1):
+            cnxn2 = self.pool.get_connection(self.path_to_db)
+        self.assertIsNot(cnxn1, cnxn2)
+        self.assertEqual(self.pool.num_connections, 1)
+        cnxn1.close()
+
+class MorphConnectionTest(unittest.TestCase):
+    """
+    Demonstrates that Morphs share a single pool.
+    """
+
+    def setUp(self):
+        """
+        Closes connections and discards indexes left over from other tests.
+        """
+        logger.critical("%s", self.id())
+        BaseMorph.close_connections()
+        BaseMorph.clear_indexes()
+
+    def test_morphs_share_connection(self):
+        """
+        Asserts that creating and promoting many units opens only one connection.
+        """
+        for name in ("Roy", "Allen", "Lance", "Wolt"):
+            morph = Morph6(name)
+            morph.current_lv = 10
+            morph.promote()
+        self.assertEqual(Morph6.connection_pool.num_connections, 1)
+
+    def test_close_connections(self):
+        """
+        Asserts that Morphs can still be created after connections are closed.
+        """
+        Morph6("Roy")
+        BaseMorph.close_connections()
+        self.assertEqual(BaseMorph.connection_pool.num_connections, 0)
+        roy = Morph6("Roy")
+        self.assertEqual(roy.current_cls, "Lord")
+
+class PreloadedDatabaseTest(unittest.TestCase):
+    """
+    Demonstrates that the in-memory copies of the static databases match the originals.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_select__all_tables(self):
+        """
+        Asserts that every table yields the same records from memory as from disk.
+        """
+        for game in FireEmblemGame:
+            path_to_db = "src/aenir/static/%s/cleaned_stats.db" % game.url_name
+            database = PreloadedDatabase(path_to_db)
+            with sqlite3.connect(path_to_db) as cnxn:
+                cnxn.row_factory = sqlite3.Row
+                for table, (columns, _) in database.tables.items():
+                    with self.subTest(game=game, table=table):
+                        expected = [dict(row) for row in cnxn.execute("SELECT * FROM '%s';" % table)]
+                        actual = database.select(table, columns, None).fetchall()
+                        self.assertListEqual(actual, expected)
+
+    def test_select__with_filters(self):
+        """
+        Asserts that filtered selections return only the matching records.
+        """
+        database = PreloadedDatabase("src/aenir/static/binding-blade/cleaned_stats.db")
+        expected = [{"Name": "Roy", "Pow": 40}, {"Name": "Wolt", "Pow": 40}, {"Name": "Wendy", "Pow": 40}]
+        actual = database.select(
+            "characters__growth_rates0",
+            ("Name", "Pow"),
+            {"Spd": 40, "Pow": 40},
+        ).fetchall()
+        self.assertCountEqual(actual, expected)
+        actual = database.select("characters__growth_rates0", ("Name",), {"Name": "Marth"}).fetchone()
+        self.assertIsNone(actual)
+
+    def test_select__table_dne(self):
+        """
+        Asserts that SQLite's error is mimicked for nonexistent tables and columns.
+        """
+        database = PreloadedDatabase("src/aenir/static/binding-blade/cleaned_stats.db")
+        with self.assertRaises(sqlite3.OperationalError):
+            database.select("characters__base_stats", ("Name",), None)
+        with self.assertRaises(sqlite3.OperationalError):
+            database.select("characters__base_stats0", ("Str",), None)
+
+class PreloadedMorphTest(unittest.TestCase):
+    """
+    Demonstrates that Morphs behave identically when static data is preloaded.
+    """
+
+    def setUp(self):
+        """
+        Switches to the preloaded data backend.
+        """
+        logger.critical("%s", self.id())
+        BaseMorph.data_backend = DataBackend.PRELOADED
+
+    def tearDown(self):
+        """
+        Switches back to the default data backend.
+        """
+        BaseMorph.data_backend = DataBackend.SQLITE
+
+    def test_no_connections_opened(self):
+        """
+        Asserts that preloaded Morphs do not query the databases on disk.
+        """
+        BaseMorph.close_connections()
+        for game_no, name, kwargs in (
+            (4, "Lakche", {"father": "Lex"}),
+            (5, "Lara", {}),
+            (6, "Roy", {}),
+            (7, "Eliwood", {}),
+            (8, "Ross", {}),
+            (9, "Lethe", {}),
+        ):
+            morph = get_morph(game_no, name, **kwargs)
+            morph.get_promotion_list()
+        self.assertEqual(BaseMorph.connection_pool.num_connections, 0)
+
+    def test_morphs_match(self):
+        """
+        Asserts that preloaded Morphs have the same stats as Morphs read from disk.
+        """
+        def get_stats(backend):
+            BaseMorph.data_backend = backend
+            ike = get_morph(9, "Ike")
+            ike.level_up(10)
+            ike.promote()
+            lethe = get_morph(9, "Lethe")
+            lethe.transform()
+            return [
+                stats.as_dict() for stats in (ike.current_stats, ike.max_stats, lethe.current_stats, lethe.max_stats)
+            ]
+        expected = get_stats(DataBackend.SQLITE)
+        actual = get_stats(DataBackend.PRELOADED)
+        self.assertListEqual(actual, expected)
@@ -0,0 +1,145 @@
+"""
+Defines tests for the exact computation of stat distributions.
+"""
+
+import unittest
+
+from aenir.morph import get_morph
+from aenir.plans import apply_plan
+from aenir.distributions import (
+    get_exact_distributions,
+    get_gain_distribution,
+    get_stat_distribution,
+)
+from aenir.simulation import simulate
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class GainDistributionTest(unittest.TestCase):
+    """
+    Demonstrates the distribution of gains over several levels.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_get_gain_distribution(self):
+        """
+        Asserts that gains are binomially distributed.
+        """
+        actual = get_gain_distribution(50, 2)
+        expected = ((0, 0.25), (100, 0.5), (200, 0.25))
+        self.assertTupleEqual(actual, expected)
+
+    def test_get_gain_distribution__above_100(self):
+        """
+        Asserts that growth rates above 100 guarantee a point per level.
+        """
+        actual = dict(get_gain_distribution(120, 3))
+        self.assertSetEqual(set(actual), {300, 400, 500, 600})
+        self.assertAlmostEqual(actual[300], 0.8 ** 3)
+        self.assertAlmostEqual(sum(value * probability for value, probability in actual.items()), 360)
+
+    def test_get_gain_distribution__certain(self):
+        """
+        Asserts that growth rates of 0 and 100 leave nothing to chance.
+        """
+        self.assertTupleEqual(get_gain_distribution(0, 5), ((0, 1.0),))
+        self.assertTupleEqual(get_gain_distribution(100, 5), ((500, 1.0),))
+
+    def test_get_stat_distribution__capped(self):
+        """
+        Asserts that probability above the maximum accumulates at the maximum.
+        """
+        actual = get_stat_distribution(1800, ((50, 2, 0, 1900),))
+        expected = ((1800, 0.25), (1900, 0.75))
+        self.assertTupleEqual(actual, expected)
+
+class ExactDistributionsTest(unittest.TestCase):
+    """
+    Demonstrates that exact distributions agree with Morph methods and with simulation.
+    """
+
+    def setUp(self):
+        """
+        Declares a plan for Roy.
+        """
+        logger.critical("%s", self.id())
+        self.roy = get_morph(6, "Roy")
+        self.plan = [{"op": "level_up", "num_levels": 9}, "promote", {"op": "level_up", "num_levels": 10}]
+
+    def test_distributions__sum_to_one(self):
+        """
+        Asserts that each distribution is a probability distribution within the bounds of the stat.
+        """
+        result = get_exact_distributions(self.roy, self.plan)
+        for (stat, distribution), max_stat in zip(result.distributions().items(), result.max_stats):
+            with self.subTest(stat=stat):
+                self.assertAlmostEqual(sum(distribution.values()), 1.0)
+                self.assertListEqual(list(distribution), sorted(distribution))
+                self.assertLessEqual(max(distribution), max_stat)
+
+    def test_mean__uncapped(self):
+        """
+        Asserts that, where no stat can reach its maximum, the mean is what `level_up` computes.
+        """
+        plan = [{"op": "level_up", "num_levels": 5}]
+        expected = self.roy.copy()
+        apply_plan(expected, plan)
+        actual = get_exact_distributions(self.roy, plan).mean()
+        for stat, value in actual.as_dict().items():
+            with self.subTest(stat=stat):
+                self.assertAlmostEqual(value, getattr(expected.current_stats, stat))
+
+    def test_zero_growth_stats(self):
+        """
+        Asserts that stats without growth rates take a single value.
+        """
+        ike = get_morph(9, "Ike")
+        result = get_exact_distributions(ike, [{"op": "level_up", "num_levels": 9}, "promote"])
+        expected = ike.copy()
+        apply_plan(expected, [{"op": "level_up", "num_levels": 9}, "promote"])
+        for stat in ike.Stats.ZERO_GROWTH_STAT_LIST():
+            with self.subTest(stat=stat):
+                self.assertDictEqual(result.distributions()[stat], {getattr(expected.current_stats, stat): 1.0})
+
+    def test_matches_simulation(self):
+        """
+        Asserts that simulated outcomes converge upon the exact distribution.
+        """
+        exact = get_exact_distributions(self.roy, self.plan)
+        simulated = simulate(self.roy, self.plan, 50000, seed=0)
+        for stat, distribution in exact.distributions().items():
+            simulated_distribution = simulated.distributions()[stat]
+            for value, probability in distribution.items():
+                with self.subTest(stat=stat, value=value):
+                    self.assertAlmostEqual(simulated_distribution.get(value, 0.0), probability, delta=0.01)
+        self.assertAlmostEqual(
+            exact.probability_at_least({"Spd": 1700, "Skl": 1800}),
+            simulated.probability_at_least({"Spd": 1700, "Skl": 1800}),
+            delta=0.01,
+        )
+        simulated_median = simulated.percentile(50).as_dict()
+        for stat, value in exact.percentile(50).as_dict().items():
+            with self.subTest(stat=stat):
+                # a cumulative probability near one-half may fall on either side of it.
+                self.assertAlmostEqual(simulated_median[stat], value, delta=100)
+
+    def test_cached_across_roster(self):
+        """
+        Asserts that a repeated query is answered from the cache.
+        """
+        get_exact_distributions(self.roy, self.plan)
+        cache_info = get_stat_distribution.cache_info()
+        get_exact_distributions(get_morph(6, "Roy"), self.plan)
+        self.assertEqual(get_stat_distribution.cache_info().misses, cache_info.misses)
+        self.assertGreater(get_stat_distribution.cache_info().hits, cache_info.hits)
@@ -0,0 +1,118 @@
+"""
+Defines tests for the memoization of plans that share prefixes.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from aenir.executor import PlanExecutor
+from aenir.plans import (
+    Plan,
+    evaluate_plan,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class PlanExecutorTest(unittest.TestCase):
+    """
+    Demonstrates that memoized plans agree with replayed ones, and that the cache is bounded.
+    """
+
+    def setUp(self):
+        """
+        Declares plans for Roy that share a prefix.
+        """
+        logger.critical("%s", self.id())
+        self.now = 0.0
+        self.prefix = [{"op": "level_up", "num_levels": 19}, "promote"]
+        self.plans = [
+            {"game_no": 6, "unit": "Roy", "operations": self.prefix + [{"op": "level_up", "num_levels": num_levels}]}
+            for num_levels in range(1, 11)
+        ]
+
+    def clock(self):
+        """
+        Returns the time as set by the test.
+        """
+        return self.now
+
+    def test_evaluate__matches_evaluate_plan(self):
+        """
+        Asserts that memoized results are those of replaying each plan from scratch.
+        """
+        executor = PlanExecutor()
+        plans = self.plans + self.plans[::-1] + [{"game_no": 6, "unit": "Roy", "operations": self.prefix}]
+        for plan in plans:
+            with self.subTest(plan=plan):
+                self.assertTupleEqual(executor.evaluate(plan), evaluate_plan(plan))
+
+    def test_evaluate__reuses_prefix(self):
+        """
+        Asserts that the unit is created, levelled and promoted only once.
+        """
+        executor = PlanExecutor()
+        with patch.object(Plan, "create_morph", autospec=True, side_effect=Plan.create_morph) as create_morph:
+            for plan in self.plans:
+                executor.evaluate(plan)
+        self.assertEqual(create_morph.call_count, 1)
+        cache_info = executor.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, len(self.plans) - 1)
+        # the unit, the level-up, the promotion, and one state per plan.
+        self.assertEqual(cache_info.currsize, 3 + len(self.plans))
+
+    def test_execute__returns_copy(self):
+        """
+        Asserts that changing a returned Morph does not change what is memoized.
+        """
+        executor = PlanExecutor()
+        roy = executor.execute(self.plans[0])
+        expected = roy.current_stats.as_dict()
+        roy.level_up(5)
+        self.assertDictEqual(executor.execute(self.plans[0]).current_stats.as_dict(), expected)
+
+    def test_errors__not_memoized(self):
+        """
+        Asserts that a failing operation is reported, and leaves the memoized prefix intact.
+        """
+        executor = PlanExecutor()
+        plan = {"game_no": 6, "unit": "Roy", "operations": self.prefix + [{"op": "level_up", "num_levels": 20}]}
+        result = executor.evaluate(plan)
+        self.assertEqual(result.error[0], "LevelUpError")
+        self.assertEqual(executor.cache_info().currsize, 3)
+        self.assertTupleEqual(executor.evaluate(self.plans[0]), evaluate_plan(self.plans[0]))
+
+    def test_maxsize(self):
+        """
+        Asserts that the least recently used states are evicted first.
+        """
+        executor = PlanExecutor(maxsize=4)
+        for plan in self.plans:
+            executor.evaluate(plan)
+        self.assertEqual(executor.cache_info().currsize, 4)
+        executor.cache_clear()
+        self.assertTupleEqual(tuple(executor.cache_info()), (0, 0, 4, 0))
+        executor = PlanExecutor(maxsize=0)
+        self.assertTupleEqual(executor.evaluate(self.plans[0]), evaluate_plan(self.plans[0]))
+        self.assertEqual(executor.cache_info().currsize, 0)
+        with self.assertRaises(ValueError):
+            PlanExecutor(maxsize=-1)
+
+    def test_ttl(self):
+        """
+        Asserts that expired states are not resumed from.
+        """
+        executor = PlanExecutor(ttl=60, clock=self.clock)
+        executor.evaluate(self.plans[0])
+        self.now = 30.0
+        executor.evaluate(self.plans[1])
+        self.assertEqual(executor.cache_info().hits, 1)
+        self.now = 120.0
+        executor.evaluate(self.plans[2])
+        self.assertEqual(executor.cache_info().misses, 2)
@@ -0,0 +1,202 @@
+"""
+Defines tests for the JSON-lines exporter of static data.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import types
+import unittest
+
+from aenir.games import FireEmblemGame
+from aenir.morph import (
+    BaseMorph,
+    get_morph,
+    get_morph_class,
+)
+from aenir.export import (
+    get_etag,
+    iter_class_records,
+    iter_lines,
+    iter_records,
+    iter_unit_records,
+    main,
+    write_jsonl,
+)
+from aenir._database import DataBackend
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+def count_rows(game_no: int, table: str) -> int:
+    """
+    Returns the number of rows in `table` of the db of `game_no`.
+    """
+    path_to_db = get_morph_class(game_no).path_to("cleaned_stats.db")
+    cnxn = sqlite3.connect(path_to_db)
+    try:
+        return cnxn.execute("SELECT COUNT(*) FROM '%s';" % table).fetchone()[0]
+    finally:
+        cnxn.close()
+
+class ExportTest(unittest.TestCase):
+    """
+    Demonstrates that every unit and class is exported, in agreement with Morphs, and identically each time.
+    """
+
+    def setUp(self):
+        """
+        Logs the name of the test.
+        """
+        logger.critical("%s", self.id())
+
+    def tearDown(self):
+        """
+        Switches back to the default data backend.
+        """
+        BaseMorph.data_backend = DataBackend.SQLITE
+
+    def test_iter_lines__is_lazy(self):
+        """
+        Asserts that lines are produced by a generator, rather than collected first.
+        """
+        lines = iter_lines(6)
+        self.assertIsInstance(lines, types.GeneratorType)
+        first_line = json.loads(next(lines))
+        self.assertDictEqual(first_line, {"type": "game", "game_no": 6, "name": "Sword of Seals"})
+
+    def test_iter_lines__byte_identical(self):
+        """
+        Asserts that repeated exports, from either data backend, are the same bytes.
+        """
+        for game_no in range(4, 10):
+            expected = b"".join(iter_lines(game_no))
+            BaseMorph.clear_indexes()
+            self.assertEqual(b"".join(iter_lines(game_no)), expected)
+            BaseMorph.data_backend = DataBackend.PRELOADED
+            self.assertEqual(b"".join(iter_lines(FireEmblemGame(game_no))), expected)
+            BaseMorph.data_backend = DataBackend.SQLITE
+
+    def test_iter_unit_records__one_per_row(self):
+        """
+        Asserts that there is a record for each row of each table of base stats, with growths and max stats.
+        """
+        num_tables = {4: 2, 5: 1, 6: 1, 7: 2, 8: 1, 9: 1}
+        for game_no, num_bases_tables in num_tables.items():
+            records = list(iter_unit_records(game_no))
+            expected = sum(
+                count_rows(game_no, "characters__base_stats%d" % which_bases)
+                for which_bases in range(num_bases_tables)
+            )
+            self.assertEqual(len(records), expected)
+            for record in records:
+                self.assertIsNotNone(record["growths"], record["name"])
+                self.assertIsNotNone(record["max_stats"], record["name"])
+
+    def test_iter_class_records__one_per_row(self):
+        """
+        Asserts that there is a record for each class with maximum stats, and that units refer only to these.
+        """
+        def get_max_stats_classes(promotions):
+            for promotion in promotions:
+                yield promotion["max_stats_class"]
+                yield from get_max_stats_classes(promotion["promotions"])
+
+        for game_no in range(4, 10):
+            classes = [record["name"] for record in iter_class_records(game_no)]
+            self.assertEqual(len(classes), count_rows(game_no, "classes__maximum_stats0"))
+            for record in iter_unit_records(game_no):
+                self.assertIn(record["max_stats_class"], classes)
+                for cls in get_max_stats_classes(record["promotions"]):
+                    self.assertIn(cls, classes)
+
+    def test_iter_unit_records__match_morphs(self):
+        """
+        Asserts that records hold the same stats and promotions as Morphs of the same units.
+        """
+        records = {
+            (record["name"], record["father"]): record for record in iter_unit_records(4)
+        }
+        records.update({
+            (record["name"], None): record for record in iter_unit_records(6)
+        })
+        for game_no, name, kwargs, key in (
+            (4, "Sigurd", {}, ("Sigurd", None)),
+            (4, "Lakche", {"father": "Lex"}, ("Lakche", "Lex")),
+            (6, "Roy", {}, ("Roy", None)),
+            (6, "Marcus", {}, ("Marcus", None)),
+        ):
+            morph = get_morph(game_no, name, **kwargs)
+            record = records[key]
+            self.assertEqual(record["class"], morph.current_cls)
+            self.assertEqual(record["level"], morph.current_lv)
+            self.assertDictEqual(
+                {stat: value * 100 for stat, value in record["bases"].items()},
+                morph.current_stats.as_dict(),
+            )
+            self.assertDictEqual(record["growths"], morph.growth_rates.as_dict())
+            self.assertDictEqual(
+                {stat: value * 100 for stat, value in record["max_stats"].items()},
+                morph.max_stats.as_dict(),
+            )
+            self.assertListEqual(
+                [promotion["class"] for promotion in record["promotions"]],
+                morph.get_promotion_list(),
+            )
+
+    def test_iter_unit_records__second_promotions(self):
+        """
+        Asserts that trainees list the promotions that follow their first.
+        """
+        amelia = next(record for record in iter_unit_records(8) if record["name"] == "Amelia")
+        first_promotions = {promotion["class"]: promotion for promotion in amelia["promotions"]}
+        self.assertIn("Cavalier (F)", first_promotions)
+        second_promotions = [promotion["class"] for promotion in first_promotions["Cavalier (F)"]["promotions"]]
+        morph = get_morph(8, "Amelia")
+        morph.level_up(9)
+        morph.promote(promo_cls="Cavalier (F)")
+        self.assertListEqual(second_promotions, morph.get_promotion_list())
+
+    def test_iter_records__invalid_game(self):
+        """
+        Asserts that only Fire Emblem games can be exported.
+        """
+        with self.assertRaises(ValueError):
+            next(iter_records(3))
+
+    def test_write_jsonl(self):
+        """
+        Asserts that the lines written are those generated, and that the etag is their digest.
+        """
+        stream = io.BytesIO()
+        num_records = write_jsonl(9, stream)
+        data = stream.getvalue()
+        lines = data.splitlines(keepends=True)
+        self.assertEqual(len(lines), num_records)
+        self.assertEqual(data, b"".join(iter_lines(9)))
+        self.assertEqual(get_etag(9), hashlib.sha256(data).hexdigest())
+
+    def test_main(self):
+        """
+        Asserts that the command line writes the same bytes to a file.
+        """
+        with tempfile.TemporaryDirectory() as dirname:
+            path = os.path.join(dirname, "fe5.jsonl")
+            main(["5", "--output", path])
+            with open(path, "rb") as stream:
+                self.assertEqual(stream.read(), b"".join(iter_lines(5)))
+
+    def test_main__invalid_game(self):
+        """
+        Asserts that the command line rejects games that are not supported.
+        """
+        with self.assertRaises(SystemExit):
+            main(["3"])
@@ -0,0 +1,111 @@
+"""
+Defines tests for the lazy loading of the package and of each game's data.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+import aenir
+from aenir.morph import (
+    BaseMorph,
+    Morph6,
+)
+from aenir._exceptions import AenirError
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+def run_python(code: str) -> str:
+    """
+    Returns what `code` prints when run by a fresh interpreter that imports this package from source.
+    """
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (src, env.get("PYTHONPATH"))))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stdout
+
+class LazyImportTest(unittest.TestCase):
+    """
+    Demonstrates that importing the package imports nothing else until it is needed.
+    """
+
+    def setUp(self):
+        """
+        Logs the name of the test.
+        """
+        logger.critical("%s", self.id())
+
+    def test_import__is_lazy(self):
+        """
+        Asserts that `import aenir` reads neither Morphs, nor package metadata, nor logging configuration.
+        """
+        output = run_python(
+            "import sys, aenir; "
+            "print(sorted(name for name in ('aenir.morph', 'aenir._exceptions', 'importlib.metadata', 'logging.config') if name in sys.modules))"
+        )
+        self.assertEqual(output.strip(), "[]")
+
+    def test_getattr__imports_on_access(self):
+        """
+        Asserts that public names are importable, and are the objects declared by their modules.
+        """
+        output = run_python(
+            "import sys, aenir; "
+            "print(aenir.get_morph(6, 'Roy').current_cls, 'aenir.morph' in sys.modules, 'importlib.metadata' in sys.modules)"
+        )
+        self.assertEqual(output.split(), ["Lord", "True", "False"])
+        self.assertIs(aenir.AenirError, AenirError)
+        self.assertIsInstance(aenir.__version__, str)
+        from aenir import get_roster, SnapshotError
+        self.assertTrue(callable(get_roster))
+        self.assertTrue(issubclass(SnapshotError, AenirError))
+
+    def test_getattr__unknown_name(self):
+        """
+        Asserts that names that are not public are still missing.
+        """
+        with self.assertRaises(AttributeError):
+            aenir.get_morph_from_nowhere
+        self.assertFalse(hasattr(aenir, "Morph6"))
+
+    def test_dir(self):
+        """
+        Asserts that public names are listed before they are accessed, and that helpers of the package are not.
+        """
+        self.assertTrue(set(aenir.__all__) <= set(dir(aenir)))
+        self.assertNotIn("TYPE_CHECKING", dir(aenir))
+        self.assertFalse(hasattr(aenir, "TYPE_CHECKING"))
+
+class LazyDataTest(unittest.TestCase):
+    """
+    Demonstrates that the data of a game is only read once a unit of that game is created.
+    """
+
+    def setUp(self):
+        """
+        Discards indexes read by other tests.
+        """
+        logger.critical("%s", self.id())
+        BaseMorph.clear_indexes()
+
+    def test_get_morph__reads_only_its_game(self):
+        """
+        Asserts that creating a unit of one game indexes the tables of that game alone.
+        """
+        self.assertDictEqual(BaseMorph._indexes, {})
+        Morph6("Roy").promote()
+        paths_to_db = {path_to_db for path_to_db, _, _, _ in BaseMorph._indexes}
+        self.assertSetEqual(paths_to_db, {Morph6.path_to("cleaned_stats.db")})
@@ -0,0 +1,183 @@
+"""
+Defines tests for the opt-in instrumentation of Morphs.
+"""
+
+import io
+import json
+import threading
+import unittest
+
+from aenir import instrumentation
+from aenir.instrumentation import (
+    MetricsRegistry,
+    instrument,
+)
+from aenir.morph import (
+    BaseMorph,
+    Morph,
+    Morph6,
+    Morph9,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class MetricsRegistryTest(unittest.TestCase):
+    """
+    Demonstrates that counters and histograms are kept by name, and dumped as JSON.
+    """
+
+    def setUp(self):
+        """
+        Declares an empty registry.
+        """
+        logger.critical("%s", self.id())
+        self.metrics = MetricsRegistry()
+
+    def test_increment(self):
+        """
+        Asserts that counters start at zero and accumulate.
+        """
+        self.metrics.increment("queries")
+        self.metrics.increment("queries", 3)
+        self.assertDictEqual(self.metrics.counters, {"queries": 4})
+
+    def test_increment__from_threads(self):
+        """
+        Asserts that no increment is lost when made from several threads at once.
+        """
+        def work():
+            for _ in range(1000):
+                self.metrics.increment("stats")
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.metrics.counters["stats"], 4000)
+
+    def test_dumps(self):
+        """
+        Asserts that the JSON holds every counter and a summary of every histogram.
+        """
+        self.metrics.increment("queries", 2)
+        self.metrics.record("Morph6.level_up", 0.25)
+        actual = json.loads(self.metrics.dumps())
+        self.assertDictEqual(actual["counters"], {"queries": 2})
+        self.assertEqual(actual["histograms"]["Morph6.level_up"]["count"], 1)
+        self.assertEqual(actual["histograms"]["Morph6.level_up"]["buckets"]["0.5"], 1)
+        stream = io.StringIO()
+        self.metrics.dump(stream)
+        self.assertDictEqual(json.loads(stream.getvalue()), actual)
+
+    def test_reset(self):
+        """
+        Asserts that resetting discards everything.
+        """
+        self.metrics.increment("queries")
+        self.metrics.record("Morph6.promote", 1.0)
+        self.metrics.reset()
+        self.assertDictEqual(self.metrics.as_dict(), {"counters": {}, "histograms": {}})
+
+class InstrumentTest(unittest.TestCase):
+    """
+    Demonstrates that operations on Morphs are recorded only while instrumentation is on.
+    """
+
+    def setUp(self):
+        """
+        Discards indexes and connections, so that each test reads data afresh.
+        """
+        logger.critical("%s", self.id())
+        BaseMorph.clear_indexes()
+        BaseMorph.close_connections()
+
+    def tearDown(self):
+        """
+        Turns instrumentation off, lest a test that failed leave it on.
+        """
+        instrumentation.disable()
+
+    def test_off_by_default(self):
+        """
+        Asserts that nothing is recorded unless instrumentation is turned on.
+        """
+        self.assertFalse(instrumentation.enabled)
+        before = instrumentation.registry.as_dict()
+        Morph6("Roy").level_up(1)
+        self.assertDictEqual(instrumentation.registry.as_dict(), before)
+
+    def test_off__methods_unwrapped(self):
+        """
+        Asserts that methods are wrapped only while instrumentation is on, subclasses declared meanwhile included.
+        """
+        level_up = Morph.__dict__["level_up"]
+        init = Morph6.__dict__["__init__"]
+        self.assertFalse(hasattr(level_up, "__wrapped__"))
+        with instrument(MetricsRegistry()):
+            self.assertIs(Morph.__dict__["level_up"].__wrapped__, level_up)
+            self.assertIs(Morph6.__dict__["__init__"].__wrapped__, init)
+            class Morph6Subclass(Morph6):
+                """
+                Declares a method while instrumentation is on.
+                """
+                def get_name(self):
+                    """
+                    Returns the name of the unit.
+                    """
+                    return self.name
+            get_name = Morph6Subclass.__dict__["get_name"].__wrapped__
+        self.assertIs(Morph.__dict__["level_up"], level_up)
+        self.assertIs(Morph6.__dict__["__init__"], init)
+        self.assertIs(Morph6Subclass.__dict__["get_name"], get_name)
+
+    def test_instrument(self):
+        """
+        Asserts that each operation's time, queries, connections and allocations are recorded.
+        """
+        with instrument(MetricsRegistry()) as metrics:
+            roy = Morph6("Roy")
+            roy.level_up(1)
+        self.assertFalse(instrumentation.enabled)
+        counters = metrics.counters
+        self.assertEqual(counters["Morph6.__init__.calls"], 1)
+        self.assertEqual(counters["Morph6.__init__.connections"], 1)
+        self.assertGreater(counters["Morph6.__init__.queries"], 0)
+        # bases, growths and maxes at the least.
+        self.assertGreaterEqual(counters["Morph6.__init__.stats"], 3)
+        self.assertEqual(counters["Morph6.level_up.calls"], 1)
+        self.assertEqual(counters["connections"], 1)
+        self.assertEqual(counters["queries"], sum(counters[key] for key in counters if key.endswith(".queries")))
+        self.assertEqual(metrics.histograms["Morph6.level_up"].count, 1)
+        # nothing more is recorded once the block is left.
+        roy.level_up(1)
+        self.assertEqual(metrics.counters["Morph6.level_up.calls"], 1)
+
+    def test_instrument__nested_calls(self):
+        """
+        Asserts that calls made by an operation are counted towards it, not as operations of their own.
+        """
+        lethe = Morph9("Lethe")
+        with instrument(MetricsRegistry()) as metrics:
+            lethe.copy().equip_demi_band()
+        self.assertEqual(metrics.counters["Morph9.equip_demi_band.calls"], 1)
+        self.assertEqual(metrics.counters["Morph9.copy.calls"], 1)
+        self.assertSetEqual(set(metrics.histograms), {"Morph9.copy", "Morph9.equip_demi_band"})
+
+    def test_instrument__restores_previous_state(self):
+        """
+        Asserts that an inner block records to its own registry, and leaves the outer one as it was.
+        """
+        outer = instrumentation.enable(MetricsRegistry())
+        with instrument(MetricsRegistry()) as inner:
+            Morph6("Roy")
+        self.assertTrue(instrumentation.enabled)
+        self.assertIn("Morph6.__init__.calls", inner.counters)
+        self.assertNotIn("Morph6.__init__.calls", outer.counters)
+        Morph6("Roy")
+        self.assertEqual(outer.counters["Morph6.__init__.calls"], 1)
@@ -0,0 +1,128 @@
+"""
+Defines tests for the solver of growth-item loadouts.
+"""
+
+import itertools
+import unittest
+
+from aenir.loadouts import (
+    ExpectedStats,
+    ThresholdProbability,
+    optimize_loadout,
+)
+from aenir.morph import get_morph
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+def get_best_score(morph, objective, item_names, max_items) -> float:
+    """
+    Returns the best score of any loadout, found by brute force with Morph methods.
+    """
+    best_score = 0.0
+    for num_items in range(max_items + 1):
+        for items in itertools.combinations(item_names, num_items):
+            morph_copy = morph.copy()
+            for item_name in items:
+                if item_name == "Knight Ward":
+                    morph_copy.equip_knight_ward()
+                elif hasattr(morph_copy, "equip_scroll"):
+                    morph_copy.equip_scroll(item_name)
+                else:
+                    morph_copy.equip_band(item_name)
+            best_score = max(best_score, objective.score(morph, morph_copy.growth_rates.as_dict()))
+    return best_score
+
+class OptimizeLoadoutTest(unittest.TestCase):
+    """
+    Demonstrates that the loadouts found are the best ones, within the rules of each game.
+    """
+
+    def setUp(self):
+        """
+        Declares objectives.
+        """
+        logger.critical("%s", self.id())
+        self.objectives = (
+            ExpectedStats({"Spd": 1.0, "Str": 1.0, "Def": 0.5}, 19),
+            ExpectedStats({"HP": 1.0, "Skl": 2.0}, 19, capped=False),
+            ThresholdProbability({"Spd": 1400, "Def": 900}, 19),
+        )
+
+    def test_optimize__matches_brute_force(self):
+        """
+        Asserts that the score of the loadout found is that of the best loadout.
+        """
+        for morph in (get_morph(5, "Lara"), get_morph(9, "Gatrie")):
+            item_names = list(getattr(morph, "scroll_dict", None) or morph.band_dict)
+            if morph.game.value == 9:
+                item_names.append("Knight Ward")
+            for objective in self.objectives:
+                with self.subTest(name=morph.name, objective=objective.stat_dict):
+                    loadout = optimize_loadout(morph, objective, max_items=4)
+                    self.assertLessEqual(len(loadout.items), 4)
+                    expected = get_best_score(morph, objective, item_names, 4)
+                    self.assertAlmostEqual(loadout.score, expected)
+
+    def test_optimize__equips_loadout(self):
+        """
+        Asserts that the unit returned has the loadout equipped, and that the original does not.
+        """
+        leaf = get_morph(5, "Leaf")
+        leaf.equip_scroll("Odo")
+        loadout = optimize_loadout(leaf, self.objectives[0])
+        self.assertEqual(len(loadout.items), leaf.inventory_size)
+        self.assertTupleEqual(tuple(loadout.morph.equipped_scrolls), loadout.items)
+        self.assertListEqual(list(leaf.equipped_scrolls), ["Odo"])
+        self.assertAlmostEqual(loadout.score, self.objectives[0].score(leaf, loadout.morph.growth_rates.as_dict()))
+
+    def test_optimize__knight_ward(self):
+        """
+        Asserts that only knights are given the Knight Ward.
+        """
+        objective = ExpectedStats({"Spd": 1.0}, 19, capped=False)
+        self.assertIn("Knight Ward", optimize_loadout(get_morph(9, "Gatrie"), objective).items)
+        self.assertNotIn("Knight Ward", optimize_loadout(get_morph(9, "Ike"), objective).items)
+
+    def test_optimize__demi_band(self):
+        """
+        Asserts that an equipped Demi Band keeps its slot.
+        """
+        lethe = get_morph(9, "Lethe")
+        lethe.equip_demi_band()
+        objective = ExpectedStats({"HP": 1.0, "Str": 1.0, "Skl": 1.0, "Spd": 1.0, "Def": 1.0}, 19, capped=False)
+        loadout = optimize_loadout(lethe, objective)
+        self.assertEqual(len(loadout.items), lethe.inventory_size - 1)
+        self.assertIn("Demi Band", loadout.morph.equipped_bands)
+
+    def test_optimize__unnecessary_items(self):
+        """
+        Asserts that items which do not improve the score are left out.
+        """
+        objective = ThresholdProbability({"Spd": 500}, 1)
+        loadout = optimize_loadout(get_morph(5, "Leaf"), objective)
+        self.assertTupleEqual(loadout.items, ())
+        self.assertEqual(loadout.score, 1.0)
+
+    def test_threshold_above_max(self):
+        """
+        Asserts that a threshold above the maximum of its stat is never reached, however high the growth rate.
+        """
+        leaf = get_morph(5, "Leaf")
+        objective = ThresholdProbability({"Spd": leaf.max_stats.Spd + 100}, 19)
+        self.assertEqual(objective.score(leaf, {"Spd": 10000}), 0.0)
+        self.assertEqual(optimize_loadout(leaf, objective).score, 0.0)
+
+    def test_invalid(self):
+        """
+        Asserts that units without growth items, and objectives that reward lower stats, are rejected.
+        """
+        with self.assertRaises(NotImplementedError):
+            optimize_loadout(get_morph(6, "Roy"), self.objectives[0])
+        with self.assertRaises(ValueError):
+            ExpectedStats({"Spd": -1.0}, 19)
@@ -0,0 +1,159 @@
+"""
+Defines tests for the queue-based logging profile.
+"""
+
+import logging
+import os
+import queue
+import tempfile
+import unittest
+
+from aenir._logging import (
+    configure_logging,
+    configure_production_logging,
+    logger,
+    stop_production_logging,
+    time_logger,
+)
+from aenir._queue_logging import BoundedQueueHandler
+
+configure_logging()
+time_logger.critical("")
+
+class Unformattable:
+    """
+    Counts the times it is formatted into a message.
+    """
+
+    def __init__(self):
+        """
+        Declares the count.
+        """
+        self.num_formats = 0
+
+    def __str__(self):
+        """
+        Counts, then returns a placeholder.
+        """
+        self.num_formats += 1
+        return "<unformattable>"
+
+class BoundedQueueHandlerTest(unittest.TestCase):
+    """
+    Demonstrates that records are dropped, rather than waited on, once the queue is full.
+    """
+
+    def setUp(self):
+        """
+        Declares records to log.
+        """
+        logger.critical("%s", self.id())
+        self.records = [
+            logging.LogRecord("aenir", logging.WARNING, __file__, 0, "record %d", (index,), None)
+            for index in range(3)
+        ]
+
+    def get_messages(self, handler):
+        """
+        Returns the messages in the queue of `handler`.
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(handler.queue.get_nowait().getMessage())
+            except queue.Empty:
+                return messages
+
+    def test_drop_newest(self):
+        """
+        Asserts that records logged once the queue is full are dropped.
+        """
+        handler = BoundedQueueHandler(queue.Queue(2), "newest")
+        for record in self.records:
+            handler.handle(record)
+        self.assertEqual(handler.dropped, 1)
+        self.assertListEqual(self.get_messages(handler), ["record 0", "record 1"])
+
+    def test_drop_oldest(self):
+        """
+        Asserts that records logged once the queue is full replace those logged first.
+        """
+        handler = BoundedQueueHandler(queue.Queue(2), "oldest")
+        for record in self.records:
+            handler.handle(record)
+        self.assertEqual(handler.dropped, 1)
+        self.assertListEqual(self.get_messages(handler), ["record 1", "record 2"])
+
+    def test_invalid_drop_policy(self):
+        """
+        Asserts that unknown policies are refused.
+        """
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(queue.Queue(2), "random")
+
+class ProductionLoggingTest(unittest.TestCase):
+    """
+    Demonstrates that the production profile writes records in a thread of its own, above a configurable level.
+    """
+
+    def setUp(self):
+        """
+        Declares a file to log to.
+        """
+        logger.critical("%s", self.id())
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, "production.log")
+
+    def tearDown(self):
+        """
+        Restores the logging configuration of the tests.
+        """
+        stop_production_logging()
+        configure_logging()
+
+    def read_log(self):
+        """
+        Returns the lines written to the log once every queued record is.
+        """
+        stop_production_logging()
+        with open(self.filename) as stream:
+            return stream.read().splitlines()
+
+    def test_records_are_written(self):
+        """
+        Asserts that records at or above the level reach the file, and those below do not.
+        """
+        configure_production_logging("INFO", filename=self.filename)
+        logger.info("written: %d", 1)
+        logger.debug("not written")
+        lines = self.read_log()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("INFO:aenir.test_logging.test_records_are_written: written: 1"))
+
+    def test_disabled_levels_are_not_formatted(self):
+        """
+        Asserts that the arguments of records below the level are never formatted.
+        """
+        configure_production_logging(logging.WARNING, filename=self.filename)
+        argument = Unformattable()
+        for _ in range(100):
+            logger.debug("%s", argument)
+        self.assertEqual(argument.num_formats, 0)
+        logger.warning("%s", argument)
+        self.assertEqual(self.read_log()[-1].split(": ")[-1], "<unformattable>")
+        self.assertEqual(argument.num_formats, 1)
+
+    def test_reconfigure(self):
+        """
+        Asserts that configuring the profile again replaces it, and that stopping it detaches it.
+        """
+        configure_production_logging(filename=self.filename)
+        handler = configure_production_logging(filename=self.filename, maxsize=1, drop="oldest")
+        self.assertListEqual(logger.handlers, [handler])
+        self.assertFalse(logger.propagate)
+        stop_production_logging()
+        self.assertListEqual(logger.handlers, [])
+        self.assertTrue(logger.propagate)
+        # does nothing once stopped.
+        stop_production_logging()
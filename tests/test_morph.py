@@ -2,6 +2,7 @@
 Defines functions to test Morph functionality.
 """
 
+import copy
 import sqlite3
 import logging
 import json
@@ -14,6 +15,7 @@ from aenir.games import FireEmblemGame
 from aenir.morph import (
     get_morph,
     get_morph_class,
+    get_roster,
     BaseMorph,
     Morph,
     Morph4,
@@ -42,6 +44,7 @@ from aenir._exceptions import (
     InitError,
     TransformationError,
     DemiBandError,
+    PlanError,
 )
 
 from aenir._logging import (
@@ -347,6 +350,66 @@ class GamedMorph(unittest.TestCase):
         )
         self.assertIsNone(actual)
 
+    def test_query_db__value_contains_quotes(self):
+        """
+        Demonstrates that filter values are bound rather than spliced into the query.
+        """
+        path_to_db = "src/aenir/static/the-sacred-stones/cleaned_stats.db"
+        table = "characters__base_stats0"
+        fields = ("Name", "Class")
+        expected = [("L'Arachel", "Troubadour")]
+        actual = self.Morph.query_db(path_to_db, table, fields, {"Name": "L'Arachel"}).fetchall()
+        self.assertListEqual([tuple(record) for record in actual], expected)
+        actual = self.Morph.query_db(path_to_db, table, fields, {"Name": "' OR ''='"}).fetchall()
+        self.assertListEqual(actual, [])
+
+    def test_get_statement(self):
+        """
+        Asserts that one statement serves all values of a filter.
+        """
+        expected = "SELECT Pow, Spd FROM 'characters__base_stats0' WHERE Name=? ORDER BY rowid;"
+        actual = self.Morph.get_statement("characters__base_stats0", ("Pow", "Spd"), ("Name",))
+        self.assertEqual(actual, expected)
+        self.assertIs(actual, self.Morph.get_statement("characters__base_stats0", ("Pow", "Spd"), ("Name",)))
+        expected = "SELECT Pow, Spd FROM 'characters__base_stats0' ORDER BY rowid;"
+        actual = self.Morph.get_statement("characters__base_stats0", ("Pow", "Spd"), ())
+        self.assertEqual(actual, expected)
+
+    def test_lookup_records(self):
+        """
+        Asserts that looked-up records match those obtained by querying with `lookup` keywords.
+        """
+        home_data = ("characters__base_stats", "Roy")
+        target_data = ("classes__promotion_gains", "Class")
+        query_kwargs = self.kishuna.lookup(home_data, target_data, 0)
+        query_kwargs["fields"] += ("Promotion",)
+        expected = [dict(record) for record in self.Morph.query_db(**query_kwargs)]
+        actual = self.kishuna.lookup_records(home_data, target_data, 0, extra_fields=("Promotion",))
+        self.assertTrue(expected)
+        self.assertListEqual(actual, expected)
+        # records are copies; mutating them leaves the index intact.
+        actual.pop().clear()
+        self.assertListEqual(self.kishuna.lookup_records(home_data, target_data, 0, extra_fields=("Promotion",)), expected)
+
+    def test_lookup_records__lookup_value_dne(self):
+        """
+        Asserts that nothing is returned for units without an alias.
+        """
+        home_data = ("characters__base_stats", "Marth")
+        target_data = ("classes__maximum_stats", "Class")
+        actual = self.kishuna.lookup_records(home_data, target_data, 0)
+        self.assertIsNone(actual)
+
+    def test_get_index__built_once(self):
+        """
+        Asserts that an index is built from one query and reused thereafter.
+        """
+        self.Morph.clear_indexes()
+        with patch.object(self.Morph, "query_db", wraps=self.Morph.query_db) as MOCK_query_db:
+            for name in ("Roy", "Marcus", "Lance"):
+                self.kishuna.get_alias("characters__base_stats", "classes__maximum_stats", name)
+            self.assertEqual(MOCK_query_db.call_count, 1)
+
     def test_query_db__more_than_one_filter_provided(self):
         """
         Demonstration of multi-filter invocation.
@@ -500,6 +563,121 @@ class AllMorphs(unittest.TestCase):
         actual = holyn.current_stats
         self.assertEqual(actual, expected)
 
+    def test_copy__matches_deepcopy(self):
+        """
+        Asserts that copies hold the same state as deep copies, share reference data, and evolve independently.
+        """
+        leaf = Morph5("Leaf")
+        leaf.equip_scroll("Odo")
+        lyn = Morph7("Lyn", lyn_mode=True)
+        lyn.use_afas_drops()
+        lethe = Morph9("Lethe")
+        lethe.equip_band("Sword Band")
+        lethe.transform()
+        morphs = (
+            Morph4("Lakche", father="Lex"),
+            leaf,
+            Morph6("Roy"),
+            lyn,
+            Morph8("Ross"),
+            lethe,
+        )
+        for morph in morphs:
+            if morph.stat_boosters is not None:
+                morph.use_stat_booster(next(iter(morph.stat_boosters)))
+            expected = copy.deepcopy(morph)
+            actual = morph.copy()
+            with self.subTest(game=morph.game):
+                self.assertIs(type(actual), type(morph))
+                self.assertSetEqual(set(vars(actual)), set(vars(expected)))
+                for attr, value in vars(expected).items():
+                    actual_value = getattr(actual, attr)
+                    if isinstance(value, AbstractStats):
+                        self.assertDictEqual(actual_value.as_dict(), value.as_dict())
+                        self.assertIs(actual_value.has_been_augmented, value.has_been_augmented)
+                        self.assertIsNot(actual_value, getattr(morph, attr))
+                    elif isinstance(value, dict) and attr not in morph._shared_attributes:
+                        self.assertSetEqual(set(actual_value), set(value))
+                        self.assertIsNot(actual_value, getattr(morph, attr))
+                    elif not isinstance(value, dict):
+                        self.assertEqual(actual_value, value)
+                for attr in morph._shared_attributes:
+                    self.assertIs(getattr(actual, attr), getattr(morph, attr))
+                actual.current_stats += actual.growth_rates
+                actual.history.append((actual.current_lv, actual.current_cls))
+                self.assertDictEqual(morph.current_stats.as_dict(), expected.current_stats.as_dict())
+                self.assertListEqual(morph.history, expected.history)
+
+class RosterTest(unittest.TestCase):
+    """
+    Demonstrates that rosters are built in one pass over per-game data.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_get_roster__matches_get_morph(self):
+        """
+        Asserts that roster Morphs are identical to those built one at a time.
+        """
+        specs = ["Sigurd", ("Lakche", {"father": "Lex"}), {"name": "Skasaher", "father": "Lex"}]
+        roster = get_roster(4, specs)
+        self.assertListEqual(roster.errors, [])
+        expected = [get_morph(4, "Sigurd"), get_morph(4, "Lakche", father="Lex"), get_morph(4, "Skasaher", father="Lex")]
+        for actual, morph in zip(roster.morphs, expected, strict=True):
+            self.assertEqual(actual.name, morph.name)
+            self.assertEqual(actual.father, morph.father)
+            self.assertDictEqual(actual.current_stats.as_dict(), morph.current_stats.as_dict())
+            self.assertDictEqual(actual.growth_rates.as_dict(), morph.growth_rates.as_dict())
+            self.assertDictEqual(actual.max_stats.as_dict(), morph.max_stats.as_dict())
+
+    def test_get_roster__errors(self):
+        """
+        Asserts that invalid units are reported without aborting the batch.
+        """
+        roster = get_roster(7, ["Marth", ("Lyn", {"lyn_mode": True}), "Lyn", ("Eliwood", {"father": "Elbert"})])
+        self.assertListEqual([(morph and morph.name) for morph in roster.morphs], [None, "Lyn", None, None])
+        actual = [(spec.name, type(err)) for spec, err in roster.errors]
+        expected = [("Marth", UnitNotFoundError), ("Lyn", InitError), ("Eliwood", PlanError)]
+        self.assertListEqual(actual, expected)
+        self.assertEqual(roster.errors[2][1].reason, PlanError.Reason.INVALID_ARGUMENTS)
+
+    def test_get_roster__malformed_spec(self):
+        """
+        Asserts that a spec that cannot be parsed is reported in place, and the units around it are built.
+        """
+        malformed_specs = ({"Name": "Lance"}, ("Lance", "Cavalier", 1), ("Lance", 1))
+        for malformed_spec in malformed_specs:
+            with self.subTest(spec=malformed_spec):
+                roster = get_roster(6, ["Roy", malformed_spec, "Marcus"])
+                self.assertListEqual([(morph and morph.name) for morph in roster.morphs], ["Roy", None, "Marcus"])
+                ((spec, err),) = roster.errors
+                self.assertEqual(spec, malformed_spec)
+                self.assertIsInstance(err, PlanError)
+                self.assertEqual(err.reason, PlanError.Reason.MALFORMED)
+
+    def test_get_roster__one_query_per_table(self):
+        """
+        Asserts that each table is queried once, however many units are built.
+        """
+        query_db = BaseMorph.query_db.__func__
+        tables = []
+        def counting_query_db(cls, path_to_db, table, *args, **kwargs):
+            """
+            Records the table queried.
+            """
+            tables.append(table)
+            return query_db(cls, path_to_db, table, *args, **kwargs)
+        BaseMorph.clear_indexes()
+        with patch.object(BaseMorph, "query_db", classmethod(counting_query_db)):
+            roster = get_roster(9, Morph9.CHARACTERS())
+        self.assertListEqual(roster.errors, [])
+        self.assertEqual(len(roster.morphs), len(Morph9.CHARACTERS()))
+        self.assertCountEqual(tables, set(tables))
+
 class Morph6Class2(unittest.TestCase):
     """
     Demonstrates Morph being subclassed properly.
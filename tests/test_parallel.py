@@ -0,0 +1,188 @@
+"""
+Defines tests for the evaluation of plans across worker processes.
+"""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+from aenir.build import build_artifact
+from aenir.morph import (
+    BaseMorph,
+    Morph6,
+    UnitSpec,
+)
+from aenir.parallel import (
+    _get_artifact_key,
+    evaluate_plans,
+    iter_evaluate_plans,
+)
+from aenir.plans import (
+    Operation,
+    Plan,
+    PlanResult,
+    evaluate_plan,
+)
+from aenir._database import (
+    DataBackend,
+    get_artifact,
+)
+from aenir._exceptions import PlanError
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class EvaluatePlansTest(unittest.TestCase):
+    """
+    Demonstrates that plans evaluated in parallel agree with plans evaluated one at a time.
+    """
+
+    def setUp(self):
+        """
+        Declares plans across several games, some of which fail.
+        """
+        logger.critical("%s", self.id())
+        self.plans = [
+            {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": 9}, "promote"]},
+            {"game_no": 7, "unit": {"name": "Lyn", "lyn_mode": True}, "operations": [{"op": "level_up", "num_levels": 5}]},
+            {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": 20}]},
+            {"game_no": 8, "unit": "Eirika"},
+            {"game_no": 4, "unit": {"name": "Lakche", "father": "Lex"}, "operations": [{"op": "level_up", "num_levels": 3}]},
+            {"game_no": 3, "unit": "Marth"},
+            {"game_no": 9, "unit": "Ike", "operations": ["promote"]},
+        ] * 3
+
+    def test_evaluate_plans__matches_sequential(self):
+        """
+        Asserts that results from a pool of workers are those of `evaluate_plan`, in the order of the plans.
+        """
+        expected = [evaluate_plan(plan) for plan in self.plans]
+        actual = evaluate_plans(self.plans, max_workers=2, chunksize=2)
+        self.assertListEqual(actual, expected)
+        self.assertListEqual(evaluate_plans(self.plans, max_workers=1), expected)
+
+    def test_evaluate_plans__errors(self):
+        """
+        Asserts that failing plans are reported without aborting the others.
+        """
+        results = evaluate_plans(self.plans[:7], max_workers=2)
+        self.assertEqual(results[0].current_cls, "Master Lord")
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[2].error[0], "LevelUpError")
+        self.assertIsNone(results[2].current_stats)
+        self.assertEqual(results[5].error[0], "NotImplementedError")
+        self.assertIsNone(results[6].error)
+
+    def test_evaluate_plans__malformed(self):
+        """
+        Asserts that malformed plans are rejected before any are evaluated.
+        """
+        with self.assertRaises(PlanError) as err:
+            evaluate_plans(self.plans + [{"unit": "Roy"}], max_workers=2)
+        self.assertEqual(err.exception.reason, PlanError.Reason.MALFORMED)
+        self.assertListEqual(evaluate_plans([]), [])
+
+class ArtifactWorkersTest(unittest.TestCase):
+    """
+    Demonstrates that workers read static data from the artifact their parent reads it from.
+    """
+
+    def setUp(self):
+        """
+        Builds an artifact, and reads static data from it.
+        """
+        logger.critical("%s", self.id())
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, "aenir.db")
+        build_artifact(self.path, version="1")
+        BaseMorph.clear_indexes()
+        BaseMorph.use_artifact(self.path)
+        self.plans = [
+            {"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": 9}, "promote"]},
+            {"game_no": 9, "unit": "Ike", "operations": ["promote"]},
+            {"game_no": 4, "unit": {"name": "Lakche", "father": "Lex"}},
+        ] * 2
+
+    def tearDown(self):
+        """
+        Switches back to the default data backend.
+        """
+        BaseMorph.data_backend = DataBackend.SQLITE
+        BaseMorph.clear_indexes()
+
+    def test_evaluate_plans(self):
+        """
+        Asserts that workers open the artifact of their parent, and agree with it.
+        """
+        self.assertTupleEqual(_get_artifact_key(), (get_artifact().path, get_artifact().checksum))
+        expected = [evaluate_plan(plan) for plan in self.plans]
+        self.assertListEqual(evaluate_plans(self.plans, max_workers=2, chunksize=1), expected)
+        self.assertListEqual(list(iter_evaluate_plans(self.plans, max_workers=2, chunksize=1)), expected)
+
+    def test_replaced_artifact(self):
+        """
+        Asserts that workers refuse an artifact whose data is not that of the one their parent serves.
+        """
+        new_path = os.path.join(self.directory, "new.db")
+        build_artifact(new_path, version="2", game_nos=(4, 6, 9))
+        os.replace(new_path, self.path)
+        with self.assertRaises(BrokenProcessPool):
+            evaluate_plans(self.plans, max_workers=2)
+
+class PlanTest(unittest.TestCase):
+    """
+    Demonstrates the declaration of plans and their results.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_parse(self):
+        """
+        Asserts that plans are parsed into a canonical form that survives a round trip.
+        """
+        plan = Plan.parse(
+            {"game_no": "7", "unit": {"name": "Lyn", "lyn_mode": True}, "operations": [{"op": "level_up", "num_levels": 5}]}
+        )
+        expected = Plan(7, UnitSpec("Lyn", (("lyn_mode", True),)), (Operation.of("level_up", num_levels=5),))
+        self.assertTupleEqual(plan, expected)
+        self.assertTupleEqual(Plan.parse(plan.as_dict()), plan)
+        self.assertIs(Plan.parse(plan), plan)
+
+    def test_create_morph__invalid_arguments(self):
+        """
+        Asserts that initialization parameters a game does not accept fail their plan only,
+        whereas a TypeError raised by an operation itself is not mistaken for a failed plan.
+        """
+        plan = Plan.parse({"game_no": 6, "unit": {"name": "Roy", "father": "Eliwood"}})
+        with self.assertRaises(PlanError) as err:
+            plan.create_morph()
+        self.assertEqual(err.exception.reason, PlanError.Reason.INVALID_ARGUMENTS)
+        self.assertEqual(evaluate_plan(plan).error[0], "PlanError")
+        plan = Plan.parse({"game_no": 6, "unit": "Roy", "operations": [{"op": "level_up", "num_levels": 1}]})
+        with patch.object(Morph6, "level_up", autospec=True, side_effect=TypeError("bug")):
+            with self.assertRaises(TypeError):
+                evaluate_plan(plan)
+
+    def test_result_as_dict(self):
+        """
+        Asserts that stats are keyed by name, and errors by type and message.
+        """
+        result = evaluate_plan({"game_no": 6, "unit": "Roy"}).as_dict()
+        self.assertEqual(result["current_lv"], 1)
+        self.assertEqual(list(result["current_stats"])[0], "HP")
+        self.assertIsNone(result["error"])
+        result = PlanResult(6, "Roy", error=("LevelUpError", "message")).as_dict()
+        self.assertDictEqual(result["error"], {"type": "LevelUpError", "message": "message"})
@@ -0,0 +1,121 @@
+"""
+Defines tests for the parsing and application of plans.
+"""
+
+import unittest
+
+from aenir.morph import get_morph
+from aenir.plans import (
+    Operation,
+    apply_operation,
+    apply_plan,
+    parse_plan,
+)
+from aenir._exceptions import (
+    PlanError,
+    PromotionError,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class OperationTest(unittest.TestCase):
+    """
+    Demonstrates the ways in which operations may be declared.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_of(self):
+        """
+        Asserts that kwargs are stored in a canonical, hashable form.
+        """
+        operation1 = Operation.of("set_bands", bands=["Sword Band", "Knight Ward"])
+        operation2 = Operation("set_bands", (("bands", ("Sword Band", "Knight Ward")),))
+        self.assertEqual(operation1, operation2)
+        self.assertEqual(hash(operation1), hash(operation2))
+
+    def test_parse(self):
+        """
+        Asserts that names, mappings and Operations are all accepted.
+        """
+        expected = (
+            Operation.of("level_up", num_levels=5),
+            Operation.of("promote"),
+            Operation.of("promote", promo_cls="Paladin"),
+        )
+        actual = parse_plan(
+            [
+                {"op": "level_up", "num_levels": 5},
+                "promote",
+                Operation.of("promote", promo_cls="Paladin"),
+            ]
+        )
+        self.assertTupleEqual(actual, expected)
+        for operation in expected:
+            self.assertEqual(Operation.parse(operation.as_dict()), operation)
+
+    def test_parse__malformed(self):
+        """
+        Asserts that uninterpretable operations are reported.
+        """
+        for operation in (5, {"num_levels": 5}, ["level_up"]):
+            with self.assertRaises(PlanError) as err_ctx:
+                Operation.parse(operation)
+            self.assertIs(err_ctx.exception.reason, PlanError.Reason.MALFORMED)
+
+class ApplyOperationTest(unittest.TestCase):
+    """
+    Demonstrates that operations are dispatched to Morph methods, and only to whitelisted ones.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_apply_plan(self):
+        """
+        Asserts that a plan has the same effect as the corresponding method calls.
+        """
+        expected = get_morph(6, "Roy")
+        expected.level_up(9)
+        expected.promote()
+        expected.use_stat_booster("Angelic Robe")
+        actual = get_morph(6, "Roy")
+        apply_plan(actual, [{"op": "level_up", "num_levels": 9}, "promote", {"op": "use_stat_booster", "item_name": "Angelic Robe"}])
+        self.assertEqual(actual.current_cls, expected.current_cls)
+        self.assertDictEqual(actual.current_stats.as_dict(), expected.current_stats.as_dict())
+
+    def test_apply_operation__unknown(self):
+        """
+        Asserts that non-whitelisted methods, and methods the unit lacks, cannot be called.
+        """
+        roy = get_morph(6, "Roy")
+        for name in ("copy", "__init__", "transform", "equip_scroll"):
+            with self.assertRaises(PlanError) as err_ctx:
+                apply_operation(roy, Operation.of(name))
+            self.assertIs(err_ctx.exception.reason, PlanError.Reason.UNKNOWN_OPERATION)
+            self.assertIn("level_up", err_ctx.exception.valid_operations)
+            self.assertNotIn("transform", err_ctx.exception.valid_operations)
+
+    def test_apply_operation__invalid_arguments(self):
+        """
+        Asserts that bad kwargs are reported, and that errors raised by the Morph propagate.
+        """
+        allen = get_morph(6, "Allen")
+        with self.assertRaises(PlanError) as err_ctx:
+            apply_operation(allen, Operation.of("level_up", levels=5))
+        self.assertIs(err_ctx.exception.reason, PlanError.Reason.INVALID_ARGUMENTS)
+        with self.assertRaises(PromotionError):
+            apply_operation(allen, Operation.of("promote"))
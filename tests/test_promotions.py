@@ -0,0 +1,136 @@
+"""
+Defines tests for the search over promotion routes.
+"""
+
+import unittest
+
+from aenir.morph import get_morph
+from aenir.plans import (
+    Operation,
+    apply_plan,
+)
+from aenir.promotions import (
+    rank_promotion_paths,
+    search_promotion_paths,
+)
+from aenir._exceptions import (
+    LevelUpError,
+    PromotionError,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+def get_every_final_stats(morph) -> list[tuple]:
+    """
+    Returns the final stats of every route, found by brute force.
+    """
+    final_stats = []
+    while True:
+        final_morph = morph.copy()
+        try:
+            while True:
+                final_morph.level_up(1)
+        except LevelUpError:
+            final_stats.append(tuple(final_morph.current_stats.as_dict().values()))
+        for promo_cls in morph.get_promotion_list():
+            promoted_morph = morph.copy()
+            promoted_morph.promo_cls = promo_cls
+            try:
+                promoted_morph.promote(promo_cls=promo_cls)
+            except PromotionError:
+                continue
+            final_stats.extend(get_every_final_stats(promoted_morph))
+        try:
+            morph.level_up(1)
+        except LevelUpError:
+            return final_stats
+
+class SearchPromotionPathsTest(unittest.TestCase):
+    """
+    Demonstrates that the routes found are exactly the Pareto-optimal ones.
+    """
+
+    def setUp(self):
+        """
+        Logs test ID.
+        """
+        logger.critical("%s", self.id())
+
+    def test_search__pareto_optimal(self):
+        """
+        Asserts that no route found is dominated, and that every route is dominated by or equal to one found.
+        """
+        for game_no, name in ((8, "Ross"), (8, "Amelia"), (6, "Lance"), (5, "Leaf"), (4, "Sigurd")):
+            morph = get_morph(game_no, name)
+            paths = search_promotion_paths(morph)
+            found = [tuple(path.morph.current_stats.as_dict().values()) for path in paths]
+            with self.subTest(game=game_no, name=name):
+                self.assertEqual(len(set(found)), len(found))
+                for values in found:
+                    dominators = [
+                        other for other in found
+                        if other != values and all(x >= y for x, y in zip(other, values))
+                    ]
+                    self.assertListEqual(dominators, [])
+                for values in get_every_final_stats(morph.copy()):
+                    self.assertTrue(any(all(x >= y for x, y in zip(other, values)) for other in found))
+
+    def test_search__routes_replay(self):
+        """
+        Asserts that each route, performed as a plan, reproduces the unit at the end of it.
+        """
+        ross = get_morph(8, "Ross")
+        paths = search_promotion_paths(ross)
+        self.assertGreater(len(paths), 1)
+        for path in paths:
+            expected = get_morph(8, "Ross")
+            apply_plan(expected, path.operations)
+            with self.subTest(operations=path.operations):
+                self.assertEqual(path.morph.current_cls, expected.current_cls)
+                self.assertDictEqual(path.morph.current_stats.as_dict(), expected.current_stats.as_dict())
+                self.assertEqual(path.operations[-2].name, "promote")
+        self.assertEqual(ross.current_lv, 1)
+        self.assertListEqual(ross.history, [])
+
+    def test_search__lara(self):
+        """
+        Asserts that Lara's routes through the Dancer class are searched.
+        """
+        paths = search_promotion_paths(get_morph(5, "Lara"))
+        promotions = {operation.kwargs for path in paths for operation in path.operations if operation.name == "promote"}
+        self.assertIn((("promo_cls", "Dancer"),), promotions)
+
+    def test_search__stats(self):
+        """
+        Asserts that comparing a single stat yields the single best route for it.
+        """
+        ross = get_morph(8, "Ross")
+        best_spd = max(path.morph.current_stats.Spd for path in search_promotion_paths(ross))
+        paths = search_promotion_paths(ross, stats=["Spd"])
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(paths[0].morph.current_stats.Spd, best_spd)
+
+    def test_search__no_promotions(self):
+        """
+        Asserts that a unit who cannot promote is simply levelled up.
+        """
+        marcus = get_morph(7, "Marcus")
+        paths = search_promotion_paths(marcus)
+        self.assertEqual(len(paths), 1)
+        self.assertTupleEqual(paths[0].operations, (Operation.of("level_up", num_levels=20 - marcus.current_lv),))
+
+    def test_rank_promotion_paths(self):
+        """
+        Asserts that routes are ordered by the weighted sum of their stats.
+        """
+        paths = search_promotion_paths(get_morph(8, "Amelia"))
+        ranked = rank_promotion_paths(paths, {"Spd": 1.0, "Skl": 0.5})
+        scores = [path.morph.current_stats.Spd + 0.5 * path.morph.current_stats.Skl for path in ranked]
+        self.assertListEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(ranked[0].as_dict()["current_cls"], ranked[0].morph.current_cls)
@@ -0,0 +1,366 @@
+"""
+Defines tests for the HTTP server of sessions.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from aenir.morph import (
+    Morph6,
+    get_morph,
+)
+from aenir.server import (
+    AenirServer,
+    LatencyHistogram,
+    MAX_HEADERS,
+    SessionStore,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class LatencyHistogramTest(unittest.TestCase):
+    """
+    Demonstrates that durations are counted into the right buckets.
+    """
+
+    def setUp(self):
+        """
+        Declares a histogram with a few buckets.
+        """
+        logger.critical("%s", self.id())
+        self.histogram = LatencyHistogram((1.0, 10.0, float("inf")))
+
+    def test_record(self):
+        """
+        Asserts that each duration is counted in the first bucket whose bound is no lower.
+        """
+        for duration in (0.5, 1.0, 5.0, 20.0):
+            self.histogram.record(duration)
+        actual = self.histogram.as_dict()
+        self.assertEqual(actual["count"], 4)
+        self.assertDictEqual(actual["buckets"], {"1.0": 2, "10.0": 1, "+Inf": 1})
+        self.assertEqual(actual["max_ms"], 20.0)
+        self.assertAlmostEqual(actual["mean_ms"], 26.5 / 4)
+
+    def test_percentile(self):
+        """
+        Asserts that percentiles are the bounds of the buckets they fall in, but never above the maximum.
+        """
+        self.assertEqual(self.histogram.percentile(50), 0.0)
+        for duration in [0.5] * 9 + [5.0]:
+            self.histogram.record(duration)
+        self.assertEqual(self.histogram.percentile(50), 1.0)
+        self.assertEqual(self.histogram.percentile(90), 1.0)
+        self.assertEqual(self.histogram.percentile(99), 5.0)
+
+class SessionStoreTest(unittest.TestCase):
+    """
+    Demonstrates that the least recently used sessions are evicted.
+    """
+
+    def setUp(self):
+        """
+        Declares a store of two sessions.
+        """
+        logger.critical("%s", self.id())
+        self.store = SessionStore(maxsize=2)
+        self.morph = get_morph(6, "Roy")
+
+    def test_add__evicts_least_recently_used(self):
+        """
+        Asserts that the session used least recently is the one evicted.
+        """
+        first = self.store.add(6, self.morph)
+        second = self.store.add(6, self.morph)
+        self.store.get(first.session_id)
+        third = self.store.add(6, self.morph)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.evictions, 1)
+        self.assertIs(self.store.get(first.session_id), first)
+        self.assertIs(self.store.get(third.session_id), third)
+        with self.assertRaises(Exception) as err:
+            self.store.get(second.session_id)
+        self.assertEqual(err.exception.status, 404)
+
+    def test_init__maxsize_not_positive(self):
+        """
+        Asserts that a store must hold at least one session.
+        """
+        with self.assertRaises(ValueError):
+            SessionStore(maxsize=0)
+
+class AenirServerTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Demonstrates that each endpoint operates on the unit of a session as a Morph would.
+    """
+
+    def setUp(self):
+        """
+        Declares a server with a small pool.
+        """
+        logger.critical("%s", self.id())
+        self.server = AenirServer(max_sessions=8, max_workers=2)
+
+    async def asyncTearDown(self):
+        """
+        Shuts the pool down.
+        """
+        await self.server.close()
+
+    async def create(self, game_no, unit):
+        """
+        Returns the id of a new session for `unit`.
+        """
+        status, payload = await self.server.handle_request("POST", "/sessions", {"game_no": game_no, "unit": unit})
+        self.assertEqual(status, 201, payload)
+        return payload["session_id"]
+
+    async def test_create_and_get(self):
+        """
+        Asserts that a session holds the unit it was created with.
+        """
+        session_id = await self.create(4, {"name": "Lakche", "father": "Lex"})
+        status, payload = await self.server.handle_request("GET", f"/sessions/{session_id}")
+        self.assertEqual(status, 200)
+        morph = get_morph(4, "Lakche", father="Lex")
+        self.assertEqual(payload["morph"]["name"], "Lakche")
+        self.assertDictEqual(payload["morph"]["current_stats"], morph.current_stats.as_dict())
+
+    async def test_create__invalid(self):
+        """
+        Asserts that units that do not exist, or cannot be interpreted, are reported.
+        """
+        status, payload = await self.server.handle_request("POST", "/sessions", {"game_no": 6, "unit": "Marth"})
+        self.assertEqual(status, 404)
+        self.assertEqual(payload["error"], "UnitNotFoundError")
+        status, payload = await self.server.handle_request("POST", "/sessions", {"unit": "Roy"})
+        self.assertEqual(status, 400)
+        status, payload = await self.server.handle_request("POST", "/sessions", {"game_no": 3, "unit": "Marth"})
+        self.assertEqual(status, 400)
+        self.assertEqual(payload["error"], "NotImplementedError")
+        status, payload = await self.server.handle_request("POST", "/sessions", {"game_no": 6, "unit": {"name": "Roy", "father": "Eliwood"}})
+        self.assertEqual(status, 400)
+        self.assertEqual(payload["reason"], "INVALID_ARGUMENTS")
+
+    async def test_invalid_argument_types(self):
+        """
+        Asserts that arguments of the wrong type are refused, whereas errors raised by operations themselves are not blamed on the client.
+        """
+        session_id = await self.create(6, "Roy")
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/level_up", {"num_levels": "5"})
+        self.assertEqual(status, 400)
+        self.assertEqual(payload["error"], "PlanError")
+        self.assertEqual(payload["reason"], "INVALID_ARGUMENTS")
+        with patch.object(Morph6, "level_up", autospec=True, side_effect=TypeError("bug")):
+            with self.assertLogs(logger, "ERROR"):
+                status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/level_up", {"num_levels": 5})
+        self.assertEqual(status, 500)
+
+    async def test_level_up_and_promote(self):
+        """
+        Asserts that operations accumulate on the unit of a session.
+        """
+        session_id = await self.create(6, "Roy")
+        status, _ = await self.server.handle_request("POST", f"/sessions/{session_id}/level_up", {"num_levels": 19})
+        self.assertEqual(status, 200)
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/promote")
+        self.assertEqual(status, 200)
+        roy = get_morph(6, "Roy")
+        roy.level_up(19)
+        roy.promote()
+        self.assertEqual(payload["morph"]["current_cls"], roy.current_cls)
+        self.assertDictEqual(payload["morph"]["current_stats"], roy.current_stats.as_dict())
+
+    async def test_level_up__failure_leaves_unit_unchanged(self):
+        """
+        Asserts that a failed operation is reported, and that the unit is as it was.
+        """
+        session_id = await self.create(6, "Roy")
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/level_up", {"num_levels": 99})
+        self.assertEqual(status, 400)
+        self.assertEqual(payload["error"], "LevelUpError")
+        self.assertEqual(payload["reason"], "EXCEEDS_MAX")
+        _, payload = await self.server.handle_request("GET", f"/sessions/{session_id}")
+        self.assertEqual(payload["morph"]["current_lv"], 1)
+
+    async def test_boost(self):
+        """
+        Asserts that stat boosters are used.
+        """
+        session_id = await self.create(6, "Roy")
+        _, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/boost", {"item_name": "Energy Ring"})
+        roy = get_morph(6, "Roy")
+        roy.use_stat_booster("Energy Ring")
+        self.assertDictEqual(payload["morph"]["current_stats"], roy.current_stats.as_dict())
+
+    async def test_equip(self):
+        """
+        Asserts that scrolls and bands are equipped, and that units of other games are refused.
+        """
+        session_id = await self.create(5, "Leaf")
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/equip", {"item_name": "Odo"})
+        self.assertEqual(status, 200, payload)
+        self.assertListEqual(payload["morph"]["equipped"], ["Odo"])
+        session_id = await self.create(9, "Ike")
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/equip", {"item_name": "Sword Band"})
+        self.assertEqual(status, 200, payload)
+        self.assertIn("Sword Band", payload["morph"]["equipped"])
+        session_id = await self.create(6, "Roy")
+        status, _ = await self.server.handle_request("POST", f"/sessions/{session_id}/equip", {"item_name": "Odo"})
+        self.assertEqual(status, 400)
+
+    async def test_transform(self):
+        """
+        Asserts that laguz transform, and that others are refused.
+        """
+        session_id = await self.create(9, "Lethe")
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/transform")
+        self.assertEqual(status, 200, payload)
+        self.assertTrue(payload["morph"]["is_transformed"])
+        session_id = await self.create(9, "Ike")
+        status, payload = await self.server.handle_request("POST", f"/sessions/{session_id}/transform")
+        self.assertEqual(status, 400)
+        self.assertEqual(payload["error"], "TransformationError")
+
+    async def test_compare(self):
+        """
+        Asserts that the difference of current stats is reported, for units of the same game only.
+        """
+        roy_id = await self.create(6, "Roy")
+        marcus_id = await self.create(6, "Marcus")
+        status, payload = await self.server.handle_request("POST", "/compare", {"sessions": [roy_id, marcus_id]})
+        self.assertEqual(status, 200)
+        expected = get_morph(6, "Roy").current_stats > get_morph(6, "Marcus").current_stats
+        self.assertDictEqual(payload["difference"], expected.as_dict())
+        ike_id = await self.create(9, "Ike")
+        status, _ = await self.server.handle_request("POST", "/compare", {"sessions": [roy_id, ike_id]})
+        self.assertEqual(status, 400)
+
+    async def test_delete_and_evict(self):
+        """
+        Asserts that deleted and evicted sessions are gone.
+        """
+        session_id = await self.create(6, "Roy")
+        status, _ = await self.server.handle_request("DELETE", f"/sessions/{session_id}")
+        self.assertEqual(status, 200)
+        status, _ = await self.server.handle_request("GET", f"/sessions/{session_id}")
+        self.assertEqual(status, 404)
+        first_id = await self.create(6, "Roy")
+        for _ in range(8):
+            await self.create(6, "Roy")
+        status, _ = await self.server.handle_request("POST", f"/sessions/{first_id}/promote")
+        self.assertEqual(status, 404)
+
+    async def test_unknown_routes(self):
+        """
+        Asserts that unknown paths and methods are reported.
+        """
+        status, _ = await self.server.handle_request("GET", "/nowhere")
+        self.assertEqual(status, 404)
+        status, _ = await self.server.handle_request("PUT", "/sessions")
+        self.assertEqual(status, 405)
+        status, _ = await self.server.handle_request("POST", "/sessions/abc/jump")
+        self.assertEqual(status, 404)
+
+    async def test_overloaded(self):
+        """
+        Asserts that requests are turned away while the pool has as much queued as it may.
+        """
+        server = AenirServer(max_workers=1, max_pending=1)
+        try:
+            first, second = await asyncio.gather(
+                server.handle_request("POST", "/sessions", {"game_no": 6, "unit": "Roy"}),
+                server.handle_request("POST", "/sessions", {"game_no": 6, "unit": "Roy"}),
+            )
+        finally:
+            await server.close()
+        self.assertEqual(sorted((first[0], second[0])), [201, 503])
+
+    async def test_metrics(self):
+        """
+        Asserts that the latency of each endpoint is counted.
+        """
+        session_id = await self.create(6, "Roy")
+        await self.server.handle_request("POST", f"/sessions/{session_id}/level_up", {"num_levels": 1})
+        await self.server.handle_request("POST", f"/sessions/{session_id}/level_up", {"num_levels": 1})
+        status, payload = await self.server.handle_request("GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["sessions"], 1)
+        self.assertEqual(payload["latency"]["create"]["count"], 1)
+        self.assertEqual(payload["latency"]["level_up"]["count"], 2)
+        self.assertEqual(payload["responses"], {"200": 2, "201": 1})
+
+    async def test_oversized_requests(self):
+        """
+        Asserts that request lines and header lines that are too long, and too many header lines, are answered and refused.
+        """
+        host, port = await self.server.start("127.0.0.1", 0)
+        requests = (
+            (b"GET /" + b"a" * (1 << 17) + b" HTTP/1.1\r\n\r\n", 400),
+            (b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * (1 << 17) + b"\r\n\r\n", 431),
+            (b"GET /health HTTP/1.1\r\n" + b"X-Header: a\r\n" * (MAX_HEADERS + 1) + b"\r\n", 431),
+        )
+        for data, status in requests:
+            with self.subTest(status=status):
+                reader, writer = await asyncio.open_connection(host, port)
+                try:
+                    writer.write(data)
+                    await writer.drain()
+                    status_line = await reader.readline()
+                    self.assertIn(b" %d " % status, status_line)
+                finally:
+                    writer.close()
+                    try:
+                        await writer.wait_closed()
+                    except ConnectionError:
+                        pass
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b"GET /health HTTP/1.1\r\n" + b"X-Header: a\r\n" * MAX_HEADERS + b"\r\n")
+        await writer.drain()
+        self.assertIn(b" 200 ", await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_over_http(self):
+        """
+        Asserts that requests over a socket, on one kept-alive connection, are answered in order.
+        """
+        host, port = await self.server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(host, port)
+
+        async def request(method, path, body=None):
+            data = b"" if body is None else json.dumps(body).encode()
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            payload = json.loads(await reader.readexactly(int(headers["content-length"])))
+            return int(status_line.split()[1]), payload
+
+        try:
+            status, payload = await request("POST", "/sessions", {"game_no": 8, "unit": "Ross"})
+            self.assertEqual(status, 201)
+            status, payload = await request("POST", f"/sessions/{payload['session_id']}/level_up", {"num_levels": 9})
+            self.assertEqual(status, 200)
+            self.assertEqual(payload["morph"]["current_lv"], 10)
+            status, payload = await request("GET", "/health")
+            self.assertDictEqual(payload, {"status": "ok"})
+            writer.write(b"POST /sessions HTTP/1.1\r\nContent-Length: 3\r\n\r\n{{{")
+            status_line = await reader.readline()
+            self.assertIn(b" 400 ", status_line)
+        finally:
+            writer.close()
+            await writer.wait_closed()
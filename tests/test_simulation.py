@@ -0,0 +1,164 @@
+"""
+Defines tests for the Monte Carlo simulation of level-ups.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import aenir.simulation
+from aenir.morph import get_morph
+from aenir.plans import (
+    Operation,
+    apply_plan,
+)
+from aenir.simulation import (
+    compile_plan,
+    simulate,
+)
+from aenir._exceptions import (
+    LevelUpError,
+    PlanError,
+)
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+class SimulationTest(unittest.TestCase):
+    """
+    Demonstrates that simulated outcomes agree with what Morph methods do.
+    """
+
+    def setUp(self):
+        """
+        Declares a plan for Roy.
+        """
+        logger.critical("%s", self.id())
+        self.roy = get_morph(6, "Roy")
+        self.plan = [
+            Operation.of("level_up", num_levels=9),
+            Operation.of("promote"),
+            Operation.of("level_up", num_levels=10),
+        ]
+
+    def test_simulate__mean_matches_level_up(self):
+        """
+        Asserts that the mean outcome approximates the expected values computed by `level_up`.
+        """
+        expected = self.roy.copy()
+        apply_plan(expected, self.plan)
+        result = simulate(self.roy, self.plan, 20000, seed=0)
+        self.assertEqual(result.num_trials, 20000)
+        for stat, value in result.mean().as_dict().items():
+            with self.subTest(stat=stat):
+                # expected values are capped at the end, so they can only exceed the mean.
+                self.assertAlmostEqual(value, getattr(expected.current_stats, stat), delta=10)
+
+    def test_simulate__morph_unchanged(self):
+        """
+        Asserts that the simulated unit is left as it was.
+        """
+        before = self.roy.current_stats.as_dict()
+        simulate(self.roy, self.plan, 10, seed=0)
+        self.assertEqual(self.roy.current_lv, 1)
+        self.assertEqual(self.roy.current_cls, "Lord")
+        self.assertDictEqual(self.roy.current_stats.as_dict(), before)
+
+    def test_simulate__capped(self):
+        """
+        Asserts that no trial exceeds the maximum stats, and that capping is reported.
+        """
+        result = simulate(self.roy, self.plan, 20000, seed=0)
+        for (stat, distribution), max_stat in zip(result.distributions().items(), result.max_stats):
+            with self.subTest(stat=stat):
+                self.assertLessEqual(max(distribution), max_stat)
+                self.assertAlmostEqual(sum(distribution.values()), 1.0)
+        self.assertGreater(result.probability_capped()["Skl"], 0.0)
+        self.assertEqual(result.probability_capped()["HP"], 0.0)
+
+    def test_simulate__summaries(self):
+        """
+        Asserts that percentiles and threshold-probabilities are consistent with one another.
+        """
+        result = simulate(self.roy, self.plan, 20000, seed=0)
+        low, median, high = (result.percentile(percent).as_dict() for percent in (5, 50, 95))
+        for stat in median:
+            with self.subTest(stat=stat):
+                self.assertLessEqual(low[stat], median[stat])
+                self.assertLessEqual(median[stat], high[stat])
+        self.assertGreaterEqual(result.probability_at_least({"Spd": median["Spd"]}), 0.5)
+        self.assertEqual(result.probability_at_least({"Mov": 600, "Con": 800}), 1.0)
+        self.assertEqual(result.probability_at_least({"Spd": 2600}), 0.0)
+
+    def test_simulate__seeded(self):
+        """
+        Asserts that seeded simulations are reproducible.
+        """
+        result1 = simulate(self.roy, self.plan, 1000, seed=7)
+        result2 = simulate(self.roy, self.plan, 1000, seed=7)
+        self.assertDictEqual(result1.distributions(), result2.distributions())
+
+    def test_simulate__deterministic_operations(self):
+        """
+        Asserts that plans without level-ups reproduce the Morph's stats exactly.
+        """
+        lethe = get_morph(9, "Lethe")
+        lethe.level_up(5)
+        ross = get_morph(8, "Ross")
+        ross.level_up(9)
+        lara = get_morph(5, "Lara")
+        lara.level_up(8)
+        cases = (
+            (get_morph(6, "Roy"), ["promote", {"op": "use_stat_booster", "item_name": "Energy Ring"}]),
+            (ross, [{"op": "promote", "promo_cls": ross.get_promotion_list()[0]}]),
+            (lethe, ["transform", {"op": "use_stat_booster", "item_name": "Energy Drop"}, "revert"]),
+            (lara, [{"op": "promote", "promo_cls": "Dancer"}, {"op": "equip_scroll", "scroll_name": "Odo"}]),
+        )
+        for morph, plan in cases:
+            expected = morph.copy()
+            apply_plan(expected, plan)
+            result = simulate(morph, plan, 5, seed=0)
+            with self.subTest(game=morph.game, name=morph.name):
+                self.assertDictEqual(result.percentile(0).as_dict(), expected.current_stats.as_dict())
+                self.assertDictEqual(result.percentile(100).as_dict(), expected.current_stats.as_dict())
+
+    def test_simulate__stdlib_fallback(self):
+        """
+        Asserts that trials run without numpy, and agree with those run with it.
+        """
+        with patch.object(aenir.simulation, "numpy", None):
+            result = simulate(self.roy, self.plan, 2000, seed=0)
+        self.assertIsInstance(result.samples, list)
+        self.assertEqual(result.num_trials, 2000)
+        expected = self.roy.copy()
+        apply_plan(expected, self.plan)
+        for stat, value in result.mean().as_dict().items():
+            with self.subTest(stat=stat):
+                self.assertAlmostEqual(value, getattr(expected.current_stats, stat), delta=50)
+
+    def test_simulate__invalid_plan(self):
+        """
+        Asserts that plans are validated before any trials are run.
+        """
+        with self.assertRaises(LevelUpError):
+            simulate(self.roy, [Operation.of("level_up", num_levels=20)], 10)
+        with self.assertRaises(PlanError):
+            simulate(self.roy, ["copy"], 10)
+        with self.assertRaises(ValueError):
+            simulate(self.roy, self.plan, 0)
+
+    def test_compile_plan(self):
+        """
+        Asserts that promotion gains are measured exactly, and that level-ups carry their growths.
+        """
+        compiled_plan = compile_plan(self.roy, self.plan)
+        level_up, promotion, _ = compiled_plan.steps
+        self.assertEqual(level_up.num_levels, 9)
+        self.assertTupleEqual(level_up.growth_rates, tuple(self.roy.growth_rates.as_dict().values()))
+        self.assertIsNone(promotion.growth_rates)
+        self.assertTupleEqual(promotion.increment, (400, 200, 300, 200, 0, 200, 500, 200, 100))
+        self.assertTupleEqual(promotion.max_stats, compiled_plan.max_stats)
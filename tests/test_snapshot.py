@@ -0,0 +1,131 @@
+"""
+Defines tests for the binary snapshot format of Morphs.
+"""
+
+import pickle
+import unittest
+from unittest.mock import patch
+
+from aenir.morph import (
+    BaseMorph,
+    get_morph,
+)
+from aenir.snapshot import (
+    SNAPSHOT_VERSION,
+    dumps,
+    loads,
+)
+from aenir._exceptions import SnapshotError
+from aenir._logging import (
+    configure_logging,
+    logger,
+    time_logger,
+)
+
+configure_logging()
+time_logger.critical("")
+
+def get_state(morph) -> dict:
+    """
+    Returns the attributes of `morph`, with Stats objects as (values, has_been_augmented) pairs.
+    """
+    def convert(value):
+        if isinstance(value, morph.Stats):
+            return (value.as_dict(), value.has_been_augmented)
+        if isinstance(value, dict):
+            return {key: convert(subvalue) for key, subvalue in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(map(convert, value))
+        return value
+
+    return {attr: convert(value) for attr, value in morph.__dict__.items()}
+
+class SnapshotTest(unittest.TestCase):
+    """
+    Demonstrates that Morphs survive a round trip through a snapshot, in whatever state they are in.
+    """
+
+    def setUp(self):
+        """
+        Declares units of every game, after a few operations.
+        """
+        logger.critical("%s", self.id())
+        lakche = get_morph(4, "Lakche", father="Lex")
+        lakche.level_up(19)
+        leaf = get_morph(5, "Leaf")
+        leaf.equip_scroll("Odo")
+        leaf.use_stat_booster("Speed Ring")
+        roy = get_morph(6, "Roy")
+        roy.promote()
+        lyn = get_morph(7, "Lyn", lyn_mode=True)
+        lyn.use_afas_drops()
+        ross = get_morph(8, "Ross")
+        ross.level_up(9)
+        ross.promote(promo_cls=ross.get_promotion_list()[0])
+        lethe = get_morph(9, "Lethe")
+        lethe.equip_band("Sword Band")
+        lethe.equip_demi_band()
+        gatrie = get_morph(9, "Gatrie")
+        gatrie.equip_knight_ward()
+        self.morphs = (lakche, leaf, roy, lyn, ross, lethe, gatrie)
+
+    def test_round_trip(self):
+        """
+        Asserts that the restored Morph has the same state, and behaves the same, as the original.
+        """
+        for morph in self.morphs:
+            with self.subTest(game=morph.game, name=morph.name):
+                restored = loads(dumps(morph))
+                self.assertIs(type(restored), type(morph))
+                self.assertDictEqual(get_state(restored), get_state(morph))
+                self.assertEqual(dumps(restored), dumps(morph))
+                if morph.current_lv < 20:
+                    morph.level_up(1)
+                    restored.level_up(1)
+                    self.assertDictEqual(restored.current_stats.as_dict(), morph.current_stats.as_dict())
+
+    def test_smaller_than_pickle(self):
+        """
+        Asserts that snapshots are smaller than pickles.
+        """
+        for morph in self.morphs:
+            with self.subTest(game=morph.game, name=morph.name):
+                self.assertLess(len(dumps(morph)), len(pickle.dumps(morph)))
+
+    def test_loads__no_queries(self):
+        """
+        Asserts that restoring a unit queries no database.
+        """
+        snapshots = [dumps(morph) for morph in self.morphs]
+        with patch.object(BaseMorph, "query_db", side_effect=AssertionError("queried")):
+            for snapshot in snapshots:
+                loads(snapshot)
+
+    def test_loads__invalid(self):
+        """
+        Asserts that data which is not a snapshot of this version is rejected.
+        """
+        snapshot = dumps(self.morphs[0])
+        cases = (
+            (b"", SnapshotError.Reason.NOT_A_SNAPSHOT),
+            (pickle.dumps(self.morphs[0]), SnapshotError.Reason.NOT_A_SNAPSHOT),
+            (snapshot[:4] + bytes([SNAPSHOT_VERSION + 1]) + snapshot[5:], SnapshotError.Reason.UNSUPPORTED_VERSION),
+            (snapshot[:-1], SnapshotError.Reason.CORRUPT),
+            (snapshot + b"\x00", SnapshotError.Reason.CORRUPT),
+            (snapshot[:5] + bytes([3]) + snapshot[6:], SnapshotError.Reason.CORRUPT),
+        )
+        for data, reason in cases:
+            with self.subTest(reason=reason):
+                with self.assertRaises(SnapshotError) as err:
+                    loads(data)
+                self.assertEqual(err.exception.reason, reason)
+
+    def test_dumps__unsupported_value(self):
+        """
+        Asserts that attributes of unknown types are rejected.
+        """
+        roy = get_morph(6, "Roy")
+        roy._meta["Stat Boosters"].append(object())
+        with self.assertRaises(SnapshotError) as err:
+            dumps(roy)
+        self.assertEqual(err.exception.reason, SnapshotError.Reason.UNSUPPORTED_VALUE)
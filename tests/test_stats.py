@@ -2,6 +2,8 @@
 Demo of how 'STAT_LIST' should be implemented to be a valid subclass of AbstractStats.
 """
 
+import copy
+import pickle
 import unittest
 import logging
 
@@ -201,6 +203,29 @@ class IntStatsTest(unittest.TestCase):
             actual_val = getattr(actual, key)
             self.assertEqual(actual_val, expected_val)
 
+    def test_setattr(self):
+        """
+        Tests that stats set as attributes are reflected in every view of the Stats object.
+        """
+        stats = self.FunctionalStats(**self.statdict1)
+        stats.c = 0
+        self.assertEqual(stats.as_dict()["c"], 0)
+        self.assertIn(("c", 0), stats.as_list())
+        self.assertEqual(sum(stats), (sum(self.statdict1.values()) - 5) * 100)
+
+    def test_add__operands_unchanged(self):
+        """
+        Tests that binary operations leave their operands intact.
+        """
+        stats1 = self.FunctionalStats(**self.statdict1)
+        stats2 = self.FunctionalStats(**self.statdict2)
+        summand = stats1 + stats2
+        summand.a = 0
+        product = stats1 * 2
+        product.b = 0
+        self.assertDictEqual(stats1.as_dict(), {stat: value * 100 for stat, value in self.statdict1.items()})
+        self.assertDictEqual(stats2.as_dict(), {stat: value * 100 for stat, value in self.statdict2.items()})
+
     def test_eq__type_mismatch(self):
         """
         Tests eq method.
@@ -493,6 +518,88 @@ class ImplementedStatsTests(unittest.TestCase):
         actual = ThraciaStats.STAT_LIST()
         self.assertTupleEqual(actual, expected)
 
+class StatsLayoutTests(unittest.TestCase):
+    """
+    Tests that the layout of each implemented Stats class is computed once and that instances are slotted.
+    """
+
+    def setUp(self):
+        """
+        Logs test-id for demarcation of log-lines in report.
+        """
+        logger.critical("%s", self.id())
+        self.stats_classes = (GenealogyStats, ThraciaStats, GBAStats, RadiantStats)
+
+    def test_no_instance_dict(self):
+        """
+        Asserts that Stats objects carry no `__dict__`.
+        """
+        for Stats in self.stats_classes:
+            stats = Stats(**Stats.get_stat_dict(1))
+            with self.subTest(Stats=Stats):
+                self.assertFalse(hasattr(stats, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    stats.not_a_stat = 0
+
+    def test_get_growable_stats(self):
+        """
+        Asserts that growable stats are those absent from `ZERO_GROWTH_STAT_LIST`.
+        """
+        for Stats in self.stats_classes:
+            expected = [stat for stat in Stats.STAT_LIST() if stat not in Stats.ZERO_GROWTH_STAT_LIST()]
+            actual = list(Stats.get_growable_stats())
+            with self.subTest(Stats=Stats):
+                self.assertListEqual(actual, expected)
+
+    def test_absolute_maxes(self):
+        """
+        Asserts that the cached absolute maxes match those declared.
+        """
+        for Stats in self.stats_classes:
+            with self.subTest(Stats=Stats):
+                self.assertTupleEqual(Stats._ABSOLUTE_MAXES, Stats.ABSOLUTE_MAXES())
+
+    def test_copy__has_been_augmented(self):
+        """
+        Asserts that the augmentation flag survives copying and pickling.
+        """
+        stats = GBAStats(**GBAStats.get_stat_dict(1))
+        self.assertIsNone(stats.has_been_augmented)
+        stats.has_been_augmented = True
+        for stats_copy in (copy.deepcopy(stats), pickle.loads(pickle.dumps(stats))):
+            self.assertIs(stats_copy.has_been_augmented, True)
+            self.assertDictEqual(stats_copy.as_dict(), stats.as_dict())
+
+    def test_from_record(self):
+        """
+        Asserts that the internal constructor matches the validated one.
+        """
+        for Stats in self.stats_classes:
+            record = {stat: index for index, stat in enumerate(Stats.STAT_LIST())}
+            record["Name"] = "Roy"
+            stat_dict = {stat: record[stat] for stat in Stats.STAT_LIST()}
+            actual = Stats._from_record(record)
+            with self.subTest(Stats=Stats):
+                self.assertIs(type(actual), Stats)
+                self.assertIsNone(actual.has_been_augmented)
+                self.assertDictEqual(actual.as_dict(), Stats(**stat_dict).as_dict())
+                self.assertDictEqual(
+                    Stats._from_record(record, multiplier=1).as_dict(),
+                    Stats(multiplier=1, **stat_dict).as_dict(),
+                )
+
+    def test_from_values__not_aliased(self):
+        """
+        Asserts that the internal constructor does not share its input with the new Stats object.
+        """
+        values = [1] * len(GBAStats.STAT_LIST())
+        stats = GBAStats._from_values(values)
+        values[0] = 2
+        self.assertEqual(stats.HP, 1)
+        stats_copy = stats.copy()
+        stats_copy.HP = 3
+        self.assertEqual(stats.HP, 1)
+
 class NonTupleStatsTest(unittest.TestCase):
     """
     Inspects behavior for Stats subclasses with non-tuple `STAT_LIST` values.